@@ -0,0 +1,120 @@
+"""Utilities for reading definitions from Python source without executing it."""
+
+import ast
+from collections import deque
+from collections.abc import Mapping
+from io import StringIO
+
+type FunctionNode = ast.FunctionDef | ast.AsyncFunctionDef
+
+
+def parse_source(source: str) -> ast.Module:
+    """Parse Python source into a syntax tree.
+
+    Args:
+        source: Complete source of a module.
+
+    Returns:
+        The module's syntax tree.
+
+    Raises:
+        SyntaxError: If the source is not valid Python.
+    """
+    return ast.parse(source)
+
+
+def function_defs(node: ast.Module | ast.ClassDef) -> list[FunctionNode]:
+    """Return the functions defined directly in a module or class body.
+
+    Nested functions, and functions defined inside conditional or other
+    compound statements, are not included. A name defined more than once,
+    such as an overloaded function or a property with a setter, is only
+    returned for its first definition.
+
+    Args:
+        node: Module or class whose body to read.
+
+    Returns:
+        Function definitions, in source order.
+    """
+    definitions: dict[str, FunctionNode] = {}
+    for statement in node.body:
+        if isinstance(statement, ast.FunctionDef | ast.AsyncFunctionDef):
+            definitions.setdefault(statement.name, statement)
+    return list(definitions.values())
+
+
+def class_defs(node: ast.Module) -> list[ast.ClassDef]:
+    """Return the classes defined directly in a module body.
+
+    Args:
+        node: Module whose body to read.
+
+    Returns:
+        Class definitions, in source order.
+    """
+    return [statement for statement in node.body if isinstance(statement, ast.ClassDef)]
+
+
+def definition_lines(tree: ast.Module) -> dict[str, int]:
+    """Return the first line of every class and function in a module, by qualified name.
+
+    Qualified names follow `__qualname__`, so a definition nested in a
+    function is listed as `outer.<locals>.inner`. A definition's first line
+    is that of its first decorator, as for `co_firstlineno`. When a name is
+    defined more than once, the first definition in source order is kept, as
+    `inspect.findsource` does.
+
+    Args:
+        tree: Syntax tree of the module.
+
+    Returns:
+        1-based first line of each definition, keyed by its qualified name.
+    """
+    lines: dict[str, int] = {}
+    # breadth-first, so same-named definitions are visited in source order
+    queue: deque[tuple[ast.AST, str]] = deque([(tree, "")])
+    while queue:
+        node, prefix = queue.popleft()
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(
+                child,
+                ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+            ):
+                queue.append((child, prefix))
+                continue
+            qualname = prefix + child.name
+            lines.setdefault(
+                qualname,
+                min(
+                    (decorator.lineno for decorator in child.decorator_list),
+                    default=child.lineno,
+                ),
+            )
+            scope = "." if isinstance(child, ast.ClassDef) else ".<locals>."
+            queue.append((child, qualname + scope))
+    return lines
+
+
+def source_with_line_insertions(source: str, insertions: Mapping[int, str]) -> str:
+    """Insert text at the end of the given lines of a source, in a single pass.
+
+    Each text is inserted at the end of its line, before the line break, so
+    text meant to start on a new line should itself start with a line break.
+    A last line without a line break stays without one.
+
+    Args:
+        source: Source to insert into.
+        insertions: Text to insert, keyed by the 1-based number of the line
+            it is appended to, as in the positions of `ast` nodes.
+
+    Returns:
+        The source with all insertions applied.
+    """
+    # unlike `str.splitlines`, only splits on the newlines that `ast` counts
+    lines = StringIO(source).readlines()
+    for line_number, text in insertions.items():
+        line = lines[line_number - 1]
+        content = line.rstrip("\r\n")
+        lines[line_number - 1] = content + text + line[len(content) :]
+    return "".join(lines)
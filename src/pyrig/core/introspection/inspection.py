@@ -2,6 +2,8 @@
 
 import inspect
 from collections.abc import Callable, Iterable
+from functools import cache
+from pathlib import Path
 from types import (
     CodeType,
     FrameType,
@@ -13,6 +15,9 @@
 
 from pyrig_runtime.core.introspection.inspection import unwrap_obj
 
+from pyrig.core.introspection.definitions import definition_lines, parse_source
+from pyrig.core.strings import read_text_utf8
+
 type SourceObjectType = (
     ModuleType | type[Any] | Callable[..., Any] | TracebackType | FrameType | CodeType
 )
@@ -53,6 +58,10 @@ def def_line_sorted[
 ) -> list[T]:
     """Sort objects by their source definition line number.
 
+    Classes are looked up in a line index of their source file that is built
+    once per file, so sorting many classes of a module does not scan its
+    source once per class.
+
     Args:
         objs: Modules, classes, functions or methods, tracebacks, frames, or
             code objects to sort.
@@ -76,7 +85,9 @@ def def_line(
     Accepts a module, class, function, method, traceback, frame, or code
     object. Properties, classmethods, staticmethods, and other decorated
     callables are unwrapped first, so the underlying function's line is
-    returned rather than the wrapper's line.
+    returned rather than the wrapper's line. Classes are looked up in
+    `file_definition_lines()` of their source file, falling back to
+    `inspect.findsource` for classes it does not list.
 
     Args:
         obj: Object whose definition line to locate.
@@ -94,4 +105,48 @@ def def_line(
     code = getattr(unwrapped, "__code__", None)
     if code is not None:
         return code.co_firstlineno
+    if isinstance(unwrapped, type):
+        file = inspect.getsourcefile(unwrapped)
+        line = file_definition_lines(file).get(unwrapped.__qualname__) if file else None
+        if line is not None:
+            return line
     return inspect.findsource(unwrapped)[1] + 1
+
+
+def file_definition_lines(file: str) -> dict[str, int]:
+    """Return the first line of every class and function defined in a source file.
+
+    The index is built once per version of the file: it is rebuilt only when
+    the file's modification time or size changes.
+
+    Args:
+        file: Path of the Python source file.
+
+    Returns:
+        1-based first line of each definition, keyed by its qualified name,
+        as returned by `definition_lines`. Empty if the file cannot be read.
+    """
+    try:
+        stat = Path(file).stat()
+    except OSError:
+        return {}
+    return stamped_file_definition_lines(file, stat.st_mtime_ns, stat.st_size)
+
+
+@cache
+def stamped_file_definition_lines(
+    file: str,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> dict[str, int]:
+    """Return the definition lines of a source file, cached per file version.
+
+    Args:
+        file: Path of the Python source file.
+        mtime_ns: Modification time of the file. Only keys the cache.
+        size: Size of the file in bytes. Only keys the cache.
+
+    Returns:
+        The file's definition lines, as returned by `definition_lines`.
+    """
+    return definition_lines(parse_source(read_text_utf8(Path(file))))
@@ -136,3 +136,32 @@ def import_module_from_file(path: Path, name: str) -> ModuleType:
         del sys.modules[name]
         raise
     return module
+
+
+def unexecuted_module(path: Path, name: str) -> ModuleType:
+    """Return a module for a `.py` file, without executing the file.
+
+    An already imported module is returned as-is. Otherwise a new module
+    object is created with its name, `__file__`, and spec set, but none of
+    its code run, and it is not registered in `sys.modules`. Use it where
+    only the module's identity and source file are needed.
+
+    Args:
+        path: Path to the module's source file.
+        name: Dotted name of the module.
+
+    Returns:
+        The imported module, or an empty module object for the file.
+
+    Raises:
+        ImportError: If the module spec cannot be created.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    loader = SourceFileLoader(name, str(path.resolve()))
+    spec = spec_from_loader(name=name, loader=loader)
+    if spec is None:
+        msg = f"could not create spec for {path}"
+        raise ImportError(msg)
+    return module_from_spec(spec)
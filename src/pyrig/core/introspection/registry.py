@@ -0,0 +1,232 @@
+"""Persisted registry of the modules that define discoverable subclasses.
+
+Cross-package subclass discovery imports every module within the discovery
+scope of each installed package, on every run. The registry records which of
+those modules actually define subclasses of a given class, keyed by a
+fingerprint of the scope's installed versions and source files, so later
+runs import only those modules while nothing in the scope has changed.
+"""
+
+import hashlib
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from types import ModuleType
+
+from pyrig_runtime.core.dependencies.discovery import (
+    equivalent_modules_across_dependencies,
+    subclasses_across_dependencies,
+)
+from pyrig_runtime.core.introspection.classes import discover_subclasses
+from pyrig_runtime.core.introspection.modules import (
+    replace_root_module_name,
+    root_module_name,
+    safe_import_module,
+)
+from pyrig_runtime.core.introspection.packages import is_package
+from pyrig_runtime.core.strings import fully_qualified_name
+
+from pyrig.core.introspection.paths import module_file_path, package_dir_path
+from pyrig.core.strings import read_text_utf8, write_text_utf8
+
+
+def registered_subclasses[T](
+    cls: type[T],
+    module: ModuleType,
+    *,
+    registry_dir: Path,
+) -> Iterator[type[T]]:
+    """Get subclasses of `cls` within `module`'s scope, importing only what is needed.
+
+    Returns the same subclasses as `subclasses_across_dependencies`. When the
+    registry entry for `cls` and `module` matches the current fingerprint of
+    the scope, only the modules it lists are imported. Otherwise the whole
+    scope is imported and the entry is rewritten.
+
+    Args:
+        cls: Base class whose subclasses should be discovered.
+        module: Module or package that scopes the search.
+        registry_dir: Directory the registry entries are persisted in.
+
+    Returns:
+        Iterator over the subclass types of `cls` found anywhere in the search scope.
+    """
+    path = registry_dir / f"{registry_key(cls, module)}.json"
+    fingerprint = scope_fingerprint(module)
+    module_names = load_registry(path, fingerprint=fingerprint)
+    if module_names is not None and all(
+        safe_import_module(name, default=None) is not None for name in module_names
+    ):
+        return scoped_subclasses(cls, module)
+
+    subclasses = tuple(subclasses_across_dependencies(cls, module=module))
+    store_registry(
+        path,
+        fingerprint=fingerprint,
+        module_names=subclass_module_names(subclasses),
+    )
+    return iter(subclasses)
+
+
+def scoped_subclasses[T](cls: type[T], module: ModuleType) -> Iterator[type[T]]:
+    """Yield the already-imported subclasses of `cls` within `module`'s scope.
+
+    Applies the same scope filter as `subclasses_across_dependencies`, but
+    imports nothing.
+
+    Args:
+        cls: Base class whose subclasses should be found.
+        module: Module or package that scopes the search.
+
+    Yields:
+        Loaded subclass types of `cls` defined at `module`'s sub-path in any
+        root package.
+    """
+    module_name = module.__name__
+    root_name = root_module_name(module_name)
+    for subclass in discover_subclasses(cls):
+        if replace_root_module_name(subclass.__module__, root_name).startswith(
+            module_name,
+        ):
+            yield subclass
+
+
+@cache
+def scope_fingerprint(module: ModuleType) -> str:
+    """Return a fingerprint of the installed versions and sources of a scope.
+
+    The scope is `module` plus its equivalent module in every dependent
+    package. The result is cached per module, matching the once-per-process
+    import of each discovery scope.
+
+    Args:
+        module: Module or package that scopes discovery.
+
+    Returns:
+        Hex SHA-256 digest of each scope module's distribution version and of
+        the path, size, and modification time of every source file within it.
+    """
+    material = [
+        (
+            scope_module.__name__,
+            distribution_version(scope_module),
+            [
+                (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+                for path in scope_files(scope_module)
+                for stat in (path.stat(),)
+            ],
+        )
+        for scope_module in (
+            module,
+            *equivalent_modules_across_dependencies(module),
+        )
+    ]
+    return hashlib.sha256(json.dumps(material).encode()).hexdigest()
+
+
+def scope_files(module: ModuleType) -> list[Path]:
+    """Return the source files of a module, or of a whole package hierarchy.
+
+    Args:
+        module: Module or package to list the source files of.
+
+    Returns:
+        The module's file, or every `.py` file under the package directory,
+        sorted.
+    """
+    if is_package(module):
+        return sorted(package_dir_path(module).rglob("*.py"))
+    return [module_file_path(module)]
+
+
+def distribution_version(module: ModuleType) -> str | None:
+    """Return the installed version of the distribution providing a module.
+
+    Args:
+        module: Module whose root package names the distribution.
+
+    Returns:
+        The distribution's version, or None if it is not installed.
+    """
+    try:
+        return version(root_module_name(module.__name__))
+    except PackageNotFoundError:
+        return None
+
+
+def registry_key(cls: type, module: ModuleType) -> str:
+    """Return the key the registry entry for a class and scope is stored under.
+
+    Args:
+        cls: Base class being discovered.
+        module: Module or package that scopes the search.
+
+    Returns:
+        Hex SHA-256 digest of the class's qualified name and the scope's name.
+    """
+    material = f"{fully_qualified_name(cls)}:{module.__name__}"
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def subclass_module_names(subclasses: Iterable[type]) -> list[str]:
+    """Return the importable modules defining the given classes, in import order.
+
+    Importing the modules in the returned order recreates the classes in the
+    order the full discovery created them. Classes generated at runtime,
+    whose module is not importable from a file, are skipped.
+
+    Args:
+        subclasses: Discovered classes.
+
+    Returns:
+        Unique module names, ordered by their position in `sys.modules`.
+    """
+    import_order = {name: index for index, name in enumerate(sys.modules)}
+    names = {
+        subclass.__module__
+        for subclass in subclasses
+        if getattr(sys.modules.get(subclass.__module__), "__file__", None)
+    }
+    return sorted(names, key=import_order.__getitem__)
+
+
+def load_registry(path: Path, *, fingerprint: str) -> list[str] | None:
+    """Load the module names of a registry entry, if it is still current.
+
+    Args:
+        path: File written by `store_registry`.
+        fingerprint: The current fingerprint of the discovery scope.
+
+    Returns:
+        The recorded module names, or None if the file is missing,
+        unreadable, not a registry entry, or was recorded for a different
+        fingerprint.
+    """
+    try:
+        data = json.loads(read_text_utf8(path))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    module_names = data.get("modules")
+    if not isinstance(module_names, list) or not all(
+        isinstance(name, str) for name in module_names
+    ):
+        return None
+    return module_names
+
+
+def store_registry(path: Path, *, fingerprint: str, module_names: list[str]) -> None:
+    """Persist the module names of a registry entry.
+
+    Args:
+        path: File to write the entry to, as JSON.
+        fingerprint: The fingerprint of the discovery scope they were found in.
+        module_names: The modules defining the discovered subclasses.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"fingerprint": fingerprint, "modules": module_names}
+    write_text_utf8(path, json.dumps(data))
@@ -1,6 +1,7 @@
 """Utilities for iterables and nested data structures."""
 
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from itertools import chain
 from typing import Any, cast, overload
 
@@ -89,12 +90,14 @@ def merge_nested_structures(subset: Any, superset: Any) -> Any:
         are lists, and otherwise inserted at that index.
     """
     if both_dicts(subset, superset):
+        insertions: list[tuple[int, Any, Any]] = []
         for index, (key, sup_val) in enumerate(superset.items()):
             sub_val = subset.get(key, MISSING)
             if both_dicts_or_lists(sub_val, sup_val):
                 merge_nested_structures(sub_val, sup_val)
             elif sub_val is MISSING:
-                dict_insert(subset, index=index, key=key, value=sup_val)
+                insertions.append((index, key, sup_val))
+        dict_insert_many(subset, insertions)
 
     elif both_lists(subset, superset):
         matched = match_list_items(superset, subset)
@@ -136,11 +139,48 @@ def dict_insert[K, V](
         >>> d
         {'a': 1, 'c': 3, 'b': 2}
     """
-    dict_.pop(key, None)
-    items = list(dict_.items())
-    items.insert(index, (key, value))
-    dict_.clear()
-    dict_.update(items)
+    dict_insert_many(dict_, ((index, key, value),))
+
+
+def dict_insert_many[K, V](
+    dict_: dict[K, V],
+    insertions: Iterable[tuple[int, K, V]],
+) -> None:
+    """Apply several `dict_insert` calls, rebuilding the dict at most once.
+
+    Equivalent to calling `dict_insert(dict_, index=index, key=key,
+    value=value)` for each `(index, key, value)` in order, so each index
+    refers to the dict as left by the insertions before it. Insertions at or
+    past the end are applied in place; the dict is only rebuilt, once at the
+    end, if any insertion lands before the end.
+
+    Args:
+        dict_: The dict to modify.
+        insertions: `(index, key, value)` triples, applied in order.
+
+    Examples:
+        >>> d = {"a": 1, "b": 2}
+        >>> dict_insert_many(d, [(0, "c", 3), (2, "d", 4), (9, "e", 5)])
+        >>> d
+        {'c': 3, 'a': 1, 'd': 4, 'b': 2, 'e': 5}
+    """
+    items: list[tuple[K, V]] | None = None
+    inserted: set[K] = set()
+    for index, key, value in insertions:
+        if items is None:
+            dict_.pop(key, None)
+            if index >= len(dict_):
+                dict_[key] = value
+                continue
+            items = list(dict_.items())
+        elif key in dict_ or key in inserted:
+            items = [item for item in items if item[0] != key]
+        inserted.add(key)
+        items.insert(index, (key, value))
+
+    if items is not None:
+        dict_.clear()
+        dict_.update(items)
 
 
 @overload
@@ -195,6 +235,79 @@ def nested_structure_is_subset(subset: Any, superset: Any) -> bool:
     return subset == superset
 
 
+@overload
+def nested_structure_missing_paths(
+    subset: dict[Any, Any],
+    superset: dict[Any, Any],
+    path: str = "",
+) -> list[str]: ...
+@overload
+def nested_structure_missing_paths(
+    subset: list[Any],
+    superset: list[Any],
+    path: str = "",
+) -> list[str]: ...
+@overload
+def nested_structure_missing_paths[T](
+    subset: T,
+    superset: T,
+    path: str = "",
+) -> list[str]: ...
+def nested_structure_missing_paths(
+    subset: Any,
+    superset: Any,
+    path: str = "",
+) -> list[str]:
+    """List every place where `subset` is not contained within `superset`.
+
+    Uses the same semantics as `nested_structure_is_subset`, which returns
+    `True` exactly when this returns an empty list, but reports each missing
+    part in a single traversal instead of stopping at the first. Dict keys
+    are joined with dots and list items are written as their index in
+    `subset`, e.g. `"tool.pytest.ini_options.addopts[3]"`. A dict key or list
+    item that is missing or unmatched is reported as a whole, without
+    descending into it.
+
+    Args:
+        subset: The expected (required) structure.
+        superset: The actual structure to check.
+        path: The path of `subset` itself, prefixed to every reported path.
+            Empty for the root.
+
+    Returns:
+        The paths of the missing parts of `subset`, in `subset` order. The
+        root path, `path` itself, if the two values differ entirely.
+
+    Examples:
+        >>> nested_structure_missing_paths({"a": {"b": 1, "c": 2}}, {"a": {"b": 1}})
+        ['a.c']
+        >>> nested_structure_missing_paths({"a": [1, 2, 3]}, {"a": [3, 1]})
+        ['a[1]']
+        >>> nested_structure_missing_paths({"a": 1}, {"a": 1, "b": 2})
+        []
+        >>> nested_structure_missing_paths(1, 2)
+        ['']
+    """
+    if both_dicts(subset, superset):
+        missing: list[str] = []
+        for key, value in subset.items():
+            key_path = f"{path}.{key}" if path else str(key)
+            if key in superset:
+                missing.extend(
+                    nested_structure_missing_paths(value, superset[key], key_path),
+                )
+            else:
+                missing.append(key_path)
+        return missing
+    if both_lists(subset, superset):
+        return [
+            f"{path}[{index}]"
+            for index, matched in enumerate(match_list_items(subset, superset))
+            if not matched
+        ]
+    return [] if subset == superset else [path]
+
+
 def match_list_items(subset: list[Any], superset: list[Any]) -> list[bool]:
     """Check whether each `subset` item is satisfied by a distinct `superset` item.
 
@@ -204,6 +317,10 @@ def match_list_items(subset: list[Any], superset: list[Any]) -> list[bool]:
     times in `subset` requires that many distinct matches in `superset`
     rather than being satisfied by a single occurrence.
 
+    Hashable leaves (see `is_hashable_leaf`) can only satisfy each other, by
+    equality, so they are counted by value and matched in constant time.
+    Only the remaining items, dicts and lists, are compared one by one.
+
     Args:
         subset: Items to find matches for.
         superset: Items to match against. Not modified.
@@ -218,9 +335,22 @@ def match_list_items(subset: list[Any], superset: list[Any]) -> list[bool]:
         >>> match_list_items(["", "a", ""], ["", "z"])
         [True, False, False]
     """
-    pool = list(superset)
+    counts: Counter[Any] = Counter()
+    pool: list[Any] = []
+    for item in superset:
+        if is_hashable_leaf(item):
+            counts[item] += 1
+        else:
+            pool.append(item)
+
     matched: list[bool] = []
     for sub_val in subset:
+        if is_hashable_leaf(sub_val):
+            found = counts[sub_val] > 0
+            if found:
+                counts[sub_val] -= 1
+            matched.append(found)
+            continue
         for index, other in enumerate(pool):
             if nested_structure_is_subset(sub_val, other):
                 del pool[index]
@@ -231,6 +361,26 @@ def match_list_items(subset: list[Any], superset: list[Any]) -> list[bool]:
     return matched
 
 
+def is_hashable_leaf(value: object) -> bool:
+    """Return whether `value` is neither a dict nor a list, and is hashable.
+
+    Examples:
+        >>> is_hashable_leaf("a")
+        True
+        >>> is_hashable_leaf({"a": 1})
+        False
+        >>> is_hashable_leaf({"a"})
+        False
+    """
+    if isinstance(value, (dict, list)):
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 def both_dicts_or_lists(a: object, b: object) -> bool:
     """Return whether `a` and `b` are both dicts or both lists."""
     return both_dicts(a, b) or both_lists(a, b)
@@ -1,9 +1,11 @@
 """Utilities for working with strings and text files."""
 
 import re
+import shutil
 from collections.abc import Iterator
 from pathlib import Path
 from typing import IO, Any
+from uuid import uuid4
 
 UTF_8_ENCODING = "utf-8"
 
@@ -50,6 +52,33 @@ def write_text_utf8(path: Path, content: str) -> int:
     return path.write_text(content, encoding=UTF_8_ENCODING, newline="\n")
 
 
+def replace_text_utf8(path: Path, content: str) -> None:
+    r"""Atomically replace the content of `path` with `content` as UTF-8.
+
+    Writes to a temporary file next to `path` and then renames it over
+    `path`, so other processes see either the old or the new content, never
+    a partially written file. An existing file keeps its permission bits,
+    and a symlink is written through to its target. Like `write_text_utf8`,
+    `\n` characters are written as-is.
+
+    Args:
+        path: File to create or replace.
+        content: Text to write.
+    """
+    if path.is_symlink():
+        path = path.resolve()
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with temp_path.open(mode="xb") as f:
+            f.write(content.encode(UTF_8_ENCODING))
+        if path.exists():
+            shutil.copymode(path, temp_path)
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
 def fstring_var_name(fstring: str) -> str:
     """Extract the text preceding `=` in a debug f-string's `name=value` output."""
     return fstring.split("=", maxsplit=1)[0].strip()
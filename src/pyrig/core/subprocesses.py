@@ -1,11 +1,21 @@
 """Utilities for working with subprocesses."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
 import subprocess  # nosec: B404
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from pathlib import Path
 from typing import Any, Self
 
+from pyrig.core.strings import read_text_utf8, write_text_utf8
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,6 +83,131 @@ def run_cached(
         """
         return run_subprocess_cached(*self, *args, check=check)
 
+    def run_persisted(
+        self,
+        *args: str,
+        check: bool = True,
+        cache_dir: Path,
+        invalidators: Iterable[Path] = (),
+        ttl: float = 3600,
+        max_entries: int = 256,
+    ) -> subprocess.CompletedProcess[Any]:
+        """Execute the command, reusing a result persisted by an earlier process.
+
+        See `run_subprocess_persisted` for when a persisted result is reused.
+
+        Args:
+            *args: Additional command-line arguments appended to the command.
+            check: Whether to raise an exception on non-zero exit. Defaults
+                to `True`.
+            cache_dir: Directory the results are persisted in.
+            invalidators: Files whose modification invalidates the result.
+            ttl: Maximum age of a reused result, in seconds.
+            max_entries: Maximum number of results kept in `cache_dir`.
+
+        Returns:
+            The completed process result.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is `True` and the
+                command exits with a non-zero return code.
+        """
+        return run_subprocess_persisted(
+            *self,
+            *args,
+            check=check,
+            cache_dir=cache_dir,
+            invalidators=invalidators,
+            ttl=ttl,
+            max_entries=max_entries,
+        )
+
+    def stream(
+        self,
+        *args: str,
+        check: bool = True,
+        tail_lines: int = 200,
+    ) -> Generator[str, None, subprocess.CompletedProcess[str]]:
+        """Execute the command, yielding its output lines as they are written.
+
+        See `stream_subprocess` for how output and failures are handled.
+
+        Args:
+            *args: Additional command-line arguments appended to the command.
+            check: Whether to raise an exception on non-zero exit. Defaults
+                to `True`.
+            tail_lines: Number of trailing output lines kept for the result.
+
+        Yields:
+            Each line of combined stdout and stderr, including its newline.
+
+        Returns:
+            The completed process, with the output tail as `stdout`.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is `True` and the
+                command exits with a non-zero return code.
+        """
+        return stream_subprocess(*self, *args, check=check, tail_lines=tail_lines)
+
+    def run_streaming(
+        self,
+        *args: str,
+        check: bool = True,
+        on_line: Callable[[str], object],
+        tail_lines: int = 200,
+    ) -> subprocess.CompletedProcess[str]:
+        """Execute the command, passing each output line to a callback.
+
+        Args:
+            *args: Additional command-line arguments appended to the command.
+            check: Whether to raise an exception on non-zero exit. Defaults
+                to `True`.
+            on_line: Called with each line of output as it is written.
+            tail_lines: Number of trailing output lines kept for the result.
+
+        Returns:
+            The completed process, with the output tail as `stdout`.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is `True` and the
+                command exits with a non-zero return code.
+        """
+        return run_subprocess_streaming(
+            *self,
+            *args,
+            check=check,
+            on_line=on_line,
+            tail_lines=tail_lines,
+        )
+
+    @classmethod
+    def run_many(
+        cls,
+        args_list: Iterable[tuple[str, ...]],
+        *,
+        check: bool = True,
+        max_workers: int | None = None,
+    ) -> list[subprocess.CompletedProcess[Any]]:
+        """Execute several commands concurrently.
+
+        See `run_subprocesses` for the ordering and failure semantics.
+
+        Args:
+            args_list: The commands to run, each a sequence of tokens.
+            check: Whether to raise an exception on non-zero exit. Defaults
+                to `True`.
+            max_workers: Maximum number of commands running at once.
+
+        Returns:
+            The completed process results, in the order of `args_list`.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is `True` and any
+                command exits with a non-zero return code.
+        """
+        return run_subprocesses(args_list, check=check, max_workers=max_workers)
+
     def multiline(self) -> str:
         r"""Return the command as a backslash-continued, multiline string.
 
@@ -133,6 +268,354 @@ def run_subprocess_cached(
     return run_subprocess(*args, check=check)
 
 
+def run_subprocess_persisted(
+    *args: str,
+    check: bool = True,
+    cache_dir: Path,
+    invalidators: Iterable[Path] = (),
+    ttl: float = 3600,
+    max_entries: int = 256,
+) -> subprocess.CompletedProcess[str]:
+    """Execute a subprocess command, persisting the result across processes.
+
+    The result is stored as a JSON file in `cache_dir` and reused by any
+    later call, in this or another process, with the same arguments, working
+    directory, and invalidator files, for at most `ttl` seconds. Each reuse
+    refreshes the file's modification time, and only the `max_entries` most
+    recently used results are kept.
+
+    Args:
+        *args: Command and arguments (e.g., `"git"`, `"status"`).
+        check: Whether to raise an exception on non-zero exit. Defaults to
+            `True`.
+        cache_dir: Directory the results are persisted in.
+        invalidators: Files the command's output depends on. Modifying,
+            creating, or deleting any of them invalidates the result.
+        ttl: Maximum age of a reused result, in seconds.
+        max_entries: Maximum number of results kept in `cache_dir`.
+
+    Returns:
+        The completed process result.
+
+    Raises:
+        subprocess.CalledProcessError: If `check` is `True` and the command
+            exits with a non-zero return code.
+
+    Note:
+        A call that raises is not persisted, so a failing command re-runs on
+        the next identical call.
+    """
+    key = persisted_run_key(*args, check=check, invalidators=invalidators)
+    path = cache_dir / f"{key}.json"
+    result = load_persisted_run(path, ttl=ttl)
+    if result is None:
+        result = run_subprocess(*args, check=check)
+        store_persisted_run(path, result, max_entries=max_entries)
+    return result
+
+
+def persisted_run_key(
+    *args: str,
+    check: bool,
+    invalidators: Iterable[Path],
+) -> str:
+    """Return the key a persisted subprocess result is stored under.
+
+    Args:
+        *args: Command and arguments.
+        check: Whether the command is run with `check`.
+        invalidators: Files whose size and modification time are part of the
+            key.
+
+    Returns:
+        Hex SHA-256 digest of the arguments, the current working directory,
+        and the size and modification time of each invalidator file.
+    """
+    stamps = []
+    for path in invalidators:
+        stat = path.stat() if path.exists() else None
+        stamps.append(
+            (path.as_posix(), stat and stat.st_mtime_ns, stat and stat.st_size),
+        )
+    material = json.dumps([args, check, Path.cwd().as_posix(), stamps])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def load_persisted_run(
+    path: Path,
+    *,
+    ttl: float,
+) -> subprocess.CompletedProcess[str] | None:
+    """Load a persisted subprocess result, if it exists and has not expired.
+
+    Refreshes the file's modification time, marking it as recently used.
+
+    Args:
+        path: File written by `store_persisted_run`.
+        ttl: Maximum age of the result, in seconds.
+
+    Returns:
+        The persisted result, or None if the file is missing, unreadable, not
+        a persisted result, or older than `ttl`.
+    """
+    try:
+        data = json.loads(read_text_utf8(path))
+        if time.time() - data["created"] > ttl:
+            return None
+        result = subprocess.CompletedProcess(
+            args=tuple(data["args"]),
+            returncode=data["returncode"],
+            stdout=data["stdout"],
+            stderr=data["stderr"],
+        )
+        os.utime(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return result
+
+
+def store_persisted_run(
+    path: Path,
+    result: subprocess.CompletedProcess[str],
+    *,
+    max_entries: int,
+) -> None:
+    """Persist a subprocess result, evicting the least recently used ones.
+
+    Args:
+        path: File to write the result to, as JSON.
+        result: The completed process to persist.
+        max_entries: Maximum number of results kept in `path`'s directory.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "args": list(result.args),
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "created": time.time(),
+    }
+    write_text_utf8(path, json.dumps(data))
+    mtimes: dict[Path, int] = {}
+    for entry in path.parent.glob("*.json"):
+        # another thread or process may evict an entry while we list them
+        try:
+            mtimes[entry] = entry.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+    entries = sorted(mtimes, key=mtimes.__getitem__)
+    for entry in entries[:-max_entries]:
+        entry.unlink(missing_ok=True)
+
+
+def run_subprocesses(
+    args_list: Iterable[tuple[str, ...]],
+    *,
+    check: bool = True,
+    max_workers: int | None = None,
+) -> list[subprocess.CompletedProcess[str]]:
+    """Execute several subprocess commands concurrently on a thread pool.
+
+    Each command runs through `run_subprocess`, so every failure is logged
+    the same way as a single call. Only use this for commands that do not
+    depend on each other's side effects.
+
+    Args:
+        args_list: The commands to run, each a sequence of tokens.
+        check: Whether to raise an exception on non-zero exit. Defaults to
+            `True`.
+        max_workers: Maximum number of commands running at once. Defaults to
+            `None`, letting `ThreadPoolExecutor` pick its default.
+
+    Returns:
+        The completed process results, in the order of `args_list`.
+
+    Raises:
+        subprocess.CalledProcessError: If `check` is `True` and any command
+            exits with a non-zero return code. The error of the first failing
+            command in input order is raised once all commands have finished.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_subprocess, *args, check=check) for args in args_list
+        ]
+    return [future.result() for future in futures]
+
+
+async def run_subprocesses_async(
+    args_list: Iterable[tuple[str, ...]],
+    *,
+    check: bool = True,
+    max_workers: int | None = None,
+) -> list[subprocess.CompletedProcess[str]]:
+    """Execute several subprocess commands concurrently on the event loop.
+
+    The asyncio counterpart of `run_subprocesses`, for callers that already
+    run inside an event loop.
+
+    Args:
+        args_list: The commands to run, each a sequence of tokens.
+        check: Whether to raise an exception on non-zero exit. Defaults to
+            `True`.
+        max_workers: Maximum number of commands running at once. Defaults to
+            `None`, running all of them at once.
+
+    Returns:
+        The completed process results, in the order of `args_list`.
+
+    Raises:
+        subprocess.CalledProcessError: If `check` is `True` and any command
+            exits with a non-zero return code. The error of the first failing
+            command in input order is raised once all commands have finished.
+    """
+    args_list = list(args_list)
+    semaphore = asyncio.Semaphore(max_workers or len(args_list) or 1)
+
+    async def run(args: tuple[str, ...]) -> subprocess.CompletedProcess[str]:
+        async with semaphore:
+            return await run_subprocess_async(*args, check=check)
+
+    results = await asyncio.gather(
+        *(run(args) for args in args_list),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return [result for result in results if not isinstance(result, BaseException)]
+
+
+async def run_subprocess_async(
+    *args: str,
+    check: bool = True,
+) -> subprocess.CompletedProcess[str]:
+    """Execute a subprocess command without blocking the event loop.
+
+    Behaves like `run_subprocess`: no shell, the current working directory,
+    captured and decoded stdout and stderr, and failures logged.
+
+    Args:
+        *args: Command and arguments (e.g., `"git"`, `"status"`).
+        check: When `True` (the default), raise `subprocess.CalledProcessError`
+            on a non-zero exit.
+
+    Returns:
+        The completed process, with `stdout` and `stderr` as decoded strings.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+            return code and `check` is `True`.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=Path(),
+    )
+    stdout, stderr = await process.communicate()
+    result = subprocess.CompletedProcess(
+        args=args,
+        returncode=process.returncode or 0,
+        stdout=stdout.decode(),
+        stderr=stderr.decode(),
+    )
+    try:
+        result.check_returncode()
+    except subprocess.CalledProcessError as e:
+        if check:
+            log_subprocess_error(e)
+            raise
+    return result
+
+
+def stream_subprocess(
+    *args: str,
+    check: bool = True,
+    tail_lines: int = 200,
+) -> Generator[str, None, subprocess.CompletedProcess[str]]:
+    """Execute a subprocess command, yielding its output lines as they arrive.
+
+    Unlike `run_subprocess`, the output is never buffered as a whole: stderr
+    is merged into stdout, each line is yielded as soon as the command writes
+    it, and only the last `tail_lines` lines are kept for the result and the
+    failure log.
+
+    Args:
+        *args: Command and arguments (e.g., `"uv"`, `"sync"`).
+        check: When `True` (the default), raise `subprocess.CalledProcessError`
+            on a non-zero exit.
+        tail_lines: Number of trailing output lines kept.
+
+    Yields:
+        Each line of combined stdout and stderr, including its newline.
+
+    Returns:
+        The completed process, with the output tail as `stdout` and `stderr`
+        set to `None`. It is the value of the `StopIteration` ending the
+        generator, and of a `yield from` over it.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+            return code and `check` is `True`. Its `output` is the output tail.
+    """
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with subprocess.Popen(  # noqa: S603  # nosec: B603
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        cwd=Path(),
+        shell=False,
+        text=True,
+    ) as process:
+        for line in process.stdout or ():
+            tail.append(line)
+            yield line
+    result = subprocess.CompletedProcess(
+        args=args,
+        returncode=process.returncode,
+        stdout="".join(tail),
+    )
+    try:
+        result.check_returncode()
+    except subprocess.CalledProcessError as e:
+        if check:
+            log_subprocess_error(e)
+            raise
+    return result
+
+
+def run_subprocess_streaming(
+    *args: str,
+    check: bool = True,
+    on_line: Callable[[str], object],
+    tail_lines: int = 200,
+) -> subprocess.CompletedProcess[str]:
+    """Execute a subprocess command, passing each output line to a callback.
+
+    The callback form of `stream_subprocess`.
+
+    Args:
+        *args: Command and arguments (e.g., `"uv"`, `"sync"`).
+        check: When `True` (the default), raise `subprocess.CalledProcessError`
+            on a non-zero exit.
+        on_line: Called with each line of output as it is written.
+        tail_lines: Number of trailing output lines kept.
+
+    Returns:
+        The completed process, with the output tail as `stdout`.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+            return code and `check` is `True`.
+    """
+    lines = stream_subprocess(*args, check=check, tail_lines=tail_lines)
+    while True:
+        try:
+            on_line(next(lines))
+        except StopIteration as stop:
+            return stop.value
+
+
 def run_subprocess(
     *args: str,
     check: bool = True,
@@ -168,11 +651,21 @@ def run_subprocess(
             text=True,
         )
     except subprocess.CalledProcessError as e:
-        logger.exception(
-            "Subprocess command failed: %s\nReturn code: %s\nStdout: %s\nStderr: %s",
-            e.cmd,
-            e.returncode,
-            e.stdout,
-            e.stderr,
-        )
+        log_subprocess_error(e)
         raise
+
+
+def log_subprocess_error(error: subprocess.CalledProcessError) -> None:
+    """Log a failed subprocess with its command, return code, and output.
+
+    Args:
+        error: The error raised for the failed command.
+    """
+    logger.error(
+        "Subprocess command failed: %s\nReturn code: %s\nStdout: %s\nStderr: %s",
+        error.cmd,
+        error.returncode,
+        error.stdout,
+        error.stderr,
+        exc_info=error,
+    )
@@ -0,0 +1,213 @@
+"""Splitting of the test suite across CI runners by recorded test durations."""
+
+import json
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from statistics import fmean
+from xml.etree import ElementTree as ET
+
+import typer
+
+from pyrig.core.strings import read_text_utf8, write_text_utf8
+from pyrig.rig.tools.testing.project import ProjectTester
+
+
+def print_shard_files(index: int, count: int) -> None:
+    """Print the test files of one shard of the test suite.
+
+    The files are printed on a single line, separated by spaces and without
+    a trailing line break, so shell command substitution yields exactly the
+    file arguments on every platform.
+
+    Args:
+        index: 1-based index of the shard.
+        count: Number of shards the suite is split into.
+    """
+    files = (path.as_posix() for path in shard_files(index, count))
+    typer.echo(" ".join(files), nl=False)
+
+
+def shard_files(index: int, count: int) -> list[Path]:
+    """Return the test files of one shard of the test suite.
+
+    Every call with the same `count`, test files, and recorded durations
+    splits the suite identically, so each runner can compute its own shard.
+
+    Args:
+        index: 1-based index of the shard.
+        count: Number of shards the suite is split into.
+
+    Returns:
+        The shard's test files, sorted.
+    """
+    durations = load_durations(ProjectTester.I.durations_path())
+    return balanced_shards(suite_files(), durations, count=count)[index - 1]
+
+
+def print_quick_files() -> None:
+    """Print the quickest test files of the test suite.
+
+    Printed like `print_shard_files`. Prints nothing if no durations are
+    recorded, so pytest then runs the whole suite.
+    """
+    files = (path.as_posix() for path in quick_files())
+    typer.echo(" ".join(files), nl=False)
+
+
+def quick_files() -> list[Path]:
+    """Return the quickest test files that fit into the quick test budget.
+
+    Adds files in order of their recorded duration, starting with the
+    quickest, until their total duration reaches
+    `ProjectTester.quick_tests_seconds()`. Files without a recorded duration
+    are assumed to take the mean recorded duration.
+
+    Returns:
+        The quickest test files, sorted. Empty if no durations are
+        recorded.
+    """
+    durations = load_durations(ProjectTester.I.durations_path())
+    if not durations:
+        return []
+    default = fmean(durations.values())
+    timed = sorted(
+        (durations.get(path.as_posix(), default), path) for path in suite_files()
+    )
+    budget = ProjectTester.I.quick_tests_seconds()
+    files: list[Path] = []
+    total = 0.0
+    for duration, path in timed:
+        if files and total + duration > budget:
+            break
+        files.append(path)
+        total += duration
+    return sorted(files)
+
+
+def print_timeout_minutes(count: int) -> None:
+    """Print the timeout of a CI job running one shard of the test suite.
+
+    Args:
+        count: Number of shards the suite is split into.
+    """
+    typer.echo(timeout_minutes(count))
+
+
+def timeout_minutes(count: int) -> int:
+    """Return the timeout of a CI job running one shard of the test suite.
+
+    Args:
+        count: Number of shards the suite is split into.
+
+    Returns:
+        `ProjectTester.timeout_minutes()` for a shard's share of the total
+        recorded duration, or 360, GitHub's default job timeout, if no
+        durations are recorded.
+    """
+    durations = load_durations(ProjectTester.I.durations_path())
+    if not durations:
+        return 360
+    return ProjectTester.I.timeout_minutes(math.fsum(durations.values()) / count)
+
+
+def suite_files() -> list[Path]:
+    """Return every test file of the test suite.
+
+    Returns:
+        The `test_*.py` files under the tests package, sorted, relative to
+        the project root.
+    """
+    return sorted(ProjectTester.I.package_root().rglob("test_*.py"))
+
+
+def balanced_shards(
+    files: Iterable[Path],
+    durations: Mapping[str, float],
+    *,
+    count: int,
+) -> list[list[Path]]:
+    """Split files into shards of roughly equal total duration.
+
+    Assigns the longest-running files first, each to the shard with the
+    least total duration so far. Files without a recorded duration are
+    assumed to take the mean recorded duration.
+
+    Args:
+        files: Files to split.
+        durations: Recorded duration in seconds of each file, keyed by its
+            POSIX path.
+        count: Number of shards to split into.
+
+    Returns:
+        `count` shards, each a sorted list of files. Shards may be empty if
+        there are fewer files than shards.
+    """
+    default = fmean(durations.values()) if durations else 1.0
+    timed = sorted(
+        ((durations.get(path.as_posix(), default), path) for path in files),
+        key=lambda item: (-item[0], item[1]),
+    )
+    shards: list[list[Path]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for duration, path in timed:
+        shard = min(range(count), key=totals.__getitem__)
+        shards[shard].append(path)
+        totals[shard] += duration
+    return [sorted(shard) for shard in shards]
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """Load recorded test file durations.
+
+    Args:
+        path: File written by `record_durations`.
+
+    Returns:
+        Duration in seconds of each test file, keyed by its POSIX path.
+        Empty if the file is missing or unreadable.
+    """
+    try:
+        return json.loads(read_text_utf8(path))
+    except (OSError, ValueError):
+        return {}
+
+
+def record_durations(reports: Iterable[Path]) -> None:
+    """Record the duration of each test file from the JUnit reports of a run.
+
+    A test file that appears in several reports, such as one per OS and
+    Python version, is recorded with its mean duration.
+
+    Args:
+        reports: JUnit XML reports written by `ProjectTester.shard_test_args`.
+    """
+    durations: defaultdict[str, list[float]] = defaultdict(list)
+    for report in reports:
+        for file, duration in report_durations(report).items():
+            durations[file].append(duration)
+    path = ProjectTester.I.durations_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    recorded = {file: fmean(values) for file, values in sorted(durations.items())}
+    write_text_utf8(path, json.dumps(recorded, indent=2))
+
+
+def report_durations(report: Path) -> dict[str, float]:
+    """Sum the test durations of a JUnit XML report per test file.
+
+    Args:
+        report: Report written with pytest's `xunit1` JUnit family, which
+            records the file of each test case.
+
+    Returns:
+        Total duration in seconds of the tests of each file, keyed by its
+        POSIX path.
+    """
+    durations: defaultdict[str, float] = defaultdict(float)
+    # the report is written by the project's own test run
+    tree = ET.parse(report)  # noqa: S314  # nosec: B314
+    for case in tree.iter("testcase"):
+        file = Path(case.get("file", "")).as_posix()
+        durations[file] += float(case.get("time", 0))
+    return dict(durations)
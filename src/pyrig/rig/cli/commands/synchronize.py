@@ -1,18 +1,33 @@
 """Reconciliation of a project's managed files with their canonical state."""
 
-from collections.abc import Iterable
-from importlib import import_module
+import multiprocessing
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 import typer
+from pyrig_runtime.core.introspection.modules import replace_root_module_name
 
-from pyrig.core.introspection.paths import path_as_module_name
+from pyrig import rig
+from pyrig.core.introspection.modules import unexecuted_module
+from pyrig.core.introspection.paths import package_name_as_path, path_as_module_name
 from pyrig.rig.configs.base.config_file import ConfigFile
+from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.tests.mirror_test import MirrorTestConfigFile
 from pyrig.rig.tools.packages.manager import PackageManager
+from pyrig.rig.tools.testing.project import ProjectTester
+from pyrig.rig.tools.version_control.controller import VersionController
 
 
-def synchronize_project(files: Iterable[Path] | None) -> None:
+def synchronize_project(
+    files: Iterable[Path] | None,
+    *,
+    changed: bool = False,
+    check: bool = False,
+    diff: bool = False,
+    jobs: int = 1,
+) -> None:
     """Bring the project into its canonical state.
 
     Run the ordered reconciliation steps that update managed configuration and
@@ -22,69 +37,256 @@ def synchronize_project(files: Iterable[Path] | None) -> None:
     Args:
         files: Specific files to synchronize, relative to the project root.
             If None, all files are synchronized.
+        changed: Whether to add every file with uncommitted changes to
+            `files` (see `changed_files()`). A `files` of None then means no
+            other files, unless `changed_files()` requires a full sweep.
+        check: Whether to only report the files that would be created or
+            updated, via `check_project()`, instead of fixing them.
+        diff: Whether to also report the missing paths of each such file.
+            Only used when `check` is `True`.
+        jobs: Number of worker processes to validate mirror test files in,
+            as for `validate_test_files`.
 
     Raises:
         typer.Exit: With code 1 if any file was created or updated during
-            the run.
+            the run, or, when checking, would have been.
     """
+    if changed:
+        uncommitted = changed_files()
+        files = None if uncommitted is None else [*(files or ()), *uncommitted]
+    if check:
+        check_project(files, diff=diff)
+        return
     changed_configs = validate_config_files(files)
-    changed_tests = validate_test_files(files)
+    changed_tests = validate_test_files(files, jobs=jobs)
     if changed_configs or changed_tests:
         raise typer.Exit(code=1)
 
 
+def changed_files() -> list[Path] | None:
+    """Return the files with uncommitted changes, or None if all are affected.
+
+    A change to any of `full_synchronization_paths()` can change what every
+    managed file is required to contain, so it falls back to a full sweep.
+
+    Returns:
+        The files reported by `VersionController.changed_files()`, or None
+        if any of them lies in one of `full_synchronization_paths()`.
+    """
+    files = VersionController.I.changed_files()
+    triggers = full_synchronization_paths()
+    if any(file.is_relative_to(path) for file in files for path in triggers):
+        return None
+    return files
+
+
+def full_synchronization_paths() -> tuple[Path, ...]:
+    """Return the paths whose changes require synchronizing every file.
+
+    Returns:
+        The `pyproject.toml` file, the package manager's lock file, and the
+        project's `rig` package, where its config files and tools are
+        defined.
+    """
+    rig_name = replace_root_module_name(rig.__name__, PackageManager.I.package_name())
+    return (
+        PyprojectConfigFile.I.path(),
+        PackageManager.I.lock_file(),
+        PackageManager.I.source_root() / package_name_as_path(rig_name),
+    )
+
+
+def check_project(files: Iterable[Path] | None, *, diff: bool) -> None:
+    """Report every file `synchronize_project` would change, without writing.
+
+    Echoes `Would update <file>` for each config file and mirror test file
+    that is missing or incomplete, followed by one indented line per missing
+    path if `diff` is `True`.
+
+    Args:
+        files: Specific files to check, as for `synchronize_project`.
+        diff: Whether to list the missing paths of each reported file.
+
+    Raises:
+        typer.Exit: With code 1 if any file would be created or updated.
+    """
+    missing = {
+        **ConfigFile.check_subclasses(config_file_subclasses(files)),
+        **MirrorTestConfigFile.L.check_subclasses(mirror_test_subclasses(files)),
+    }
+    for subclass, paths in missing.items():
+        typer.echo(f"Would update {subclass()}")
+        if diff:
+            for path in paths:
+                typer.echo(f"  missing {path or '<entire file>'}")
+    if missing:
+        raise typer.Exit(code=1)
+
+
 def validate_config_files(files: Iterable[Path] | None) -> tuple[type[ConfigFile], ...]:
     """Validate pyrig-managed configuration files for the project.
 
     Args:
-        files: Specific config files to validate, relative to the project root.
-            Files that don't match any managed config file's path are ignored.
-            If None, all config files are validated.
+        files: Specific config files to validate, as for
+            `config_file_subclasses`.
 
     Returns:
         A tuple of ConfigFile subclasses that were created or updated. Empty
         if all were already correct.
     """
+    return ConfigFile.validate_subclasses(config_file_subclasses(files))
+
+
+def config_file_subclasses(files: Iterable[Path] | None) -> Iterable[type[ConfigFile]]:
+    """Return the config file classes managing any of the given files.
+
+    Args:
+        files: Specific config files, relative to the project root. Files
+            that don't match any managed config file's path are ignored.
+            If None, all config files are returned.
+
+    Returns:
+        The matching concrete `ConfigFile` leaves.
+    """
     subclasses = ConfigFile.concrete_leaves()
     if files is not None:
         files = set(files)
         subclasses = (cls for cls in subclasses if cls().path() in files)
-    return ConfigFile.validate_subclasses(subclasses)
+    return subclasses
 
 
 def validate_test_files(
     files: Iterable[Path] | None,
+    *,
+    jobs: int = 1,
 ) -> tuple[type[MirrorTestConfigFile], ...]:
     """Validate mirror test files for the project.
 
+    With more than one job, the source files are split into one shard per
+    worker process, and each worker validates the mirror test files of its
+    shard. Generating and validating a mirror test file only reads its own
+    source file and writes its own test file, so the shards are independent.
+
     Args:
-        files: Source files whose mirrored test file should be validated,
-            relative to the project root. Files outside the package's source
-            tree, non-Python files, and `__init__.py` files are silently
-            ignored. If None, every source file in the package is considered.
+        files: Source files whose mirrored test file should be validated, as
+            for `mirror_test_source_files`.
+        jobs: Number of worker processes to validate in. With 1, validation
+            runs in the current process.
 
     Returns:
         A tuple of MirrorTestConfigFile subclasses that were created or
         updated. Empty if all were already correct.
     """
+    source_files = mirror_test_source_files(files)
+    if jobs <= 1:
+        return MirrorTestConfigFile.L.validate_subclasses(
+            map(mirror_test_subclass, source_files),
+        )
+
+    shards = [shard for shard in (source_files[i::jobs] for i in range(jobs)) if shard]
+    if not shards:
+        return ()
+    # spawn, because forking a process that may already run threads is unsafe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        changed_files = list(
+            chain.from_iterable(executor.map(validate_test_file_shard, shards)),
+        )
+    # generated classes can't be pickled, so workers return their source files
+    return tuple(map(mirror_test_subclass, changed_files))
+
+
+def validate_test_file_shard(files: list[Path]) -> list[Path]:
+    """Validate the mirror test files of a shard of source files.
+
+    Runs in a worker process of `validate_test_files`.
+
+    Args:
+        files: Source files, as returned by `mirror_test_source_files`.
+
+    Returns:
+        The source files whose mirrored test file was created or updated.
+    """
+    subclasses = {mirror_test_subclass(file): file for file in files}
+    changed = MirrorTestConfigFile.L.validate_subclasses(subclasses)
+    return [subclasses[subclass] for subclass in changed]
+
+
+def mirror_test_subclasses(
+    files: Iterable[Path] | None,
+) -> Iterator[type[MirrorTestConfigFile]]:
+    """Return a mirror test config file class for each of the given source files.
+
+    Args:
+        files: Source files whose mirrored test file is wanted, as for
+            `mirror_test_source_files`.
+
+    Returns:
+        A `MirrorTestConfigFile` subclass generated for each source module.
+        Source modules that are not imported yet are not executed.
+    """
+    return map(mirror_test_subclass, mirror_test_source_files(files))
+
+
+def mirror_test_source_files(files: Iterable[Path] | None) -> list[Path]:
+    """Return the source files among the given ones that have a mirror test.
+
+    Args:
+        files: Source or test files, relative to the project root. A test
+            file stands for the source file it mirrors (see
+            `mirrored_source_file`). Files that do not exist, such as
+            deleted files or the original path of a renamed file, files
+            outside the package's source tree, non-Python files, and
+            `__init__.py` files are silently ignored. If None, every source
+            file in the package is considered.
+
+    Returns:
+        The remaining source files, in the given order, without duplicates.
+    """
     package_root = PackageManager.I.package_root()
     if files is None:
         files = package_root.rglob("*.py")
     else:
         files = (
-            file
-            for file in files
-            if file.suffix == ".py" and file.is_relative_to(package_root)
+            source_file
+            for source_file in dict.fromkeys(map(mirrored_source_file, files))
+            if source_file.suffix == ".py"
+            and source_file.is_relative_to(package_root)
+            and source_file.is_file()
         )
+    return [file for file in files if file.name != "__init__.py"]
 
-    files = (file for file in files if file.name != "__init__.py")
 
-    source_root = PackageManager.I.source_root()
-    module_names = (
-        path_as_module_name(file.relative_to(source_root)) for file in files
-    )
-    modules = (import_module(name) for name in module_names)
-    subclasses = (
-        MirrorTestConfigFile.L.generate_subclass(module) for module in modules
-    )
-    return MirrorTestConfigFile.L.validate_subclasses(subclasses)
+def mirrored_source_file(file: Path) -> Path:
+    """Return the source file a test file mirrors.
+
+    Reverses `MirrorTestConfigFile.test_path()`: the path is taken relative
+    to the tests package, and the `test_` prefix is removed from each part.
+
+    Args:
+        file: File relative to the project root.
+
+    Returns:
+        The mirrored source file if `file` lies in the tests package,
+        otherwise `file` itself. The source file may not exist.
+    """
+    tests_root = ProjectTester.I.package_root()
+    if not file.is_relative_to(tests_root):
+        return file
+    parts = (part.removeprefix("test_") for part in file.relative_to(tests_root).parts)
+    return PackageManager.I.source_root().joinpath(*parts)
+
+
+def mirror_test_subclass(file: Path) -> type[MirrorTestConfigFile]:
+    """Return a mirror test config file class for a source file.
+
+    Args:
+        file: Source file within the package, relative to the project root.
+
+    Returns:
+        A `MirrorTestConfigFile` subclass generated for the source module,
+        which is not executed if it is not imported yet.
+    """
+    module_name = path_as_module_name(file.relative_to(PackageManager.I.source_root()))
+    module = unexecuted_module(file, module_name)
+    return MirrorTestConfigFile.L.generate_subclass(module)
@@ -60,6 +60,35 @@ def sync(
             help="Files to synchronize. If omitted, all files are synchronized.",
         ),
     ] = None,
+    *,
+    changed: Annotated[
+        bool,
+        typer.Option(
+            help="Whether to synchronize only the given files plus every file "
+            "with uncommitted changes.",
+        ),
+    ] = False,
+    check: Annotated[
+        bool,
+        typer.Option(
+            help="Whether to only report the files that would change, "
+            "without writing anything.",
+        ),
+    ] = False,
+    diff: Annotated[
+        bool,
+        typer.Option(
+            help="Whether to also list what is missing from each reported file. "
+            "Implies --check.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Number of worker processes to generate mirror test files in.",
+        ),
+    ] = 1,
 ) -> None:
     """Reconcile all pyrig-managed project structure into its correct state.
 
@@ -70,9 +99,21 @@ def sync(
     Args:
         files: Files to synchronize. If omitted, all files are
             synchronized.
+        changed: When `True`, synchronizes `files` plus every file git
+            reports as modified, staged, or untracked, instead of all files.
+            Falls back to all files if `pyproject.toml`, the lock file, or
+            the project's `rig` package is among them.
+        check: When `True`, reports every file that would be created or
+            updated and exits non-zero if there is any, without writing.
+        diff: When `True`, also lists the missing paths of each reported
+            file, e.g. `tool.ruff.lint.select[2]`. Implies `check`.
+        jobs: Number of worker processes that generate and validate mirror
+            test files. Useful for large packages on machines with many
+            cores.
 
     Raises:
-        typer.Exit: With code 1 if any file was created or updated.
+        typer.Exit: With code 1 if any file was created or updated, or
+            would have been when checking.
 
     Note:
         Suitable as a git hook: fixes are applied and the command exits
@@ -82,4 +123,100 @@ def sync(
     """
     from pyrig.rig.cli.commands.synchronize import synchronize_project  # noqa: PLC0415
 
-    synchronize_project(files)
+    synchronize_project(
+        files,
+        changed=changed,
+        check=check or diff,
+        diff=diff,
+        jobs=jobs,
+    )
+
+
+def shard_tests(
+    index: Annotated[
+        int,
+        typer.Argument(min=1, help="1-based index of the shard to list."),
+    ],
+    count: Annotated[
+        int,
+        typer.Argument(min=1, help="Number of shards the test suite is split into."),
+    ],
+) -> None:
+    """Print the test files of one shard of the test suite.
+
+    Splits the test files into `count` shards of roughly equal duration,
+    using the durations recorded by `record-test-durations`, so CI can run
+    each shard on its own runner.
+
+    Args:
+        index: 1-based index of the shard to list.
+        count: Number of shards the test suite is split into.
+
+    Raises:
+        typer.BadParameter: If `index` is greater than `count`.
+
+    Example:
+        ```
+        $ uv run pytest $(uv run pyrig shard-tests 2 4)
+        ```
+    """
+    from pyrig.rig.cli.commands.shard_tests import print_shard_files  # noqa: PLC0415
+
+    if index > count:
+        msg = f"Shard {index} does not exist, there are only {count}."
+        raise typer.BadParameter(msg, param_hint="index")
+    print_shard_files(index, count)
+
+
+def record_test_durations(
+    reports: Annotated[
+        list[Path],
+        typer.Argument(help="JUnit XML reports of the test shards of a run."),
+    ],
+) -> None:
+    """Record the duration of each test file for balancing future test shards.
+
+    Args:
+        reports: JUnit XML reports written by the test shards of a CI run.
+    """
+    from pyrig.rig.cli.commands.shard_tests import record_durations  # noqa: PLC0415
+
+    record_durations(reports)
+
+
+def quick_tests() -> None:
+    """Print the quickest test files of the test suite.
+
+    Selects the quickest files by the durations recorded by
+    `record-test-durations`, up to a total duration of
+    `ProjectTester.quick_tests_seconds()`. Prints nothing if no durations
+    are recorded.
+
+    Example:
+        ```
+        $ uv run pytest --exitfirst $(uv run pyrig quick-tests)
+        ```
+    """
+    from pyrig.rig.cli.commands.shard_tests import print_quick_files  # noqa: PLC0415
+
+    print_quick_files()
+
+
+def shard_timeout(
+    count: Annotated[
+        int,
+        typer.Argument(min=1, help="Number of shards the test suite is split into."),
+    ] = 1,
+) -> None:
+    """Print the timeout in minutes of a CI job running one test shard.
+
+    Derived from the durations recorded by `record-test-durations`.
+
+    Args:
+        count: Number of shards the test suite is split into.
+    """
+    from pyrig.rig.cli.commands.shard_tests import (  # noqa: PLC0415
+        print_timeout_minutes,
+    )
+
+    print_timeout_minutes(count)
@@ -4,9 +4,14 @@
 config files are validated.
 """
 
+import hashlib
+import threading
 from abc import abstractmethod
-from collections.abc import Hashable, Iterable, Iterator
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
+from itertools import groupby
+from operator import methodcaller
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Self
@@ -14,12 +19,64 @@
 import typer
 from pyrig_runtime.core.dependencies.subclass import DependencySubclass
 
+from pyrig.core.introspection.registry import registered_subclasses
 from pyrig.core.iterate import (
     merge_nested_structures,
-    nested_structure_is_subset,
+    nested_structure_missing_paths,
 )
+from pyrig.core.strings import read_text_utf8, write_text_utf8
 from pyrig.rig import configs
 
+type FileStamp = tuple[int, int, int]
+"""A file's modification time in nanoseconds, size in bytes, and inode number."""
+
+type DocumentKey = tuple[Path, Callable[..., Any]]
+"""A file's absolute path and the `_load()` function that parses it."""
+
+LOADED_DOCUMENTS: dict[DocumentKey, tuple[FileStamp | None, Any]] = {}
+"""Parsed file contents, shared by every config file class.
+
+Keyed by `DocumentKey`, and stored along with the `file_stamp()` the file had
+when it was parsed. Only accessed while holding `LOADED_DOCUMENTS_LOCK`,
+since config files of one priority tier are validated on several threads.
+"""
+
+LOADED_DOCUMENTS_LOCK = threading.Lock()
+"""Guards every read and write of `LOADED_DOCUMENTS`."""
+
+
+def file_stamp(path: Path) -> FileStamp | None:
+    """Return what identifies the current version of a file.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        The file's modification time in nanoseconds, size in bytes, and
+        inode number, or None if the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def clear_loaded_documents(path: Path | None = None) -> None:
+    """Discard parsed file contents, so the next `load()` parses them again.
+
+    Args:
+        path: File whose contents to discard, as parsed by any config file
+            class. If None, the contents of every file are discarded.
+    """
+    with LOADED_DOCUMENTS_LOCK:
+        if path is None:
+            LOADED_DOCUMENTS.clear()
+            return
+        path = path.absolute()
+        for key in [key for key in LOADED_DOCUMENTS if key[0] == path]:
+            del LOADED_DOCUMENTS[key]
+
 
 class ConfigFile[ConfigT: dict[str, Any] | list[Any]](DependencySubclass):
     """Abstract base class for declarative configuration file management.
@@ -114,6 +171,34 @@ def discovery_module(cls) -> ModuleType:
         """
         return configs
 
+    @classmethod
+    def subclasses(cls) -> Iterator[type[Self]]:
+        """Yield every subclass discovered within the declared discovery scope.
+
+        Overrides the base discovery to go through the persisted class
+        registry, so only the modules that define config files are imported
+        while nothing in the discovery scope has changed.
+
+        Yields:
+            Subclass types found anywhere in the discovery scope.
+        """
+        return registered_subclasses(
+            cls,
+            module=cls.discovery_module(),
+            registry_dir=cls.registry_dir(),
+        )
+
+    @classmethod
+    def registry_dir(cls) -> Path:
+        """Return the directory the class registry is persisted in.
+
+        Returns:
+            The `registry` directory inside the pyrig cache directory.
+        """
+        from pyrig.rig.tools.pyrigger import Pyrigger  # noqa: PLC0415
+
+        return Pyrigger.I.cache_dir() / "registry"
+
     @classmethod
     def merge_key(cls) -> Hashable:
         """Return the file path, so subclasses targeting the same file are merged.
@@ -150,18 +235,50 @@ def configs(cls) -> ConfigT:
         return cls()._configs()  # noqa: SLF001
 
     @classmethod
-    @cache
     def load(cls) -> ConfigT:
         """Load and return the current file contents.
 
-        The result is cached per class and reused on every subsequent access,
-        until `dump()` clears the cache.
+        The result is cached in `LOADED_DOCUMENTS`, shared by every class
+        that parses the same file with the same `_load()`, so each file is
+        parsed once per process. It is reused while the file's `file_stamp()`
+        is unchanged, and discarded by `dump()`, whichever class writes the
+        file.
 
         Returns:
             Parsed configuration as a dict or list.
         """
         instance = cls()
-        return instance._load()
+        key = instance.document_key()
+        stamp = file_stamp(instance.path())
+        with LOADED_DOCUMENTS_LOCK:
+            loaded = LOADED_DOCUMENTS.get(key)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1]
+        document = instance._load()
+        with LOADED_DOCUMENTS_LOCK:
+            LOADED_DOCUMENTS[key] = (stamp, document)
+        return document
+
+    def document_key(self) -> DocumentKey:
+        """Return the key `load()` caches this file's parsed content under.
+
+        Returns:
+            The file's absolute path and this class's `_load()` function.
+        """
+        return self.path().absolute(), self._load.__func__
+
+    def stage(self, configs: ConfigT) -> None:
+        """Serve `configs` from `load()` as if the file contained it, without writing.
+
+        Lasts until the file changes on disk or its loaded contents are
+        cleared (see `clear_loaded_documents()`).
+
+        Args:
+            configs: Configuration data `load()` should return.
+        """
+        entry = (file_stamp(self.path()), configs)
+        with LOADED_DOCUMENTS_LOCK:
+            LOADED_DOCUMENTS[self.document_key()] = entry
 
     @classmethod
     def version_control_ignored_subclasses(cls) -> Iterator[type[Self]]:
@@ -180,18 +297,169 @@ def validate_subclasses(
     ) -> tuple[type[Self], ...]:
         """Validate a specific collection of `ConfigFile` subclasses.
 
-        Sorts the given subclasses by priority (higher priority first) and
-        validates each one in order.
+        Groups the given subclasses into priority tiers (see
+        `priority_tiers()`) and validates the tiers one after another, higher
+        priority first. A file that depends on another declares it by
+        returning a higher or lower `priority()`, so those declarations are
+        the only ordering edges between files: within a tier there are none,
+        and its files are validated concurrently (see `validate_tier()`).
 
         Args:
             subclasses: `ConfigFile` subclasses to validate.
 
         Returns:
-            Tuple of subclasses that were created or updated.
-            Empty if all were already correct.
+            Tuple of subclasses that were created or updated, in priority
+            order. Empty if all were already correct.
         """
         return tuple(
-            cf for cf in cls.sorted_subclasses(subclasses) if not cf().validate()
+            cf
+            for tier in cls.priority_tiers(subclasses)
+            for cf, correct in zip(tier, cls.validate_tier(tier), strict=True)
+            if not correct
+        )
+
+    @classmethod
+    def check_subclasses(
+        cls,
+        subclasses: Iterable[type[Self]],
+    ) -> dict[type[Self], list[str]]:
+        """Check a specific collection of `ConfigFile` subclasses without writing.
+
+        Subclasses are checked one by one in priority order. The content
+        `validate()` would write to each incorrect file is computed in memory
+        and staged (see `stage()`), so the files checked after it see that
+        content, as they would when validating. Staged content is discarded
+        afterward; nothing is written.
+
+        Args:
+            subclasses: `ConfigFile` subclasses to check.
+
+        Returns:
+            The `check()` result of every subclass that is not correct, in
+            priority order. Empty if all are correct.
+        """
+        missing: dict[type[Self], list[str]] = {}
+        try:
+            for cf in cls.sorted_subclasses(subclasses):
+                config_file = cf()
+                paths = config_file.check()
+                if not paths:
+                    continue
+                missing[cf] = paths
+                config_file.stage(
+                    config_file.configs()
+                    if paths == [""]
+                    else config_file.merge_configs(),
+                )
+        finally:
+            for cf in missing:
+                clear_loaded_documents(cf().path())
+        return missing
+
+    @classmethod
+    def priority_tiers(
+        cls,
+        subclasses: Iterable[type[Self]],
+    ) -> list[list[type[Self]]]:
+        """Group subclasses that share a sort key, in sorted order.
+
+        Args:
+            subclasses: `ConfigFile` subclasses to group.
+
+        Returns:
+            One list per distinct `sort_key()`, higher priority first. Each
+            list keeps the order `sorted_subclasses()` gives its members.
+        """
+        return [
+            list(tier)
+            for _, tier in groupby(
+                cls.sorted_subclasses(subclasses),
+                key=methodcaller(cls.sort_key.__name__),
+            )
+        ]
+
+    @classmethod
+    def validate_tier(cls, tier: Sequence[type[Self]]) -> list[bool]:
+        """Validate every subclass in one priority tier.
+
+        Files in the same tier do not depend on each other, so the ones
+        that allow it (see `validates_concurrently()`) are validated on a
+        thread pool of at most `max_validation_workers()` threads. The
+        others are validated one at a time afterward, as are all files if
+        only one allows concurrency or the limit is one worker.
+
+        Args:
+            tier: `ConfigFile` subclasses sharing one priority.
+
+        Returns:
+            The `validate()` result of each subclass, in the order of `tier`.
+        """
+        concurrent = [cf for cf in tier if cf().validates_concurrently()]
+        results: dict[type[Self], bool] = {}
+        if len(concurrent) > 1 and cls.max_validation_workers() != 1:
+            with ThreadPoolExecutor(cls.max_validation_workers()) as executor:
+                results.update(
+                    zip(
+                        concurrent,
+                        executor.map(cls.validate_subclass, concurrent),
+                        strict=True,
+                    ),
+                )
+        for cf in tier:
+            if cf not in results:
+                results[cf] = cls.validate_subclass(cf)
+        return [results[cf] for cf in tier]
+
+    @classmethod
+    def validate_subclass(cls, subclass: type[Self]) -> bool:
+        """Validate a single subclass, for use as a thread pool task.
+
+        Args:
+            subclass: `ConfigFile` subclass to validate.
+
+        Returns:
+            The subclass's `validate()` result.
+        """
+        return subclass().validate()
+
+    @classmethod
+    def max_validation_workers(cls) -> int | None:
+        """Return the maximum number of threads validating one tier at once.
+
+        Override with `1` for file types whose validation is not safe to run
+        concurrently with their siblings.
+
+        Returns:
+            `None`, letting `ThreadPoolExecutor` pick its default.
+        """
+        return None
+
+    def validates_concurrently(self) -> bool:
+        """Return whether this file may be validated concurrently with its tier.
+
+        Files of a tier are validated on threads sharing one process, so
+        their file I/O must not depend on process-wide state. Overrides of
+        `_dump()`, `_load()`, or `create_file()` from outside pyrig may, for
+        example by changing the working directory with `contextlib.chdir`
+        (as test doubles built with the `config_file_factory` fixture do),
+        which would redirect the relative paths of every other thread. Such
+        files are therefore validated one at a time. Override with `True`
+        once a file's I/O is known to be thread-safe, or with `False` for
+        files whose validation touches other process-wide state, such as the
+        module cache.
+
+        Returns:
+            Whether `_dump()`, `_load()`, and `create_file()` are all
+            implemented within pyrig.
+        """
+        package = __name__.partition(".")[0]
+        return all(
+            getattr(type(self), method).__module__.partition(".")[0] == package
+            for method in (
+                self._dump.__name__,
+                self._load.__name__,
+                self.create_file.__name__,
+            )
         )
 
     def validate(self) -> bool:
@@ -201,6 +469,11 @@ def validate(self) -> bool:
         it is missing, leaving an already-correct file untouched. Idempotent
         and safe to call repeatedly.
 
+        A file whose stored fingerprint still matches (see
+        `fingerprint_is_current()`) is reported correct without being parsed.
+        Otherwise, once `is_correct()` passes, the fingerprint is stored for
+        the next run.
+
         Returns:
             `True` if the file was already correct and required no changes;
             `False` if it was created or updated.
@@ -215,7 +488,11 @@ def validate(self) -> bool:
             self.dump(self.configs())
             return False
 
+        if self.fingerprint_is_current():
+            return True
+
         if self.is_correct():
+            self.store_fingerprint()
             return True
 
         config = self.merge_configs()
@@ -226,6 +503,19 @@ def validate(self) -> bool:
             raise RuntimeError(msg)
         return False
 
+    def check(self) -> list[str]:
+        """Return what `validate()` would change, without changing anything.
+
+        Returns:
+            Empty if the file is correct. `[""]`, the root path, if the file
+            does not exist. Otherwise `missing_paths()`.
+        """
+        if not self.path().exists():
+            return [""]
+        if self.fingerprint_is_current():
+            return []
+        return self.missing_paths()
+
     def create_file(self) -> None:
         """Ensure the config file exists, creating any missing parent directories.
 
@@ -257,17 +547,55 @@ def extension_separator(self) -> str:
     def dump(self, configs: ConfigT) -> None:
         """Write configuration to disk and keep the load cache consistent.
 
-        Clears the `load()` cache afterward, so the new content is read on
-        subsequent `load()` calls instead of the stale cached value.
-        Echoes the updated file path to stdout.
+        Does nothing if the file already has exactly the content `dumps()`
+        returns for `configs` (see `is_dumped()`), so an unchanged file is
+        neither rewritten nor subject to the side effects of `_dump()`.
+
+        Otherwise clears the `load()` cache of the file afterward, for every
+        class that reads it, so the new content is read on subsequent
+        `load()` calls instead of the stale cached value. Echoes the updated
+        file path to stdout.
 
         Args:
             configs: Configuration data to write.
         """
+        if self.is_dumped(configs):
+            return
         self._dump(configs)
-        self.load.cache_clear()
+        clear_loaded_documents(self.path())
         typer.echo(f"Updated {self}")
 
+    def dumps(self, configs: ConfigT) -> str | None:  # noqa: ARG002
+        """Return the exact content `_dump()` writes for `configs`.
+
+        Format-specific bases serialize `configs` in memory. Defaults to
+        `None`, for files whose content is not known before writing, which
+        `dump()` then always writes.
+
+        Args:
+            configs: Configuration data to serialize.
+
+        Returns:
+            The file content `_dump()` writes, or `None` if unknown.
+        """
+        return None
+
+    def is_dumped(self, configs: ConfigT) -> bool:
+        """Return whether the file already holds exactly what dumping `configs` writes.
+
+        Args:
+            configs: Configuration data that would be written.
+
+        Returns:
+            `True` if `dumps()` knows the content and the file's bytes equal
+            it; `False` otherwise.
+        """
+        content = self.dumps(configs)
+        if content is None:
+            return False
+        path = self.path()
+        return path.is_file() and path.read_bytes() == content.encode()
+
     def is_correct(self) -> bool:
         """Return whether the config file passes validation.
 
@@ -275,9 +603,81 @@ def is_correct(self) -> bool:
         in `configs()`; additional keys or items are allowed.
 
         Returns:
-            `True` if all required configuration is present in the file.
+            `True` if `missing_paths()` is empty.
+        """
+        return not self.missing_paths()
+
+    def missing_paths(self) -> list[str]:
+        """Return the paths of the required configuration missing from the file.
+
+        Override alongside any change to what counts as correct, since
+        `is_correct()` is derived from this.
+
+        Returns:
+            Paths into `configs()` that the loaded file does not satisfy, as
+            returned by `nested_structure_missing_paths`. Empty if the file is
+            correct.
         """
-        return nested_structure_is_subset(self.configs(), self.load())
+        return nested_structure_missing_paths(self.configs(), self.load())
+
+    def fingerprinted(self) -> bool:
+        """Return whether `validate()` may skip files whose fingerprint matches.
+
+        Defaults to `True`. Override with `False` for files whose correctness
+        depends on more than their own content and `configs()`, or whose
+        `configs()` is as expensive to build as `is_correct()` itself.
+
+        Returns:
+            `True` if the fingerprint cache is used for this file.
+        """
+        return True
+
+    def fingerprint(self) -> str:
+        """Return a hash of the on-disk bytes and the required configuration.
+
+        Returns:
+            Hex SHA-256 digest of the file's bytes followed by the `repr()` of
+            `configs()`.
+        """
+        digest = hashlib.sha256(self.path().read_bytes())
+        digest.update(repr(self.configs()).encode())
+        return digest.hexdigest()
+
+    def fingerprint_path(self) -> Path:
+        """Return the file storing this config file's last known-good fingerprint.
+
+        Returns:
+            Path inside the pyrig cache directory, named after the hash of the
+            config file's path.
+        """
+        from pyrig.rig.tools.pyrigger import Pyrigger  # noqa: PLC0415
+
+        name = hashlib.sha256(self.path().as_posix().encode()).hexdigest()
+        return Pyrigger.I.cache_dir() / "fingerprints" / name
+
+    def fingerprint_is_current(self) -> bool:
+        """Return whether the stored fingerprint matches the current one.
+
+        Returns:
+            `True` if the file is fingerprinted and its current fingerprint
+            equals the one stored by the last `store_fingerprint()` call;
+            `False` otherwise.
+        """
+        if not self.fingerprinted():
+            return False
+        path = self.fingerprint_path()
+        return path.exists() and read_text_utf8(path) == self.fingerprint()
+
+    def store_fingerprint(self) -> None:
+        """Store the current fingerprint, marking the file as known-good.
+
+        Does nothing if the file is not fingerprinted.
+        """
+        if not self.fingerprinted():
+            return
+        path = self.fingerprint_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_utf8(path, self.fingerprint())
 
     def merge_configs(self) -> ConfigT:
         """Merge the current file contents into the required configuration.
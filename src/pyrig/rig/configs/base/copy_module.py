@@ -179,6 +179,6 @@ def content(self) -> str:
         )
         return f"{ast.unparse(module)}\n"
 
-    def is_correct(self) -> bool:
-        """Return `True` if the scaffolded module has a docstring, `False` otherwise."""
-        return module_has_docstring(self.module())
+    def missing_paths(self) -> list[str]:
+        """Return `["__doc__"]` if the scaffolded module has no docstring, else `[]`."""
+        return [] if module_has_docstring(self.module()) else ["__doc__"]
@@ -3,7 +3,7 @@
 import json
 from typing import Any
 
-from pyrig.core.strings import open_path_with_utf8, read_text_utf8
+from pyrig.core.strings import read_text_utf8, replace_text_utf8
 from pyrig.rig.configs.base.config_file import (
     ConfigFile,
     DictConfigFile,
@@ -21,7 +21,7 @@ class JSONConfigFile[ConfigT: dict[str, Any] | list[Any]](ConfigFile[ConfigT]):
     """
 
     def _dump(self, configs: ConfigT) -> None:
-        """Write configuration to the JSON file with 2-space indentation.
+        """Atomically write configuration to the JSON file via `dumps()`.
 
         Args:
             configs: Configuration dict or list to serialize and write.
@@ -29,15 +29,29 @@ def _dump(self, configs: ConfigT) -> None:
         Raises:
             ValueError: If `configs` contains a `NaN` or infinite float value.
         """
-        with open_path_with_utf8(self.path(), mode="w") as f:
-            json.dump(
+        replace_text_utf8(self.path(), self.dumps(configs))
+
+    def dumps(self, configs: ConfigT) -> str:
+        """Serialize configuration to JSON with 2-space indentation.
+
+        Args:
+            configs: Configuration dict or list to serialize.
+
+        Returns:
+            The JSON text `_dump()` writes, ending with a newline.
+
+        Raises:
+            ValueError: If `configs` contains a `NaN` or infinite float value.
+        """
+        return (
+            json.dumps(
                 configs,
-                f,
                 indent=2,
                 ensure_ascii=False,
                 allow_nan=False,
             )
-            f.write("\n")
+            + "\n"
+        )
 
     def _load(self) -> ConfigT:
         """Read and parse the JSON file from disk.
@@ -1,5 +1,6 @@
 """Base class for managing Python (`.py`) source file configuration."""
 
+import sys
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -41,9 +42,18 @@ class PythonConfigFile(StringConfigFile):
     """
 
     def _dump(self, configs: list[Any]) -> None:
-        """Reimport the module after the config file is written."""
+        """Reimport the module after the config file is written.
+
+        A module that has not been imported yet is left alone, since its next
+        import reads the new content anyway.
+        """
         super()._dump(configs)
-        reimport_module(self.module())
+        if self.module_name() in sys.modules:
+            reimport_module(self.module())
+
+    def validates_concurrently(self) -> bool:
+        """Return `False`, as `_dump()` reimports the module it wrote."""
+        return False
 
     def extension(self) -> str:
         """Return `"py"`, the fixed extension for Python source files."""
@@ -55,11 +65,15 @@ def module(self) -> ModuleType:
         Returns:
             Module imported from this config file's import path.
         """
-        path = self.import_path()
-        return import_module_with_file_fallback(
-            path,
-            path_as_module_name(path.relative_to(self.source_root())),
-        )
+        return import_module_with_file_fallback(self.import_path(), self.module_name())
+
+    def module_name(self) -> str:
+        """Return the dotted name of the module this config file manages.
+
+        Returns:
+            The import path relative to `source_root()`, as a module name.
+        """
+        return path_as_module_name(self.import_path().relative_to(self.source_root()))
 
     def import_path(self) -> Path:
         """Return the path from which this config file's module is imported.
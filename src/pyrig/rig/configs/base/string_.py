@@ -3,7 +3,7 @@
 from abc import abstractmethod
 from collections.abc import Iterable
 
-from pyrig.core.strings import read_text_utf8, write_text_utf8
+from pyrig.core.strings import read_text_utf8, replace_text_utf8
 from pyrig.rig.configs.base.config_file import ListConfigFile
 
 
@@ -38,30 +38,44 @@ def _configs(self) -> list[str]:
         return self.lines()
 
     def _dump(self, configs: list[str]) -> None:
-        """Join the lines and write them to the file as UTF-8 text.
+        """Join the lines and atomically write them to the file as UTF-8 text.
 
         Args:
             configs: Lines to write to the file.
         """
-        write_text_utf8(self.path(), self.join_lines(configs))
+        replace_text_utf8(self.path(), self.dumps(configs))
+
+    def dumps(self, configs: list[str]) -> str:
+        """Return the lines joined into the file's text.
+
+        Args:
+            configs: Lines to join.
+
+        Returns:
+            The text `_dump()` writes.
+        """
+        return self.join_lines(configs)
 
     def _load(self) -> list[str]:
         """Read the file as UTF-8 text and split it into lines."""
         return self.split_lines(read_text_utf8(self.path()))
 
-    def is_correct(self) -> bool:
-        """Check whether the file already contains all required content.
+    def missing_paths(self) -> list[str]:
+        """Return the required lines that are not present in the file.
 
         A required line need not be an exact line of the file; it only has
         to occur somewhere within the file's text.
 
         Returns:
-            `True` if every required line is present in the file.
+            The path (e.g. `"[3]"`) of every required line that is not a
+            substring of the file's content.
         """
-        return self.all_lines_in_content(
-            lines=self.configs(),
-            content=self.read_content(),
-        )
+        content = self.read_content()
+        return [
+            f"[{index}]"
+            for index, line in enumerate(self.configs())
+            if line not in content
+        ]
 
     def all_lines_in_content(self, lines: Iterable[str], content: str) -> bool:
         """Check whether every line is present in the content string.
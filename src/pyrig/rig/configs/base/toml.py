@@ -5,7 +5,7 @@
 
 import tomli_w
 
-from pyrig.core.strings import open_path_with_utf8, read_text_utf8
+from pyrig.core.strings import read_text_utf8, replace_text_utf8
 from pyrig.rig.configs.base.config_file import DictConfigFile
 
 
@@ -40,12 +40,22 @@ def extension(self) -> str:
         return "toml"
 
     def pretty_dump(self, configs: dict[str, Any]) -> None:
-        """Write configuration to the TOML file using `tomli_w`.
+        """Atomically write configuration to the TOML file via `dumps()`.
+
+        Args:
+            configs: Configuration dict to write.
+        """
+        replace_text_utf8(self.path(), self.dumps(configs))
+
+    def dumps(self, configs: dict[str, Any]) -> str:
+        """Serialize configuration to TOML using `tomli_w`.
 
         Key order is preserved; arrays are forced onto multiple lines.
 
         Args:
-            configs: Configuration dict to write.
+            configs: Configuration dict to serialize.
+
+        Returns:
+            The TOML text `_dump()` writes.
         """
-        with open_path_with_utf8(self.path(), mode="w") as f:
-            f.write(tomli_w.dumps(configs, indent=2))
+        return tomli_w.dumps(configs, indent=2)
@@ -13,6 +13,9 @@
 )
 from pyrig.rig.configs.base.yaml import YMLDictConfigFile
 from pyrig.rig.configs.pyproject import PyprojectConfigFile
+from pyrig.rig.configs.version_control.hooks.manager import (
+    VersionControlHookManagerConfigFile,
+)
 from pyrig.rig.tools.linting.shell import ShellLinter
 from pyrig.rig.tools.packages.manager import PackageManager
 from pyrig.rig.tools.programming_language import ProgrammingLanguage
@@ -79,12 +82,13 @@ def _configs(self) -> dict[str, Any]:
 
         Returns:
             Top-level workflow configuration with `name`, `on`,
-            `defaults`, `env`, `run-name`, and `jobs` keys populated from
-            the overridable methods.
+            `concurrency`, `defaults`, `env`, `run-name`, and `jobs` keys
+            populated from the overridable methods.
         """
         return {
             "name": self.workflow_name(),
             "on": self.workflow_triggers(),
+            "concurrency": self.concurrency(),
             "defaults": self.defaults(),
             "env": self.global_env(),
             "run-name": self.run_name(),
@@ -95,6 +99,51 @@ def parent_path(self) -> Path:
         """Return the GitHub Actions workflows directory."""
         return RemoteVersionController.I.config_dir() / "workflows"
 
+    def concurrency(self) -> dict[str, Any]:
+        """Return the concurrency policy of the workflow.
+
+        Runs in the same `concurrency_group()` never run at the same time.
+        A new run waits for the one in progress, or cancels it if
+        `cancel_in_progress()` is true.
+
+        Returns:
+            Dict with the `group` and `cancel-in-progress` settings.
+        """
+        return {
+            "group": self.concurrency_group(),
+            "cancel-in-progress": self.cancel_in_progress(),
+        }
+
+    def concurrency_group(self) -> str:
+        """Return the concurrency group runs of this workflow belong to.
+
+        Runs of a pull request share a group keyed on its number, as branch
+        names of pull requests from forks may collide. Every other run, such
+        as a push to the default branch or a scheduled run, gets a group of
+        its own, since a queued run of a shared group is replaced by a newer
+        one and its commit would then never be checked or released.
+
+        Returns:
+            Expression combining the workflow name with the pull request's
+            number, or with the run's ID for other events.
+        """
+        key = "github.event.pull_request.number || github.run_id"
+        return (
+            f"{self.insert_expression('github.workflow')}-{self.insert_expression(key)}"
+        )
+
+    def cancel_in_progress(self) -> str:
+        """Return whether a new run cancels the run in progress in its group.
+
+        Only pull request runs are cancelled, as a new push to a pull
+        request supersedes the previous one. Runs for the default branch
+        and runs triggered by other workflows are never cancelled.
+
+        Returns:
+            Expression that is true for pull request runs.
+        """
+        return self.insert_expression(self.if_pull_request())
+
     def defaults(self) -> dict[str, Any]:
         """Return the default settings applied to every step in the workflow.
 
@@ -149,7 +198,9 @@ def job(  # noqa: PLR0913
         strategy: dict[str, Any] | None = None,
         permissions: dict[str, Any] | None = None,
         runs_on: str = UBUNTU_LATEST,
+        timeout_minutes: int | str | None = None,
         if_condition: str | None = None,
+        outputs: dict[str, str] | None = None,
         steps: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Build a job configuration dict.
@@ -161,8 +212,12 @@ def job(  # noqa: PLR0913
             strategy: Matrix or other strategy configuration.
             permissions: Job-level permissions override.
             runs_on: Runner label. Defaults to `ubuntu-latest`.
+            timeout_minutes: Minutes after which GitHub cancels the job, or
+                an expression resolving to them.
             if_condition: GitHub Actions conditional expression controlling
                 whether the job runs.
+            outputs: Job outputs, mapping output names to the expressions
+                they resolve to, readable by dependent jobs via `needs`.
             steps: Ordered list of step configurations.
 
         Returns:
@@ -176,8 +231,12 @@ def job(  # noqa: PLR0913
         if permissions is not None:
             job["permissions"] = permissions
         job["runs-on"] = runs_on
+        if timeout_minutes is not None:
+            job["timeout-minutes"] = timeout_minutes
         if strategy is not None:
             job["strategy"] = strategy
+        if outputs is not None:
+            job["outputs"] = outputs
         if steps is not None:
             job["steps"] = steps
         return {self.job_id_from_method(method): job}
@@ -353,6 +412,7 @@ def strategy_matrix_os_and_python_version(
         self,
         os: list[str] | None = None,
         python_versions: list[str] | None = None,
+        shards: int | None = None,
     ) -> dict[str, Any]:
         """Create a strategy with OS and Python version matrix.
 
@@ -363,15 +423,18 @@ def strategy_matrix_os_and_python_version(
             python_versions: Python version strings to test against. Defaults
                 to all versions returned by
                 `PyprojectConfigFile.supported_python_versions()`.
+            shards: Number of shards to split each OS and Python version
+                combination into. No shard dimension is added if None.
 
         Returns:
             Strategy configuration containing the combined OS and Python
-            version matrix.
+            version matrix, and the shard dimension if requested.
         """
         return self.strategy_matrix(
             matrix={
                 **self.matrix_os(os=os),
                 **self.matrix_python_version(python_versions=python_versions),
+                **(self.matrix_shard(shards=shards) if shards is not None else {}),
             },
         )
 
@@ -483,6 +546,18 @@ def matrix_python_version(
             ]
         return self.matrix({"python-version": python_versions})
 
+    def matrix_shard(self, *, shards: int) -> dict[str, Any]:
+        """Create a matrix with a shard dimension.
+
+        Args:
+            shards: Number of shards.
+
+        Returns:
+            Matrix dict with the `shard` key populated with the 1-based
+            shard indices.
+        """
+        return self.matrix({"shard": list(range(1, shards + 1))})
+
     def matrix(self, matrix: dict[str, list[Any]]) -> dict[str, Any]:
         """Return the matrix configuration.
 
@@ -507,7 +582,8 @@ def steps_core_installed_setup(
         """Build setup steps that include dependency installation.
 
         Produces steps for repository checkout, Python environment setup,
-        optional dependency upgrade, and a full `uv sync`.
+        restoring the tool caches, optional dependency upgrade, and a full
+        `uv sync`.
 
         Args:
             python_version: Python version string. Defaults to the latest
@@ -518,10 +594,13 @@ def steps_core_installed_setup(
         Returns:
             Ordered list of step configuration dicts.
         """
+        if python_version is None:
+            python_version = self.default_python_version()
         return [
             *self.steps_core_setup(
                 python_version=python_version,
             ),
+            self.step_restore_tool_caches(python_version=python_version),
             *((self.step_update_dependencies(),) if update_dependencies else ()),
             self.step_install_dependencies(),
         ]
@@ -543,14 +622,20 @@ def steps_core_setup(
             Ordered list of step configuration dicts.
         """
         if python_version is None:
-            python_version = str(
-                PyprojectConfigFile.I.latest_possible_python_version(level="minor"),
-            )
+            python_version = self.default_python_version()
         return [
             self.step_checkout_repository(),
             self.step_setup_package_manager(python_version=python_version),
         ]
 
+    def default_python_version(self) -> str:
+        """Return the Python version setup steps use when none is given.
+
+        Returns:
+            The latest minor version supported by the project, e.g. `"3.14"`.
+        """
+        return str(PyprojectConfigFile.I.latest_possible_python_version(level="minor"))
+
     def step_checkout_repository(self) -> dict[str, Any]:
         """Build a step that checks out the repository.
 
@@ -570,11 +655,14 @@ def step_setup_package_manager(
         *,
         python_version: str,
     ) -> dict[str, Any]:
-        """Build a step that installs uv and pins the Python version.
+        """Build a step that installs uv, pins the Python version, and caches uv.
 
         Uses `astral-sh/setup-uv` to install uv on the runner and configure
         it to use the given Python version. All subsequent `uv run` and
-        `uv sync` commands will use this version.
+        `uv sync` commands will use this version. uv's cache of downloaded
+        and built packages is restored and saved by the action, keyed on the
+        runner's OS, the Python version, and the lock file, so `uv sync`
+        does not download the same packages again on every run.
 
         Args:
             python_version: Python version string to pin, e.g. `"3.13"`.
@@ -585,9 +673,58 @@ def step_setup_package_manager(
         return self.step(
             self.step_setup_package_manager,
             uses="astral-sh/setup-uv@main",
-            with_={"python-version": python_version},
+            with_={
+                "python-version": python_version,
+                "enable-cache": "true",
+                "cache-dependency-glob": PackageManager.I.lock_file().as_posix(),
+            },
         )
 
+    def step_restore_tool_caches(self, *, python_version: str) -> dict[str, Any]:
+        """Build a step that restores and saves the caches of the project's tools.
+
+        Uses `actions/cache` for `tool_cache_paths()`. The key combines the
+        runner's OS, the Python version, a hash of the lock file and the hook
+        configuration, and the workflow run's ID. As cache entries are
+        immutable, the unique key makes every run save its updated caches
+        instead of keeping the first snapshot until the lock file changes.
+        The most recent cache with the same hash is restored, falling back
+        to the most recent one of the same OS and Python version.
+
+        Args:
+            python_version: Python version string, e.g. `"3.13"` or a matrix
+                expression.
+
+        Returns:
+            Step using `actions/cache@main`.
+        """
+        prefix = f"{self.insert_runner_os()}-python-{python_version}-tools-"
+        hashed_files = (
+            PackageManager.I.lock_file(),
+            VersionControlHookManagerConfigFile.I.path(),
+        )
+        hashed_prefix = prefix + self.insert_hash_files(*hashed_files) + "-"
+        return self.step(
+            self.step_restore_tool_caches,
+            uses="actions/cache@main",
+            with_={
+                "path": "\n".join(self.tool_cache_paths()),
+                "key": hashed_prefix + self.insert_expression("github.run_id"),
+                "restore-keys": f"{hashed_prefix}\n{prefix}",
+            },
+        )
+
+    def tool_cache_paths(self) -> list[str]:
+        """Return the cache directories restored by `step_restore_tool_caches`.
+
+        Override to cache further tools.
+
+        Returns:
+            The hook environments prek installs, and the ruff and pytest
+            caches in the project root.
+        """
+        return ["~/.cache/prek", ".ruff_cache", ".pytest_cache"]
+
     def step_update_dependencies(self) -> dict[str, Any]:
         """Build a step that upgrades all pinned dependencies.
 
@@ -615,6 +752,60 @@ def step_install_dependencies(self) -> dict[str, Any]:
             run=str(PackageManager.I.install_dependencies_args()),
         )
 
+    def change_filters(self) -> dict[str, list[str]]:
+        """Return the named groups of paths whose changes gate jobs.
+
+        Override to let jobs of this workflow skip pull requests that do
+        not touch their files: `job_detect_changes()` reports per filter
+        whether a pull request changed any matching file, and
+        `if_changed()` builds the condition a gated job runs under.
+
+        Returns:
+            Dict mapping filter names to glob patterns relative to the
+            project root. Empty by default.
+        """
+        return {}
+
+    def job_detect_changes(self) -> dict[str, Any]:
+        """Build the job that detects which `change_filters()` a change matches.
+
+        Returns:
+            Job configuration with one output per filter, `"true"` if the
+            pull request changed a matching file. The outputs are empty for
+            other events, which `if_changed()` treats as changed.
+        """
+        step_id = self.step_id_from_method(self.step_detect_changes)
+        return self.job(
+            self.job_detect_changes,
+            permissions={"contents": "read", "pull-requests": "read"},
+            outputs={
+                name: self.insert_expression(f"steps.{step_id}.outputs.{name}")
+                for name in self.change_filters()
+            },
+            steps=[self.step_detect_changes()],
+        )
+
+    def step_detect_changes(self) -> dict[str, Any]:
+        """Build a step that matches the files changed by a pull request.
+
+        Only runs for pull requests, whose changed files are listed by the
+        GitHub API without checking out the repository.
+
+        Returns:
+            Step using `dorny/paths-filter@main` with `change_filters()`.
+        """
+        filters = [
+            line
+            for name, patterns in self.change_filters().items()
+            for line in (f"{name}:", *(f"  - '{pattern}'" for pattern in patterns))
+        ]
+        return self.step(
+            self.step_detect_changes,
+            if_condition=self.if_pull_request(),
+            uses="dorny/paths-filter@main",
+            with_={"filters": "\n".join(filters)},
+        )
+
     def repo_token_var(self) -> str:
         """Return the raw secrets expression for `REPO_TOKEN`.
 
@@ -673,6 +864,26 @@ def insert_github_token(self) -> str:
         """
         return self.insert_expression(self.github_token_var())
 
+    def insert_runner_os(self) -> str:
+        """Return the expression that resolves to the runner's operating system.
+
+        Returns:
+            GitHub Actions expression for `runner.os`.
+        """
+        return self.insert_expression("runner.os")
+
+    def insert_hash_files(self, *paths: Path) -> str:
+        """Return the expression that resolves to a hash of the given files.
+
+        Args:
+            *paths: Files to hash, relative to the project root.
+
+        Returns:
+            GitHub Actions expression calling `hashFiles` on the paths.
+        """
+        patterns = ", ".join(f"'{path.as_posix()}'" for path in paths)
+        return self.insert_expression(f"hashFiles({patterns})")
+
     def insert_matrix_os(self) -> str:
         """Return the expression that resolves to the current matrix OS value.
 
@@ -689,6 +900,14 @@ def insert_matrix_python_version(self) -> str:
         """
         return self.insert_expression("matrix.python-version")
 
+    def insert_matrix_shard(self) -> str:
+        """Return the expression that resolves to the current matrix shard index.
+
+        Returns:
+            GitHub Actions expression for `matrix.shard`.
+        """
+        return self.insert_expression("matrix.shard")
+
     def shell_insert_expression(self, var: str) -> str:
         """Wrap an expression in shell command substitution `$( ... )` syntax.
 
@@ -727,6 +946,55 @@ def if_workflow_run_is_success_and_push_triggered(self) -> str:
             operator="&&",
         )
 
+    def if_changed(self, name: str) -> str:
+        """Build a condition that is true unless a pull request skips a filter.
+
+        Jobs using it must list the `job_detect_changes()` job in `needs`.
+        Every event other than a pull request, such as a push or a scheduled
+        run, counts as a change, so those always run the full workflow.
+
+        Args:
+            name: Name of a filter from `change_filters()`.
+
+        Returns:
+            Bare GitHub Actions condition, true if the event is not a pull
+            request or the pull request changed a file of the filter.
+        """
+        job_id = self.job_id_from_method(self.job_detect_changes)
+        return self.combined_if(
+            self.if_not_pull_request(),
+            f"needs.{job_id}.outputs.{name} == 'true'",
+            operator="||",
+        )
+
+    def if_pull_request(self) -> str:
+        """Build a condition that is true when a pull request triggered the run.
+
+        Returns:
+            Bare GitHub Actions condition checking `github.event_name`.
+        """
+        return "github.event_name == 'pull_request'"
+
+    def if_not_pull_request(self) -> str:
+        """Build a condition that is true when a pull request did not trigger the run.
+
+        Returns:
+            Bare GitHub Actions condition checking `github.event_name`.
+        """
+        return "github.event_name != 'pull_request'"
+
+    def if_no_needs_failed(self) -> str:
+        """Build a condition that is true unless a needed job failed or was cancelled.
+
+        Unlike the implicit `success()` condition, a job using it still
+        runs when a needed job was skipped, e.g. by `if_changed()`.
+
+        Returns:
+            Bare GitHub Actions condition combining `failure()` and
+            `cancelled()`.
+        """
+        return "!failure() && !cancelled()"
+
     def if_workflow_run_is_success(self) -> str:
         """Build a condition that is true when the triggering workflow run succeeded.
 
@@ -1,5 +1,7 @@
 """Base classes for managing YAML configuration files."""
 
+import threading
+from io import StringIO
 from typing import Any
 
 from ruamel.yaml import YAML
@@ -7,10 +9,27 @@
 from ruamel.yaml.representer import RoundTripRepresenter
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString, LiteralScalarString
 
-from pyrig.core.strings import is_multiline, open_path_with_utf8, read_text_utf8
+from pyrig.core.strings import is_multiline, read_text_utf8, replace_text_utf8
 from pyrig.rig.configs.base.config_file import ConfigFile, DictConfigFile
 
-YAML_LOAD = YAML(typ="safe")
+YAML_INSTANCES = threading.local()
+
+
+def yaml_load() -> YAML:
+    """Return the current thread's YAML instance for parsing.
+
+    Uses the libyaml-based C parser of `ruamel.yaml.clib` whenever it is
+    installed, and the pure Python parser otherwise. A `YAML` instance keeps
+    the state of the document it is parsing, so each thread gets its own
+    instance to be safe when config files are validated concurrently.
+
+    Returns:
+        A safe-mode YAML instance, created on the thread's first call.
+    """
+    yaml = getattr(YAML_INSTANCES, "load", None)
+    if yaml is None:
+        yaml = YAML_INSTANCES.load = YAML(typ="safe")
+    return yaml
 
 
 def represent_str(representer: RoundTripRepresenter, data: str) -> ScalarNode:
@@ -34,18 +53,38 @@ def represent_str(representer: RoundTripRepresenter, data: str) -> ScalarNode:
     )
 
 
-YAML_DUMP = YAML()
-YAML_DUMP.indent(mapping=2, sequence=4, offset=2)
-YAML_DUMP.explicit_start = True
-YAML_DUMP.explicit_end = True
-YAML_DUMP.compact_seq_map = False
-YAML_DUMP.representer.add_representer(str, represent_str)
+def yaml_dump() -> YAML:
+    """Return the current thread's YAML instance for serializing.
+
+    Like `yaml_load()`, one instance per thread, since the emitter of an
+    instance shared across threads breaks when config files are dumped
+    concurrently.
+
+    Returns:
+        A round-trip YAML instance that indents sequences under their key
+        and represents strings with `represent_str()`, created on the
+        thread's first call.
+    """
+    yaml = getattr(YAML_INSTANCES, "dump", None)
+    if yaml is None:
+        # libyaml's C emitter can't indent sequences under their key or put a
+        # mapping on its own line below the `-`, so dumping keeps the pure
+        # Python emitter
+        yaml = YAML()
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        yaml.explicit_start = True
+        yaml.explicit_end = True
+        yaml.compact_seq_map = False
+        yaml.representer.add_representer(str, represent_str)
+        YAML_INSTANCES.dump = yaml
+    return yaml
 
 
 class YAMLConfigFile[ConfigT: dict[str, Any] | list[Any]](ConfigFile[ConfigT]):
     """Base class for YAML configuration files.
 
-    Parses with `ruamel.yaml`'s safe mode and serializes with its
+    Parses with `ruamel.yaml`'s safe mode, backed by the C parser of
+    `ruamel.yaml.clib` when it is available, and serializes with its
     round-trip mode; both refuse to construct or represent arbitrary Python
     objects, raising an error instead. Sequences are indented under their
     parent key, and a mapping inside a sequence item starts on its own line
@@ -78,17 +117,29 @@ class YAMLConfigFile[ConfigT: dict[str, Any] | list[Any]](ConfigFile[ConfigT]):
     """
 
     def _dump(self, configs: ConfigT) -> None:
-        """Write configuration to the YAML file, preserving key order.
+        """Atomically write configuration to the YAML file via `dumps()`.
 
         Args:
             configs: Configuration dict or list to serialize and write.
         """
-        with open_path_with_utf8(self.path(), mode="w") as f:
-            YAML_DUMP.dump(configs, f)
+        replace_text_utf8(self.path(), self.dumps(configs))
+
+    def dumps(self, configs: ConfigT) -> str:
+        """Serialize configuration to YAML, preserving key order.
+
+        Args:
+            configs: Configuration dict or list to serialize.
+
+        Returns:
+            The YAML text `_dump()` writes.
+        """
+        stream = StringIO()
+        yaml_dump().dump(configs, stream)
+        return stream.getvalue()
 
     def _load(self) -> ConfigT:
         """Read and parse the YAML file from disk, returning a dict or list."""
-        return YAML_LOAD.load(read_text_utf8(self.path()))
+        return yaml_load().load(read_text_utf8(self.path()))
 
     def extension(self) -> str:
         """Return `"yaml"`, the fixed extension for YAML files."""
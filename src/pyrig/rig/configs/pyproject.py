@@ -16,7 +16,7 @@
 )
 from pyrig.core.version import VersionConstraint, adjust_version_to_level
 from pyrig.rig import resources
-from pyrig.rig.configs.base.config_file import Priority
+from pyrig.rig.configs.base.config_file import Priority, clear_loaded_documents
 from pyrig.rig.configs.base.toml import TOMLConfigFile
 from pyrig.rig.tools.base.tool import Tool
 from pyrig.rig.tools.dependencies.checker import DependencyChecker
@@ -52,6 +52,24 @@ def validate(self) -> bool:
         dependencies = self.add_additional_dependencies()
         return correct and not dependencies
 
+    def check(self) -> list[str]:
+        """Return what `validate()` would change, including missing dependencies.
+
+        Returns:
+            The result of `ConfigFile.check()`, followed by a
+            `project.dependencies[<dependency>]` or
+            `dependency-groups.dev[<dependency>]` path for every dependency
+            `add_additional_dependencies()` would add.
+        """
+        missing = super().check()
+        if missing == [""]:
+            return missing
+        return [
+            *missing,
+            *(f"project.dependencies[{d}]" for d in self.missing_dependencies()),
+            *(f"dependency-groups.dev[{d}]" for d in self.missing_dev_dependencies()),
+        ]
+
     def merge_configs(self) -> dict[str, Any]:
         """Merge into the required configuration.
 
@@ -182,8 +200,25 @@ def tool_configs(self) -> dict[str, Any]:
                     "docstring-code-format": True,
                 },
             },
+            **self.coverage_configs(),
         }
 
+    def coverage_configs(self) -> dict[str, Any]:
+        """Assemble the required `tool.coverage` section, if any.
+
+        When the test suite is sharded (see `ProjectTester.shards()`), CI
+        combines the coverage data of runners on different operating
+        systems, which requires the data to record paths relative to the
+        project root.
+
+        Returns:
+            The `coverage` tool section if the test suite is sharded,
+            otherwise an empty dict.
+        """
+        if ProjectTester.I.shards() == 1:
+            return {}
+        return {"coverage": {"run": {"relative_files": True}}}
+
     def parent_path(self) -> Path:
         """Return the project root directory."""
         return Path()
@@ -209,42 +244,65 @@ def add_additional_dependencies(self) -> tuple[str, ...]:
         Compares the project's dependencies against
         `Pyrigger.I.runtime_dependencies()`, and its dev dependencies against
         `Tool.subclasses_dev_dependencies()`. Anything missing is added via
-        the package manager, the environment is synced so the new packages
-        are actually installed, then the file is reloaded and re-dumped so
+        the package manager in a single reconciliation: missing dev and then
+        runtime dependencies are added, each resolved so they are written
+        with the lower bound of their locked version but without installing
+        anything, and the environment is synced once so the new packages are
+        actually installed. Finally the file is reloaded and dumped once, so
         its formatting matches pyrig's conventions again.
 
         Returns:
             The dependencies that were added, empty if none were missing.
         """
+        dependencies = self.missing_dependencies()
+        dev_dependencies = self.missing_dev_dependencies()
+        if not dependencies and not dev_dependencies:
+            return ()
+
+        if dev_dependencies:
+            PackageManager.I.add_group_dev_without_syncing_args(
+                *dev_dependencies,
+            ).run()
+        if dependencies:
+            PackageManager.I.add_without_syncing_args(*dependencies).run()
+        PackageManager.I.install_dependencies().run()
+        clear_loaded_documents(self.path())
+        self.dump(self.load())
+        return (*dependencies, *dev_dependencies)
+
+    def missing_dependencies(self) -> tuple[str, ...]:
+        """Return the required runtime dependencies the project does not declare.
+
+        Returns:
+            Each of `Pyrigger.I.runtime_dependencies()` whose distribution is
+            not among `dependencies()`.
+        """
         current_dependencies = set(
             map(distribution_requirement_as_module_name, self.dependencies()),
         )
-        dependencies = tuple(
+        return tuple(
             dependency
             for dependency in Pyrigger.I.runtime_dependencies()
             if distribution_requirement_as_module_name(dependency)
             not in current_dependencies
         )
 
+    def missing_dev_dependencies(self) -> tuple[str, ...]:
+        """Return the required dev dependencies the project does not declare.
+
+        Returns:
+            Each of `Tool.subclasses_dev_dependencies()` whose distribution is
+            not among `dev_dependencies()`.
+        """
         current_dev_dependencies = set(
             map(distribution_requirement_as_module_name, self.dev_dependencies()),
         )
-        dev_dependencies = tuple(
+        return tuple(
             dependency
             for dependency in Tool.subclasses_dev_dependencies()
             if distribution_requirement_as_module_name(dependency)
             not in current_dev_dependencies
         )
-        if dependencies:
-            PackageManager.I.add_args(*dependencies).run()
-        if dev_dependencies:
-            PackageManager.I.add_group_dev_args(*dev_dependencies).run()
-        if dependencies or dev_dependencies:
-            PackageManager.I.install_dependencies().run()
-            self.load.cache_clear()
-            self.dump(self.load())
-
-        return (*dependencies, *dev_dependencies)
 
     def dependencies(self) -> list[str]:
         """Read runtime dependencies from `pyproject.toml`.
@@ -26,7 +26,9 @@ def job(  # noqa: PLR0913
         strategy: dict[str, Any] | None = None,
         permissions: dict[str, Any] | None = None,
         runs_on: str = WorkflowConfigFile.UBUNTU_LATEST,
+        timeout_minutes: int | str | None = None,
         if_condition: str | None = None,
+        outputs: dict[str, str] | None = None,
         steps: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Build a job, defaulting `if_condition` to a success-gate condition.
@@ -45,9 +47,25 @@ def job(  # noqa: PLR0913
             strategy=strategy,
             permissions=permissions,
             runs_on=runs_on,
+            timeout_minutes=timeout_minutes,
+            outputs=outputs,
             steps=steps,
         )
 
+    def concurrency_group(self) -> str:
+        """Return one concurrency group for all deployments of the branch.
+
+        Deployments never overlap, and a queued deployment is replaced by a
+        newer one, as only the latest documentation needs to be published.
+
+        Returns:
+            Expression combining the workflow name and the branch ref.
+        """
+        return (
+            f"{self.insert_expression('github.workflow')}"
+            f"-{self.insert_expression('github.ref')}"
+        )
+
     def jobs(self) -> dict[str, Any]:
         """Build the top-level jobs configuration.
 
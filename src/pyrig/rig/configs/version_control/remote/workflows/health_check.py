@@ -2,8 +2,16 @@
 
 from typing import Any, Literal
 
+from pyrig.rig.cli.subcommands import (
+    quick_tests,
+    record_test_durations,
+    shard_tests,
+    shard_timeout,
+)
 from pyrig.rig.configs.base.workflow import WorkflowConfigFile
+from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.tools.packages.manager import PackageManager
+from pyrig.rig.tools.pyrigger import Pyrigger
 from pyrig.rig.tools.testing.project import ProjectTester
 from pyrig.rig.tools.version_control.hooks.manager import (
     VersionControlHookManager,
@@ -22,15 +30,82 @@ def jobs(self) -> dict[str, Any]:
         """Return all jobs for the health check workflow.
 
         Returns:
-            Dict combining the quality-check job, the matrix test job, and
-            the job that aggregates their results.
+            Dict combining the job that detects the changed files, the
+            quality-check job, the matrix test job, the job that combines
+            the coverage of its shards if the test suite is sharded, the job
+            that records the test durations if they are used, and the job
+            that aggregates their results.
         """
         jobs: dict[str, Any] = {}
+        jobs.update(self.job_detect_changes())
         jobs.update(self.job_health_checks())
         jobs.update(self.job_matrix_health_checks())
+        if self.shards() is not None:
+            jobs.update(self.job_combined_coverage())
+        if self.records_test_durations():
+            jobs.update(self.job_record_test_durations())
         jobs.update(self.job_health_check())
         return jobs
 
+    def shards(self) -> int | None:
+        """Return how many shards each matrix test job is split into.
+
+        Returns:
+            `ProjectTester.I.shards()`, or None if the test suite is not
+            sharded.
+        """
+        shards = ProjectTester.I.shards()
+        return shards if shards > 1 else None
+
+    def change_filters(self) -> dict[str, list[str]]:
+        """Return the paths whose changes require running the test suite.
+
+        Pull requests that only change other files, such as the
+        documentation or the issue templates, skip the matrix test job.
+        The quality-check job always runs, as its hooks check every file.
+
+        Returns:
+            A `tests` filter matching the source and tests packages, the
+            project and lock files, and this workflow file.
+        """
+        return {
+            "tests": [
+                f"{PackageManager.I.source_root().as_posix()}/**",
+                f"{ProjectTester.I.package_root().as_posix()}/**",
+                PyprojectConfigFile.I.path().as_posix(),
+                PackageManager.I.lock_file().as_posix(),
+                self.path().as_posix(),
+            ],
+        }
+
+    def canary(self) -> bool:
+        """Return whether the quality-check job is a canary for the test matrix.
+
+        Subclasses may override this to return True, so a broken commit
+        fails on a single runner within minutes instead of on every cell of
+        the matrix. The quality-check job then also runs the quickest test
+        files (see `ProjectTester.quick_tests_seconds()`), stopping at the
+        first failure, and the matrix test job only starts once it passed.
+        The matrix test job's timeout is then derived from the recorded
+        test durations. Until a run has recorded them, the quick tests are
+        skipped and the timeout stays at GitHub's default.
+
+        Returns:
+            False, which starts the matrix test job right away.
+        """
+        return False
+
+    def records_test_durations(self) -> bool:
+        """Return whether the matrix test job records the test durations.
+
+        The durations balance the test shards and select the canary's quick
+        tests, so they are recorded whenever either is used.
+
+        Returns:
+            True if the test suite is sharded or `canary()` is True.
+        """
+        return self.shards() is not None or self.canary()
+
     def stem(self) -> str:
         """Return `"health_check"`, the workflow file's stem."""
         return "health_check"
@@ -73,21 +148,28 @@ def cron_schedule(
     def job_health_check(self) -> dict[str, Any]:
         """Return the fan-in aggregation job.
 
-        Depends on the other two jobs completing successfully; its outcome
-        is relied on elsewhere as the sole indicator of whether the health
-        check as a whole passed.
+        Depends on the other jobs completing successfully; its outcome is
+        relied on elsewhere as the sole indicator of whether the health
+        check as a whole passed. It still runs when the matrix test job was
+        skipped because a pull request did not change the tested files.
 
         Returns:
-            Job configuration with `needs` set to both sibling jobs and a
+            Job configuration with `needs` set to all sibling jobs, a
+            condition that only fails on failed or cancelled jobs, and a
             single aggregation step.
         """
-        matrix_health_checks_job_id = self.job_id_from_method(
-            self.job_matrix_health_checks,
-        )
-        health_checks_job_id = self.job_id_from_method(self.job_health_checks)
+        needs = [
+            self.job_id_from_method(self.job_health_checks),
+            self.job_id_from_method(self.job_matrix_health_checks),
+        ]
+        if self.shards() is not None:
+            needs.append(self.job_id_from_method(self.job_combined_coverage))
+        if self.records_test_durations():
+            needs.append(self.job_id_from_method(self.job_record_test_durations))
         return self.job(
             self.job_health_check,
-            needs=[health_checks_job_id, matrix_health_checks_job_id],
+            needs=needs,
+            if_condition=self.if_no_needs_failed(),
             steps=self.steps_aggregate_jobs(),
         )
 
@@ -116,13 +198,24 @@ def job_health_checks(self) -> dict[str, Any]:
         """Return the single-runner job that applies all code quality checks.
 
         Runs on a single Ubuntu runner (no matrix) and runs every configured
-        pre-commit hook, including a dependency vulnerability audit.
+        pre-commit hook, including a dependency vulnerability audit. If it
+        is a canary (see `canary()`), it also runs the quick tests and
+        outputs the matrix test job's timeout.
 
         Returns:
             Job configuration with steps for the full quality check sequence.
         """
+        outputs = None
+        if self.canary():
+            step_id = self.step_id_from_method(self.step_shard_timeout)
+            outputs = {
+                "timeout-minutes": self.insert_expression(
+                    f"steps.{step_id}.outputs.minutes",
+                ),
+            }
         return self.job(
             self.job_health_checks,
+            outputs=outputs,
             steps=self.steps_health_checks(),
         )
 
@@ -130,14 +223,68 @@ def steps_health_checks(self) -> list[dict[str, Any]]:
         """Return the steps for the single-runner quality check job.
 
         Returns:
-            Steps that install dependencies and run the configured
-            pre-commit hooks.
+            Steps that install dependencies, run the quick tests if the job
+            is a canary, and run the configured pre-commit hooks.
         """
         return [
             *self.steps_core_installed_setup(update_dependencies=True),
+            *(self.steps_canary() if self.canary() else ()),
             self.step_run_version_control_hooks(),
         ]
 
+    def steps_canary(self) -> list[dict[str, Any]]:
+        """Return the steps that make the quality-check job a canary.
+
+        Returns:
+            Steps that restore the recorded test durations, run the quick
+            tests, and output the matrix test job's timeout.
+        """
+        return [
+            self.step_restore_test_durations(),
+            self.step_run_quick_tests(),
+            self.step_shard_timeout(),
+        ]
+
+    def step_run_quick_tests(self) -> dict[str, Any]:
+        """Build a step that runs the quickest test files, failing fast.
+
+        Skipped if no test durations were restored, as `pyrig quick-tests`
+        then lists no files and pytest would run the whole suite.
+
+        Returns:
+            Step that runs pytest on the files listed by `pyrig quick-tests`.
+        """
+        files = PackageManager.I.run_args(*Pyrigger.I.cmd_args(cmd=quick_tests))
+        run = PackageManager.I.run_args(
+            *ProjectTester.I.quick_test_args(self.shell_insert_expression(str(files))),
+        )
+        restore_id = self.step_id_from_method(self.step_restore_test_durations)
+        return self.step(
+            self.step_run_quick_tests,
+            if_condition=self.insert_expression(
+                f"steps.{restore_id}.outputs.cache-matched-key != ''",
+            ),
+            run=str(run),
+        )
+
+    def step_shard_timeout(self) -> dict[str, Any]:
+        """Build a step that writes the matrix test job's timeout to `GITHUB_OUTPUT`.
+
+        Returns:
+            Step that appends `minutes=<timeout>`, computed by
+            `pyrig shard-timeout` from the recorded test durations, to the
+            `$GITHUB_OUTPUT` file.
+        """
+        shards = str(ProjectTester.I.shards())
+        timeout = PackageManager.I.run_args(
+            *Pyrigger.I.cmd_args(shards, cmd=shard_timeout),
+        )
+        minutes = self.shell_insert_expression(str(timeout))
+        return self.step(
+            self.step_shard_timeout,
+            run=f'echo "minutes={minutes}" >> $GITHUB_OUTPUT',
+        )
+
     def step_run_version_control_hooks(self) -> dict[str, Any]:
         """Build a step that runs all pre-commit hooks via prek.
 
@@ -157,15 +304,29 @@ def job_matrix_health_checks(self) -> dict[str, Any]:
         """Return the matrix job that runs the test suite across environments.
 
         Uses a strategy matrix combining the default operating systems with
-        every Python version the project supports.
+        every Python version the project supports, and with the test shards
+        if the test suite is sharded. Skipped for pull requests that do not
+        change any file of the `tests` change filter. If the quality-check
+        job is a canary, waits for it and uses the timeout it outputs.
 
         Returns:
             Job configuration with a matrix strategy, dynamic `runs-on`
             value, and steps for setup and testing.
         """
+        needs = [self.job_id_from_method(self.job_detect_changes)]
+        timeout_minutes = None
+        if self.canary():
+            canary_job_id = self.job_id_from_method(self.job_health_checks)
+            needs.append(canary_job_id)
+            timeout_minutes = self.insert_expression(
+                f"fromJSON(needs.{canary_job_id}.outputs.timeout-minutes)",
+            )
         return self.job(
             self.job_matrix_health_checks,
-            strategy=self.strategy_matrix_os_and_python_version(),
+            needs=needs,
+            timeout_minutes=timeout_minutes,
+            if_condition=self.if_changed("tests"),
+            strategy=self.strategy_matrix_os_and_python_version(shards=self.shards()),
             runs_on=self.insert_matrix_os(),
             steps=self.steps_matrix_health_checks(),
         )
@@ -175,23 +336,285 @@ def steps_matrix_health_checks(self) -> list[dict[str, Any]]:
 
         Returns:
             Steps that set up the environment for the current matrix OS and
-            Python version and run the test suite.
+            Python version and run the test suite, or the current shard of
+            it, uploading the results if the test durations are recorded.
+        """
+        steps = self.steps_core_installed_setup(
+            python_version=self.insert_matrix_python_version(),
+            update_dependencies=True,
+        )
+        if self.shards() is not None:
+            steps.extend(self.steps_run_test_shard())
+        else:
+            steps.append(self.step_run_tests())
+            if self.records_test_durations():
+                steps.append(self.step_upload_test_results())
+        return steps
+
+    def steps_run_test_shard(self) -> list[dict[str, Any]]:
+        """Return the steps that run the current shard of the test suite.
+
+        Returns:
+            Steps that restore the recorded test durations, list the shard's
+            test files, run them, and upload their coverage data and timings.
         """
         return [
-            *self.steps_core_installed_setup(
-                python_version=self.insert_matrix_python_version(),
-                update_dependencies=True,
-            ),
-            self.step_run_tests(),
+            self.step_restore_test_durations(),
+            self.step_shard_files(),
+            self.step_run_test_shard(),
+            self.step_upload_test_results(),
+        ]
+
+    def step_restore_test_durations(self) -> dict[str, Any]:
+        """Build a step that restores the test durations recorded by the last run.
+
+        Returns:
+            Step using `actions/cache/restore@main`.
+        """
+        return self.step(
+            self.step_restore_test_durations,
+            uses="actions/cache/restore@main",
+            with_={
+                "path": ProjectTester.I.durations_path().as_posix(),
+                "key": self.durations_cache_key(),
+                "restore-keys": self.durations_cache_prefix(),
+            },
+        )
+
+    def step_shard_files(self) -> dict[str, Any]:
+        """Build a step that writes the current shard's test files to `GITHUB_OUTPUT`.
+
+        Returns:
+            Step that appends `files=<files>`, listed by `pyrig shard-tests`,
+            to the `$GITHUB_OUTPUT` file.
+        """
+        shards = str(self.shards())
+        files = PackageManager.I.run_args(
+            *Pyrigger.I.cmd_args(self.insert_matrix_shard(), shards, cmd=shard_tests),
+        )
+        files = self.shell_insert_expression(str(files))
+        return self.step(
+            self.step_shard_files,
+            run=f'echo "files={files}" >> $GITHUB_OUTPUT',
+        )
+
+    def step_run_test_shard(self) -> dict[str, Any]:
+        """Build a step that runs the current matrix shard of the test suite.
+
+        Skipped if the shard has no test files, which happens when there are
+        fewer test files than shards, as pytest would then run the whole
+        suite.
+
+        Returns:
+            Step that runs pytest on the files listed by `step_shard_files()`.
+        """
+        step_id = self.step_id_from_method(self.step_shard_files)
+        files = f"steps.{step_id}.outputs.files"
+        run = PackageManager.I.run_args(
+            *ProjectTester.I.shard_test_args(self.insert_expression(files)),
+        )
+        return self.step(
+            self.step_run_test_shard,
+            if_condition=self.insert_expression(f"{files} != ''"),
+            run=str(run),
+        )
+
+    def step_upload_test_results(self) -> dict[str, Any]:
+        """Build a step that uploads the coverage data and timings of a test run.
+
+        Returns:
+            Step using `actions/upload-artifact@main`, named after the
+            current matrix cell.
+        """
+        matrix_values = [
+            self.insert_matrix_os(),
+            self.insert_matrix_python_version(),
+        ]
+        if self.shards() is not None:
+            matrix_values.append(self.insert_matrix_shard())
+        paths = (
+            ProjectTester.I.coverage_data_path(),
+            ProjectTester.I.junit_report_path(),
+        )
+        return self.step(
+            self.step_upload_test_results,
+            uses="actions/upload-artifact@main",
+            with_={
+                "name": self.test_results_artifact_prefix() + "-".join(matrix_values),
+                "path": "\n".join(path.as_posix() for path in paths),
+                "include-hidden-files": "true",
+            },
+        )
+
+    def job_combined_coverage(self) -> dict[str, Any]:
+        """Return the job that combines the results of all test shards.
+
+        Returns:
+            Job configuration that depends on the matrix test job.
+        """
+        return self.job(
+            self.job_combined_coverage,
+            needs=[self.job_id_from_method(self.job_matrix_health_checks)],
+            steps=self.steps_combined_coverage(),
+        )
+
+    def steps_combined_coverage(self) -> list[dict[str, Any]]:
+        """Return the steps for the job that combines the test shard results.
+
+        Returns:
+            Steps that download the results of every shard and enforce the
+            coverage threshold on their combined coverage data.
+        """
+        return [
+            *self.steps_core_installed_setup(),
+            self.step_download_test_results(),
+            self.step_combine_coverage(),
+            self.step_report_coverage(),
         ]
 
+    def job_record_test_durations(self) -> dict[str, Any]:
+        """Return the job that records the test durations of the matrix runs.
+
+        Returns:
+            Job configuration that depends on the matrix test job.
+        """
+        return self.job(
+            self.job_record_test_durations,
+            needs=[self.job_id_from_method(self.job_matrix_health_checks)],
+            steps=self.steps_record_test_durations(),
+        )
+
+    def steps_record_test_durations(self) -> list[dict[str, Any]]:
+        """Return the steps for the job that records the test durations.
+
+        Returns:
+            Steps that download the results of every matrix run, record
+            their test durations, and cache them for later runs.
+        """
+        return [
+            *self.steps_core_installed_setup(),
+            self.step_download_test_results(),
+            self.step_record_test_durations(),
+            self.step_save_test_durations(),
+        ]
+
+    def step_download_test_results(self) -> dict[str, Any]:
+        """Build a step that downloads the results of every matrix test run.
+
+        Each run's results end up in their own directory under
+        `test_results_dir()`.
+
+        Returns:
+            Step using `actions/download-artifact@main`.
+        """
+        return self.step(
+            self.step_download_test_results,
+            uses="actions/download-artifact@main",
+            with_={
+                "pattern": f"{self.test_results_artifact_prefix()}*",
+                "path": self.test_results_dir(),
+            },
+        )
+
+    def step_combine_coverage(self) -> dict[str, Any]:
+        """Build a step that combines the coverage data of every test shard.
+
+        Returns:
+            Step that runs `coverage combine` on the downloaded data files.
+        """
+        data = ProjectTester.I.coverage_data_path().as_posix()
+        files = f"{self.test_results_dir()}/*/{data}"
+        return self.step(
+            self.step_combine_coverage,
+            run=str(
+                PackageManager.I.run_args(
+                    *ProjectTester.I.combine_coverage_args(files),
+                ),
+            ),
+        )
+
+    def step_report_coverage(self) -> dict[str, Any]:
+        """Build a step that enforces the coverage threshold on all shards.
+
+        Returns:
+            Step that runs `coverage report` with the project's threshold.
+        """
+        return self.step(
+            self.step_report_coverage,
+            run=str(PackageManager.I.run_args(*ProjectTester.I.report_coverage_args())),
+        )
+
+    def step_record_test_durations(self) -> dict[str, Any]:
+        """Build a step that records the test durations of every matrix run.
+
+        Returns:
+            Step that runs `pyrig record-test-durations` on the downloaded
+            JUnit reports.
+        """
+        report = ProjectTester.I.junit_report_path().as_posix()
+        reports = f"{self.test_results_dir()}/*/{report}"
+        return self.step(
+            self.step_record_test_durations,
+            run=str(
+                PackageManager.I.run_args(
+                    *Pyrigger.I.cmd_args(reports, cmd=record_test_durations),
+                ),
+            ),
+        )
+
+    def step_save_test_durations(self) -> dict[str, Any]:
+        """Build a step that saves the recorded test durations for later runs.
+
+        Returns:
+            Step using `actions/cache/save@main`.
+        """
+        return self.step(
+            self.step_save_test_durations,
+            uses="actions/cache/save@main",
+            with_={
+                "path": ProjectTester.I.durations_path().as_posix(),
+                "key": self.durations_cache_key(),
+            },
+        )
+
+    def test_results_artifact_prefix(self) -> str:
+        """Return the prefix of the artifact names of the matrix test results."""
+        return "test-results-"
+
+    def test_results_dir(self) -> str:
+        """Return the directory the matrix test results are downloaded to."""
+        return "test-results"
+
+    def durations_cache_prefix(self) -> str:
+        """Return the prefix of the cache keys of the recorded test durations."""
+        return "test-durations-"
+
+    def durations_cache_key(self) -> str:
+        """Return the cache key the test durations of this run are saved under.
+
+        Unique per workflow run, so each run saves its own durations and the
+        next run restores the most recent ones by their common prefix.
+
+        Returns:
+            `durations_cache_prefix()` followed by the run's ID.
+        """
+        return self.durations_cache_prefix() + self.insert_expression(
+            "github.run_id",
+        )
+
     def step_run_tests(self) -> dict[str, Any]:
         """Build a step that runs the test suite with pytest.
 
         Returns:
-            Step that runs `uv run pytest`.
+            Step that runs `uv run pytest`, writing a JUnit report if the
+            test durations are recorded.
         """
-        run = str(PackageManager.I.run_args(*ProjectTester.I.test_args()))
+        args = (
+            ProjectTester.I.junit_test_args()
+            if self.records_test_durations()
+            else ProjectTester.I.test_args()
+        )
+        run = str(PackageManager.I.run_args(*args))
         return self.step(
             self.step_run_tests,
             run=run,
@@ -33,7 +33,9 @@ def job(  # noqa: PLR0913
         strategy: dict[str, Any] | None = None,
         permissions: dict[str, Any] | None = None,
         runs_on: str = WorkflowConfigFile.UBUNTU_LATEST,
+        timeout_minutes: int | str | None = None,
         if_condition: str | None = None,
+        outputs: dict[str, str] | None = None,
         steps: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Build a job gated by default on a successful, push-triggered run.
@@ -44,9 +46,12 @@ def job(  # noqa: PLR0913
             strategy: Matrix or other strategy configuration.
             permissions: Job-level permissions override.
             runs_on: Runner label. Defaults to `ubuntu-latest`.
+            timeout_minutes: Minutes after which GitHub cancels the job.
             if_condition: GitHub Actions conditional expression controlling
                 whether the job runs. Defaults to requiring the triggering
                 run to have succeeded and been push-triggered.
+            outputs: Job outputs, mapping output names to the expressions
+                they resolve to.
             steps: Ordered list of step configurations.
 
         Returns:
@@ -61,7 +66,9 @@ def job(  # noqa: PLR0913
             strategy=strategy,
             permissions=permissions,
             runs_on=runs_on,
+            timeout_minutes=timeout_minutes,
             if_condition=if_condition,
+            outputs=outputs,
             steps=steps,
         )
 
@@ -4,34 +4,24 @@
 corresponding test counterpart, without overwriting tests that already exist.
 """
 
-import inspect
+import ast
+import hashlib
 from abc import abstractmethod
-from collections.abc import Hashable, Iterable, Iterator
+from collections.abc import Hashable, Iterator
 from pathlib import Path
-from types import FunctionType, ModuleType
+from types import ModuleType
 from typing import Any, Self
 
 from pyrig_runtime.core.introspection.classes import generate_class
-from pyrig_runtime.core.introspection.functions import (
-    filter_module_functions,
-)
-from pyrig_runtime.core.introspection.inspection import obj_members
 
-from pyrig.core.introspection.classes import (
-    cls_methods,
-    filter_direct_methods,
-    filter_module_classes,
-)
-from pyrig.core.introspection.inspection import (
-    def_line_sorted,
-    unwrap_cls,
-    unwrap_func,
-)
-from pyrig.core.introspection.modules import (
-    import_module_with_file_fallback,
-    leaf_module_name,
+from pyrig.core.introspection.definitions import (
+    class_defs,
+    function_defs,
+    parse_source,
+    source_with_line_insertions,
 )
-from pyrig.core.introspection.paths import module_name_as_path
+from pyrig.core.introspection.modules import leaf_module_name, module_content
+from pyrig.core.introspection.paths import module_file_path, module_name_as_path
 from pyrig.core.iterate import iterator_has_items
 from pyrig.core.strings import reformat_name
 from pyrig.rig import tests
@@ -45,7 +35,8 @@ class MirrorTestConfigFile(PythonPackageConfigFile):
     Each concrete subclass is bound to a single source module. Its content
     appends test skeletons for any function, class, or method in that source
     module that has no corresponding test yet, leaving existing test code
-    untouched.
+    untouched. Both modules are analyzed from their source with `ast`, so
+    neither is ever imported or executed.
 
     Subclasses must implement:
         - `mirror_module`: Return the source module whose structure should be
@@ -56,9 +47,10 @@ class MirrorTestConfigFile(PythonPackageConfigFile):
     def mirror_module(self) -> ModuleType:
         """Return the source module whose structure will be mirrored in the test file.
 
-        The base class inspects this module's functions, classes, and methods
-        to generate missing test skeletons, and derives the test file's name
-        and path from its dotted name. Subclasses must implement this to
+        The base class reads this module's functions, classes, and methods
+        from its source file to generate missing test skeletons, and derives
+        the test file's name and path from its dotted name. The module does
+        not need to have been executed. Subclasses must implement this to
         specify which module to mirror.
 
         Returns:
@@ -78,43 +70,46 @@ def merge_key(cls) -> Hashable:
         """
         return MirrorTestConfigFile.__name__
 
-    def create_file(self) -> None:
-        """Create the test file with its default module docstring as content.
+    def fingerprint(self) -> str:
+        """Return a hash of the test file and of the source module it mirrors.
+
+        Whether a test file is correct depends on its source module, and its
+        `configs()` already does all the work of `is_correct()`, so the hash
+        covers the source file's bytes instead. A commit that touches neither
+        file then skips the module without parsing either of them.
 
-        Also registers the newly created module in `sys.modules`.
+        Returns:
+            Hex SHA-256 digest of the test file's bytes, the source file's
+            bytes, and the test name prefixes.
         """
+        digest = hashlib.sha256(self.path().read_bytes())
+        digest.update(module_file_path(self.mirror_module()).read_bytes())
+        digest.update(f"{self.test_func_prefix()}:{self.test_cls_prefix()}".encode())
+        return digest.hexdigest()
+
+    def create_file(self) -> None:
+        """Create the test file with its default module docstring as content."""
         super().create_file()
         self.write_content(self.test_module_docstring())
-        import_module_with_file_fallback(self.path(), name=self.test_module_name())
 
-    def is_correct(self) -> bool:
-        """Check whether every source function and method has a corresponding test.
+    def missing_paths(self) -> list[str]:
+        """Return the name of every missing test for a source function or method.
 
         Returns:
-            `True` if no source function or method is missing a test; `False`
-            otherwise.
+            Missing test function names (e.g. `"test_foo"`), followed by
+            missing test method names qualified by their test class (e.g.
+            `"TestFoo.test_bar"`), each in source definition order.
         """
-        module, test_module, module_members, test_module_members = (
-            self.modules_and_members()
-        )
-        return not (
-            any(
-                self.untested_func_names(
-                    module=module,
-                    test_module=test_module,
-                    module_members=module_members,
-                    test_module_members=test_module_members,
-                ),
-            )
-            or any(
-                self.untested_class_and_method_names(
-                    module=module,
-                    test_module=test_module,
-                    module_members=module_members,
-                    test_module_members=test_module_members,
-                ),
-            )
-        )
+        source_tree = self.source_tree()
+        test_tree = parse_source(self.read_content())
+        missing = list(self.untested_func_names(source_tree, test_tree))
+        for (
+            test_class_name,
+            test_method_names,
+            _,
+        ) in self.untested_class_and_method_names(source_tree, test_tree):
+            missing.extend(f"{test_class_name}.{name}" for name in test_method_names)
+        return missing
 
     def content(self) -> str:
         """Return the complete test module content.
@@ -231,60 +226,34 @@ def test_module_content_with_skeletons(self) -> str:
             test implementations.
         """
         test_module_content = self.read_content()
-        module, test_module, module_members, test_module_members = (
-            self.modules_and_members()
-        )
+        source_tree = self.source_tree()
         test_module_content = self.test_module_content_with_func_skeletons(
             test_module_content,
-            module=module,
-            test_module=test_module,
-            module_members=module_members,
-            test_module_members=test_module_members,
+            source_tree,
         )
         return self.test_module_content_with_class_skeletons(
             test_module_content,
-            module=module,
-            test_module=test_module,
-            module_members=module_members,
-            test_module_members=test_module_members,
+            source_tree,
         )
 
-    def modules_and_members(
-        self,
-    ) -> tuple[ModuleType, ModuleType, tuple[Any], tuple[Any]]:
-        """Return the source and test modules along with their members.
+    def source_tree(self) -> ast.Module:
+        """Return the syntax tree of the source module, parsed from its file.
 
         Returns:
-            A tuple containing:
-                - The source module to mirror.
-                - The test module corresponding to the source module.
-                - Tuple of members of the source module.
-                - Tuple of members of the test module.
+            The parsed source of `mirror_module()`.
         """
-        module, test_module = self.mirror_module(), self.module()
-        return (
-            module,
-            test_module,
-            tuple(obj_members(module)),
-            tuple(obj_members(test_module)),
-        )
+        return parse_source(module_content(self.mirror_module()))
 
     def test_module_content_with_func_skeletons(
         self,
         test_module_content: str,
-        module: ModuleType,
-        test_module: ModuleType,
-        module_members: Iterable[Any],
-        test_module_members: Iterable[Any],
+        source_tree: ast.Module,
     ) -> str:
         """Append function skeletons for all untested source functions.
 
         Args:
             test_module_content: Existing test module content to extend.
-            module: The source module to mirror.
-            test_module: The test module corresponding to the source module.
-            module_members: Members of the source module.
-            test_module_members: Members of the test module.
+            source_tree: Syntax tree of the source module to mirror.
 
         Returns:
             Test module content with new function skeletons appended at the end.
@@ -292,39 +261,32 @@ def test_module_content_with_func_skeletons(
         return test_module_content + "".join(
             self.test_func_skeleton(name)
             for name in self.untested_func_names(
-                module=module,
-                test_module=test_module,
-                module_members=module_members,
-                test_module_members=test_module_members,
+                source_tree,
+                parse_source(test_module_content),
             )
         )
 
     def untested_func_names(
         self,
-        module: ModuleType,
-        test_module: ModuleType,
-        module_members: Iterable[Any],
-        test_module_members: Iterable[Any],
+        source_tree: ast.Module,
+        test_tree: ast.Module,
     ) -> Iterator[str]:
         """Yield test function names for functions that have no corresponding test.
 
         Names are yielded in the source function's definition order.
 
         Args:
-            module: The source module to mirror.
-            test_module: The test module corresponding to the source module.
-            module_members: Members of the source module.
-            test_module_members: Members of the test module.
+            source_tree: Syntax tree of the source module to mirror.
+            test_tree: Syntax tree of the test module.
 
         Yields:
             Expected test function name (e.g., `"test_foo"`) for each source
             function that has no matching test function.
         """
-        funcs = def_line_sorted(filter_module_functions(module, module_members))
-        test_funcs = filter_module_functions(test_module, test_module_members)
-
-        supposed_test_func_names = (self.test_func_name(unwrap_func(f)) for f in funcs)
-        actual_test_func_names = {unwrap_func(f).__name__ for f in test_funcs}
+        supposed_test_func_names = (
+            self.test_func_name(f.name) for f in function_defs(source_tree)
+        )
+        actual_test_func_names = {f.name for f in function_defs(test_tree)}
 
         return (f for f in supposed_test_func_names if f not in actual_test_func_names)
 
@@ -350,134 +312,93 @@ def {test_func_name}() -> None:
     def test_module_content_with_class_skeletons(
         self,
         test_module_content: str,
-        module: ModuleType,
-        test_module: ModuleType,
-        module_members: Iterable[Any],
-        test_module_members: Iterable[Any],
+        source_tree: ast.Module,
     ) -> str:
         """Insert class and method skeletons for untested source classes.
 
-        For each untested source class, method skeletons are placed inside the
-        existing test class body if one is already present in the content, or
-        into a newly appended test class otherwise. An existing class is located
-        by its exact current source text (rather than a line number or a
-        hardcoded skeleton shape), so the insertion point does not depend on the
-        class's docstring, decorators, or any other content already inside it,
-        and stays correct even when several classes in the same file need new
-        methods in the same pass.
+        For each untested source class, method skeletons are placed at the end
+        of the existing test class body if one is already present in the
+        content, or into a newly appended test class otherwise. Existing
+        classes are located by the end line of their definition in a single
+        parse of the content, and all insertions are applied in a single pass,
+        so the cost stays linear in the size of the test module however many
+        classes need new methods.
 
         Args:
             test_module_content: Existing test module content to extend.
-            module: The source module to mirror.
-            test_module: The test module corresponding to the source module.
-            module_members: Members of the source module.
-            test_module_members: Members of the test module.
+            source_tree: Syntax tree of the source module to mirror.
 
         Returns:
             Test module content with all missing class and method skeletons inserted.
         """
+        insertions: dict[int, str] = {}
+        new_test_classes: list[str] = []
         for (
             test_class_name,
             test_method_names,
-            source,
+            end_line,
         ) in self.untested_class_and_method_names(
-            module=module,
-            test_module=test_module,
-            module_members=module_members,
-            test_module_members=test_module_members,
+            source_tree,
+            parse_source(test_module_content),
         ):
-            source_exists = source is not None
-
-            test_cls_skeleton = (
-                source if source_exists else self.test_class_skeleton(test_class_name)
-            )
-
-            test_cls_content = test_cls_skeleton + "".join(
+            test_method_skeletons = "".join(
                 self.test_method_skeleton(name) for name in test_method_names
             )
-            if source_exists:
-                test_module_content = test_module_content.replace(
-                    source.strip(),
-                    test_cls_content.strip(),
-                    1,
+            if end_line is None:
+                new_test_classes.append(
+                    self.test_class_skeleton(test_class_name) + test_method_skeletons,
                 )
                 continue
-            test_module_content += test_cls_content
+            # the class's own last line break ends up after the new methods
+            insertions[end_line] = "\n" + test_method_skeletons.removesuffix("\n")
 
-        return test_module_content
+        return source_with_line_insertions(test_module_content, insertions) + "".join(
+            new_test_classes,
+        )
 
     def untested_class_and_method_names(
         self,
-        module: ModuleType,
-        test_module: ModuleType,
-        module_members: Iterable[Any],
-        test_module_members: Iterable[Any],
-    ) -> Iterator[tuple[str, Iterator[str], str | None]]:
+        source_tree: ast.Module,
+        test_tree: ast.Module,
+    ) -> Iterator[tuple[str, Iterator[str], int | None]]:
         """Yield test class/method pairs for source classes that have untested methods.
 
-        Only methods defined directly on a source class are considered; inherited
-        methods are excluded. A source class is omitted entirely if it has no
-        methods of its own or if every one of its methods already has a test.
+        Only methods defined directly in a source class's body are considered;
+        inherited methods are excluded. A source class is omitted entirely if
+        it has no methods of its own or if every one of its methods already
+        has a test.
 
         Classes are yielded in source definition order.
 
         Args:
-            module: The source module to mirror.
-            test_module: The test module corresponding to the source module.
-            module_members: Members of the source module.
-            test_module_members: Members of the test module.
+            source_tree: Syntax tree of the source module to mirror.
+            test_tree: Syntax tree of the test module.
 
         Yields:
-            `(test_class_name, missing_test_methods, source)` tuples, where
+            `(test_class_name, missing_test_methods, end_line)` tuples, where
             `missing_test_methods` is itself an iterator of method name strings,
-            and `source` is the existing test class's exact current source text
-            (from `inspect.getsource`), or `None` if no test class with that
-            name exists yet.
+            and `end_line` is the 1-based number of the last line of the
+            existing test class, or `None` if no test class with that name
+            exists yet.
 
         Note:
             Each yielded inner iterator must be fully consumed before advancing
             to the next tuple; otherwise its remaining items are filtered
             against a later class's methods instead of its own.
         """
-        classes = def_line_sorted(filter_module_classes(module, module_members))
-        test_classes = filter_module_classes(test_module, test_module_members)
-
-        class_to_methods = (
-            (
-                c,
-                def_line_sorted(filter_direct_methods(c, cls_methods(c))),
-            )
-            for c in classes
-        )
-        test_class_to_test_methods = (
-            (tc, (filter_direct_methods(tc, cls_methods(tc)))) for tc in test_classes
-        )
-
-        supposed_test_class_to_test_methods_names = (
-            (
-                self.test_cls_name(unwrap_cls(c)),
-                (self.test_func_name(unwrap_func(m)) for m in ms),
-            )
-            for c, ms in class_to_methods
-        )
-        actual_test_class_to_test_methods_names = {
-            unwrap_cls(tc).__name__: {unwrap_func(tm).__name__ for tm in tms}
-            for tc, tms in test_class_to_test_methods
-        }
-
-        for (
-            supposed_test_class_name,
-            supposed_test_methods_names,
-        ) in supposed_test_class_to_test_methods_names:
-            actual_test_methods_names = set(
-                actual_test_class_to_test_methods_names.get(
-                    supposed_test_class_name,
-                    (),
-                ),
+        test_classes = {tc.name: tc for tc in class_defs(test_tree)}
+
+        for c in class_defs(source_tree):
+            supposed_test_class_name = self.test_cls_name(c.name)
+            test_class = test_classes.get(supposed_test_class_name)
+            actual_test_methods_names = (
+                {tm.name for tm in function_defs(test_class)}
+                if test_class is not None
+                else set()
             )
             untested_test_methods_names = (
                 tmn
-                for tmn in supposed_test_methods_names
+                for tmn in (self.test_func_name(m.name) for m in function_defs(c))
                 if tmn not in actual_test_methods_names
             )
             has_untested_methods, untested_test_methods_names = iterator_has_items(
@@ -486,10 +407,9 @@ def untested_class_and_method_names(
             if not has_untested_methods:
                 continue
 
-            test_class = getattr(test_module, supposed_test_class_name, None)
-            source = inspect.getsource(test_class) if test_class is not None else None
+            end_line = test_class.end_lineno if test_class is not None else None
 
-            yield supposed_test_class_name, untested_test_methods_names, source
+            yield supposed_test_class_name, untested_test_methods_names, end_line
 
     def test_class_skeleton(self, test_class_name: str) -> str:
         """Generate skeleton code for a test class.
@@ -528,27 +448,27 @@ def {test_method_name}(self) -> None:
         raise {NotImplementedError.__name__}
 '''
 
-    def test_func_name(self, func: FunctionType) -> str:
+    def test_func_name(self, name: str) -> str:
         """Return the expected test function name for a given source function.
 
         Args:
-            func: Source function whose test name to derive.
+            name: Name of the source function whose test name to derive.
 
         Returns:
             Test function name (e.g., `"test_my_function"` for `my_function`).
         """
-        return self.test_func_prefix() + func.__name__
+        return self.test_func_prefix() + name
 
-    def test_cls_name(self, cls: type) -> str:
+    def test_cls_name(self, name: str) -> str:
         """Return the expected test class name for a given source class.
 
         Args:
-            cls: Source class whose test name to derive.
+            name: Name of the source class whose test name to derive.
 
         Returns:
             Test class name (e.g., `"TestMyClass"` for `MyClass`).
         """
-        return self.test_cls_prefix() + cls.__name__
+        return self.test_cls_prefix() + name
 
     def test_func_prefix(self) -> str:
         """Return `"test_"`, the prefix used for test function names."""
@@ -2,13 +2,17 @@
 
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterator
+from pathlib import Path
 from types import ModuleType
+from typing import Self
 
 from pyrig_runtime.core.dependencies.subclass import DependencySubclass
 from pyrig_runtime.core.strings import kebab_to_snake_case
 from pyrig_runtime.core.wrappers import safe_call
 
+import pyrig
+from pyrig.core.introspection.registry import registered_subclasses
 from pyrig.core.strings import make_linked_badge_markdown
 from pyrig.core.subprocesses import Args
 from pyrig.rig import tools
@@ -62,6 +66,36 @@ def discovery_module(cls) -> ModuleType:
         """Return the `pyrig.rig.tools` package as the tool discovery scope."""
         return tools
 
+    @classmethod
+    def subclasses(cls) -> Iterator[type[Self]]:
+        """Yield every subclass discovered within the declared discovery scope.
+
+        Overrides the base discovery to go through the persisted class
+        registry, so only the modules that define tools are imported while
+        nothing in the discovery scope has changed.
+
+        Yields:
+            Subclass types found anywhere in the discovery scope.
+        """
+        return registered_subclasses(
+            cls,
+            module=cls.discovery_module(),
+            registry_dir=cls.registry_dir(),
+        )
+
+    @classmethod
+    def registry_dir(cls) -> Path:
+        """Return the directory the class registry is persisted in.
+
+        Built from the default cache directory name rather than
+        `Pyrigger.I.cache_dir()`, because resolving `Pyrigger.I` itself
+        discovers tools.
+
+        Returns:
+            `.pyrig_cache/registry`, relative to the project root.
+        """
+        return Path(f".{pyrig.__name__}_cache", "registry")
+
     @classmethod
     def merge_key(cls) -> Hashable:
         """Return the tool's name, so subclasses wrapping the same tool are merged.
@@ -110,6 +110,35 @@ def run_args(self, *args: str) -> Args:
         """
         return self.args("run", *args)
 
+    def add_group_dev_without_syncing_args(self, *args: str) -> Args:
+        """Construct `Args` for adding dev dependencies without installing them.
+
+        `pyproject.toml` and the lock file are updated, writing each package
+        with the lower bound of its resolved version; the environment is
+        left for a later `uv sync` to update.
+
+        Args:
+            *args: Package names or additional `uv add` flags.
+
+        Returns:
+            Args for `uv add --group=dev --no-sync <args...>`.
+        """
+        return self.add_group_dev_args("--no-sync", *args)
+
+    def add_without_syncing_args(self, *args: str) -> Args:
+        """Construct `Args` for adding packages without installing them.
+
+        `pyproject.toml` and the lock file are updated, the environment is
+        left for a later `uv sync` to update.
+
+        Args:
+            *args: Package names or additional `uv add` flags.
+
+        Returns:
+            Args for `uv add --no-sync <args...>`.
+        """
+        return self.add_args("--no-sync", *args)
+
     def add_group_dev_args(self, *args: str) -> Args:
         """Construct `Args` for adding packages to the dev dependency group.
 
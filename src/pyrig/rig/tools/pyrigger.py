@@ -1,5 +1,7 @@
 """Tool wrapper for the pyrig CLI itself, including new-project initialization."""
 
+from pathlib import Path
+from textwrap import shorten
 from types import FunctionType
 from typing import Any
 
@@ -39,6 +41,18 @@ def name(self) -> str:
         """Return `"pyrig"`."""
         return snake_to_kebab_case(pyrig.__name__)
 
+    def version_control_ignore_patterns(self) -> tuple[str, ...]:
+        """Return `('.pyrig_cache/',)`, the local cache directory."""
+        return (f"{self.cache_dir().as_posix()}/",)
+
+    def cache_dir(self) -> Path:
+        """Return `.pyrig_cache`, where pyrig keeps caches between runs.
+
+        Relative to the project root. Everything in it can be deleted at any
+        time; it is rebuilt on the next run.
+        """
+        return Path(f".{pyrig.__name__}_cache")
+
     def group_cmd_args(self, *args: str, group: str, cmd: FunctionType) -> Args:
         """Construct `Args` for a pyrig CLI subcommand within a command group.
 
@@ -86,8 +100,31 @@ def init_project(self) -> None:
             label="Initializing project",
             length=len(steps),
         ) as progress:
+
+            def show_output(line: str) -> None:
+                progress.label = self.setup_output_label(line)
+                progress.render_progress()
+
             for step_args, run_kwargs in progress:
-                PackageManager.I.run_args(*step_args).run(**run_kwargs)
+                PackageManager.I.run_args(*step_args).run_streaming(
+                    on_line=show_output,
+                    **run_kwargs,
+                )
+
+    def setup_output_label(self, line: str) -> str:
+        """Return the progress bar label showing a setup step's output line.
+
+        Setup steps such as the initial sync can run for a long time, so
+        their output is streamed into the progress bar's label instead of
+        being buffered until the step exits.
+
+        Args:
+            line: The latest output line of the running step.
+
+        Returns:
+            The label, with the line shortened to fit on one row.
+        """
+        return f"Initializing project: {shorten(line, width=60)}"
 
     def remove_config_files(self) -> None:
         """Delete every removable config file that currently exists.
@@ -103,7 +140,7 @@ def setup_steps(self) -> tuple[tuple[Args, dict[str, Any]], ...]:
         """Return the ordered setup steps for project initialization.
 
         Each step pairs the command to run with the keyword arguments to pass
-        to its `.run()` call. The sync step tolerates a non-zero exit, since
+        to its `.run_streaming()` call. The sync step tolerates a non-zero exit, since
         syncing a fresh project is expected to create or update files.
 
         Returns:
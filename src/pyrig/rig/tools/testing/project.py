@@ -1,5 +1,6 @@
 """Wrapper for the project's test runner and test-package layout conventions."""
 
+import math
 from pathlib import Path
 
 from pyrig.core.subprocesses import Args
@@ -87,6 +88,133 @@ def additional_args(self) -> Args:
             "--report-chars=a",
         )
 
+    def shards(self) -> int:
+        """Return how many CI runners each test matrix job is split across.
+
+        Subclasses may override this to spread a large test suite across
+        several runners per OS and Python version. Test files are then
+        assigned to shards by their recorded durations (see
+        `durations_path()`), and coverage is enforced on the combined
+        results of all shards instead of on each runner.
+
+        Returns:
+            1, which runs the whole suite on every runner.
+        """
+        return 1
+
+    def durations_path(self) -> Path:
+        """Return the file the recorded duration of each test file is kept in."""
+        return Path(".pytest_cache") / "durations.json"
+
+    def junit_report_path(self) -> Path:
+        """Return the JUnit XML report a test run writes its timings to."""
+        return Path(".pytest_cache") / "junit.xml"
+
+    def junit_test_args(self, *args: str) -> Args:
+        """Build a pytest command that records the timings of the tests.
+
+        Args:
+            *args: Test files and further arguments to pass.
+
+        Returns:
+            Args for pytest that write a JUnit report recording the file of
+            each test to `junit_report_path()`.
+        """
+        return self.test_args(
+            f"--junit-xml={self.junit_report_path().as_posix()}",
+            "--override-ini=junit_family=xunit1",
+            *args,
+        )
+
+    def shard_test_args(self, *args: str) -> Args:
+        """Build a pytest command for one shard of the test suite.
+
+        Args:
+            *args: Test files and further arguments to pass.
+
+        Returns:
+            Args for pytest that write a JUnit report like
+            `junit_test_args()`, and that leave enforcing the coverage
+            threshold to the combined results of all shards.
+        """
+        return self.junit_test_args("--cov-fail-under=0", *args)
+
+    def quick_tests_seconds(self) -> float:
+        """Return the recorded duration the quick subset of the suite may take.
+
+        The health check's canary runs the quickest test files up to this
+        total duration before the full test matrix starts.
+
+        Returns:
+            60
+        """
+        return 60
+
+    def quick_test_args(self, *args: str) -> Args:
+        """Build a pytest command that fails fast on a subset of the suite.
+
+        Args:
+            *args: Test files and further arguments to pass.
+
+        Returns:
+            Args for pytest that stop at the first failure, run the tests
+            that failed last time first, and do not enforce the coverage
+            threshold.
+        """
+        return self.test_args(
+            "--exitfirst",
+            "--failed-first",
+            "--cov-fail-under=0",
+            *args,
+        )
+
+    def timeout_minutes(self, seconds: float) -> int:
+        """Return the timeout of a CI job whose tests are expected to take `seconds`.
+
+        Subclasses may override this to allow more or less slack.
+
+        Args:
+            seconds: Recorded serial duration of the job's tests.
+
+        Returns:
+            Twice the recorded duration, rounded up to whole minutes, plus
+            10 minutes for setting up the runner.
+        """
+        return math.ceil(2 * seconds / 60) + 10
+
+    def coverage_data_path(self) -> Path:
+        """Return the coverage data file a test run writes."""
+        return Path(".coverage")
+
+    def combine_coverage_args(self, *args: str) -> Args:
+        """Build a command that combines the coverage data of several test runs.
+
+        Args:
+            *args: Coverage data files to combine.
+
+        Returns:
+            Args for `coverage combine <args...>`.
+        """
+        return Args("coverage", "combine", *args)
+
+    def report_coverage_args(self, *args: str) -> Args:
+        """Build a command that reports coverage and enforces `threshold()`.
+
+        Args:
+            *args: Additional `coverage report` arguments.
+
+        Returns:
+            Args for `coverage report --fail-under=<threshold> <args...>`.
+        """
+        return Args(
+            "coverage",
+            "report",
+            f"--fail-under={self.threshold()}",
+            "--skip-covered",
+            "--show-missing",
+            *args,
+        )
+
     def package_root(self) -> Path:
         """Return the path to the top-level tests package."""
         return self.source_root() / self.package_name()
@@ -1,6 +1,10 @@
 """Type-safe construction of version control CLI commands and identity resolution."""
 
+import os
+import subprocess  # nosec: B404
 from functools import cache
+from pathlib import Path
+from typing import Any
 
 from pyrig.core.subprocesses import Args
 from pyrig.rig.tools.base.tool import Group, Tool
@@ -256,9 +260,10 @@ def remote_url(self) -> str:
             The configured `remote.origin.url` value, or an empty string if
             no remote origin is configured.
         """
-        return (
-            self.config_remote_origin_url_args().run_cached(check=False).stdout.strip()
-        )
+        return self.run_config_query(
+            self.config_remote_origin_url_args(),
+            check=False,
+        ).stdout.strip()
 
     def normalized_username(self) -> str:
         """Return the git `user.name` with spaces removed.
@@ -280,7 +285,7 @@ def username(self) -> str:
         Raises:
             subprocess.CalledProcessError: If `user.name` is not configured.
         """
-        return self.config_get_username_args().run_cached().stdout.strip()
+        return self.run_config_query(self.config_get_username_args()).stdout.strip()
 
     def email(self) -> str:
         """Return the git `user.email` from the active configuration.
@@ -291,7 +296,50 @@ def email(self) -> str:
         Raises:
             subprocess.CalledProcessError: If `user.email` is not configured.
         """
-        return self.config_get_user_email_args().run_cached().stdout.strip()
+        return self.run_config_query(self.config_get_user_email_args()).stdout.strip()
+
+    def run_config_query(
+        self,
+        args: Args,
+        *,
+        check: bool = True,
+    ) -> subprocess.CompletedProcess[Any]:
+        """Run a `git config` query, reusing its result across pyrig invocations.
+
+        The result is persisted in pyrig's cache directory and reused until
+        one of `config_files()` changes or an hour has passed.
+
+        Args:
+            args: The `git config` command to run.
+            check: Whether to raise an exception on non-zero exit.
+
+        Returns:
+            The completed process result.
+        """
+        from pyrig.rig.tools.pyrigger import Pyrigger  # noqa: PLC0415
+
+        return args.run_persisted(
+            check=check,
+            cache_dir=Pyrigger.I.cache_dir() / "runs",
+            invalidators=self.config_files(),
+        )
+
+    def config_files(self) -> tuple[Path, ...]:
+        """Return the files `git config` reads its values from.
+
+        Returns:
+            The repository's `.git/config`, the user's global config (honoring
+            `GIT_CONFIG_GLOBAL`), the XDG config (honoring `XDG_CONFIG_HOME`),
+            and the system config `/etc/gitconfig`.
+        """
+        home = Path.home()
+        xdg_config_home = Path(os.environ.get("XDG_CONFIG_HOME", home / ".config"))
+        return (
+            Path(".git") / "config",
+            Path(os.environ.get("GIT_CONFIG_GLOBAL", home / ".gitconfig")),
+            xdg_config_home / "git" / "config",
+            Path("/etc/gitconfig"),
+        )
 
     def has_commits(self) -> bool:
         """Return whether the repository has at least one commit.
@@ -325,3 +373,46 @@ def rev_parse_args(self, *args: str) -> Args:
             Args for `git rev-parse [args]`.
         """
         return self.args("rev-parse", *args)
+
+    def changed_files(self) -> list[Path]:
+        """Return every file with uncommitted changes in the working tree.
+
+        Covers staged, unstaged, untracked, and deleted files. For a renamed
+        or copied file, both the new and the original path are included.
+
+        Returns:
+            Paths relative to the repository root, in `git status` order.
+        """
+        stdout = self.status_porcelain_args("-z", "--untracked-files=all").run().stdout
+        entries = iter(stdout.split("\0"))
+        files: list[Path] = []
+        for entry in entries:
+            if not entry:
+                continue
+            status, path = entry[:2], entry[3:]
+            files.append(Path(path))
+            if {"R", "C"} & set(status):
+                files.append(Path(next(entries)))
+        return files
+
+    def status_porcelain_args(self, *args: str) -> Args:
+        """Build arguments for `git status --porcelain`.
+
+        Args:
+            *args: Additional arguments appended to the command.
+
+        Returns:
+            Args for `git status --porcelain [args]`.
+        """
+        return self.status_args("--porcelain", *args)
+
+    def status_args(self, *args: str) -> Args:
+        """Build arguments for `git status`.
+
+        Args:
+            *args: Additional arguments appended to the command.
+
+        Returns:
+            Args for `git status [args]`.
+        """
+        return self.args("status", *args)
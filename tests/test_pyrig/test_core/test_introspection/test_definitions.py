@@ -0,0 +1,111 @@
+"""Test module."""
+
+import ast
+
+import pytest
+
+from pyrig.core.introspection.definitions import (
+    class_defs,
+    definition_lines,
+    function_defs,
+    parse_source,
+    source_with_line_insertions,
+)
+
+SOURCE = '''"""Module."""
+
+from typing import overload
+
+
+@overload
+def first(x: int) -> int: ...
+@overload
+def first(x: str) -> str: ...
+def first(x):
+    return x
+
+
+async def second():
+    def nested():
+        pass
+
+
+if True:
+    def conditional():
+        pass
+
+
+@decorator(
+    arg=1,
+)
+class Alpha:
+    x = 1
+
+    @property
+    def value(self):
+        return 1
+
+    @value.setter
+    def value(self, new):
+        pass
+
+    async def run(self):
+        pass
+
+
+class Beta:
+    """No methods."""'''
+
+
+def test_parse_source() -> None:
+    """Test function."""
+    tree = parse_source(SOURCE)
+    assert isinstance(tree, ast.Module)
+    with pytest.raises(SyntaxError):
+        parse_source("def broken(:")
+
+
+def test_function_defs() -> None:
+    """Test function."""
+    tree = parse_source(SOURCE)
+    functions = function_defs(tree)
+    assert [f.name for f in functions] == ["first", "second"]
+    # the first of several definitions of a name is the one returned
+    assert isinstance(functions[0].body[0], ast.Expr)
+    alpha = class_defs(tree)[0]
+    assert [f.name for f in function_defs(alpha)] == ["value", "run"]
+
+
+def test_class_defs() -> None:
+    """Test function."""
+    assert [c.name for c in class_defs(parse_source(SOURCE))] == ["Alpha", "Beta"]
+    assert class_defs(parse_source("x = 1")) == []
+
+
+def test_definition_lines() -> None:
+    """Test function."""
+    lines = definition_lines(parse_source(SOURCE))
+    # the first of several definitions of a name is the one returned
+    assert lines["first"] == 6  # noqa: PLR2004
+    assert lines["second.<locals>.nested"] == lines["second"] + 1
+    assert "conditional" in lines
+    # a decorated definition starts at its first decorator
+    assert SOURCE.splitlines()[lines["Alpha"] - 1] == "@decorator("
+    assert lines["Alpha.value"] < lines["Alpha.run"] < lines["Beta"]
+    assert definition_lines(parse_source("x = 1")) == {}
+
+
+def test_source_with_line_insertions() -> None:
+    """Test function."""
+    source = "a\nb\r\nc"
+    assert source_with_line_insertions(source, {}) == source
+    result = source_with_line_insertions(source, {3: "\nz", 1: " x", 2: "\ny"})
+    assert result == "a x\nb\ny\r\nc\nz"
+
+    # a form feed is a line break for `str.splitlines` but not for `ast`
+    source = "x = '\x0c'\nclass B:\n    pass\n"
+    end_line = class_defs(parse_source(source))[0].end_lineno
+    assert end_line is not None
+    assert source_with_line_insertions(source, {end_line: "\n    y = 1"}) == (
+        "x = '\x0c'\nclass B:\n    pass\n    y = 1\n"
+    )
@@ -4,15 +4,22 @@
 """
 
 import inspect
+from pathlib import Path
 
 from pyrig_runtime.core.introspection.inspection import unwrap_obj
 from pytest_mock import MockerFixture
 
 from pyrig.core.introspection import inspection
-from pyrig.core.introspection.inspection import def_line, def_line_sorted, unwrap_cls
+from pyrig.core.introspection.inspection import (
+    def_line,
+    def_line_sorted,
+    file_definition_lines,
+    stamped_file_definition_lines,
+    unwrap_cls,
+)
 
 
-def test_def_line() -> None:
+def test_def_line(mocker: MockerFixture) -> None:
     """Test function."""
 
     # Test with a function defined in this module
@@ -39,6 +46,20 @@ def test_property(self) -> str:
     prop_line = def_line(inspect.getattr_static(TestClass, "test_property"))  # ty:ignore[invalid-argument-type]
     assert prop_line > 0
 
+    # Test with a class, located through its source
+    assert def_line(TestClass) == def_line(TestClass.test_method) - 1
+
+    # Test with a module, which starts at its first line
+    assert def_line(inspection) == 1
+
+    # a class missing from the line index falls back to inspect.findsource
+    mocker.patch.object(
+        inspection,
+        file_definition_lines.__name__,
+        return_value={},
+    )
+    assert def_line(TestClass) == def_line(TestClass.test_method) - 1
+
 
 def test_def_line_sorted() -> None:
     """Test function."""
@@ -67,6 +88,33 @@ def test_func_c() -> None:
     ], "Expected functions sorted by definition line"
 
 
+def test_file_definition_lines(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "module.py"
+    path.write_text("class A:\n    pass\n")
+    lines = file_definition_lines(str(path))
+    assert lines == {"A": 1}
+    assert file_definition_lines(str(path)) is lines
+
+    # an edited file is parsed again
+    path.write_text("x = 1\n\nclass A:\n    pass\n")
+    assert file_definition_lines(str(path)) == {"A": 3}
+
+    assert file_definition_lines(str(tmp_path / "missing.py")) == {}
+
+
+def test_stamped_file_definition_lines(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "module.py"
+    path.write_text("def f():\n    pass\n")
+    lines = stamped_file_definition_lines(str(path), 1, 2)
+    assert lines == {"f": 1}
+
+    path.write_text("class A:\n    pass\n")
+    assert stamped_file_definition_lines(str(path), 1, 2) is lines
+    assert stamped_file_definition_lines(str(path), 1, 3) == {"A": 1}
+
+
 def test_unwrap_cls(mocker: MockerFixture) -> None:
     """Test function."""
     mock_unwrap_obj = mocker.patch.object(
@@ -21,6 +21,7 @@
     module_content,
     module_has_docstring,
     reimport_module,
+    unexecuted_module,
 )
 from pyrig.rig.cli import subcommands
 
@@ -114,3 +115,21 @@ def test_reimport_module() -> None:
 def test_leaf_module_name() -> None:
     """Test function."""
     assert leaf_module_name(subcommands) == "subcommands"
+
+
+def test_unexecuted_module(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    assert unexecuted_module(Path(modules.__file__), modules.__name__) is modules
+
+    module_name = test_unexecuted_module.__name__
+    module_path = tmp_path / f"{module_name}.py"
+    module_path.write_text('"""Test module."""\nraise RuntimeError\n')
+    module = unexecuted_module(module_path, module_name)
+    assert module.__name__ == module_name
+    assert module.__file__ == str(module_path)
+    assert module.__doc__ is None
+    assert module_name not in sys.modules
+
+    mocker.patch(modules.__name__ + ".spec_from_loader", return_value=None)
+    with pytest.raises(ImportError):
+        unexecuted_module(module_path, module_name)
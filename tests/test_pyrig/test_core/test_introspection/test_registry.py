@@ -0,0 +1,154 @@
+"""Test module."""
+
+import json
+import sys
+from importlib.metadata import version
+from pathlib import Path
+from types import ModuleType
+
+import pyrig_runtime
+from pyrig_runtime.core.dependencies.discovery import subclasses_across_dependencies
+from pytest_mock import MockerFixture
+
+from pyrig.core.introspection import registry
+from pyrig.core.introspection.paths import module_file_path
+from pyrig.core.introspection.registry import (
+    distribution_version,
+    load_registry,
+    registered_subclasses,
+    registry_key,
+    scope_files,
+    scope_fingerprint,
+    scoped_subclasses,
+    store_registry,
+    subclass_module_names,
+)
+from pyrig.rig import configs, tools
+from pyrig.rig.tools.base import tool
+from pyrig.rig.tools.base.tool import Tool
+from pyrig.rig.tools.packages.manager import PackageManager
+from pyrig.rig.tools.testing.project import ProjectTester
+
+
+def test_registered_subclasses(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    expected = set(subclasses_across_dependencies(Tool, module=tools))
+    discovery_mock = mocker.patch(
+        f"{registry.__name__}.{subclasses_across_dependencies.__name__}",
+        side_effect=subclasses_across_dependencies,
+    )
+
+    assert set(registered_subclasses(Tool, tools, registry_dir=tmp_path)) == expected
+    assert discovery_mock.call_count == 1
+    (path,) = tmp_path.iterdir()
+
+    # a current entry skips the full discovery
+    assert set(registered_subclasses(Tool, tools, registry_dir=tmp_path)) == expected
+    assert discovery_mock.call_count == 1
+
+    # an entry recorded for another fingerprint is rebuilt
+    data = json.loads(path.read_text())
+    path.write_text(json.dumps({**data, "fingerprint": "stale"}))
+    assert set(registered_subclasses(Tool, tools, registry_dir=tmp_path)) == expected
+    assert discovery_mock.call_count == 2  # noqa: PLR2004
+    assert json.loads(path.read_text()) == data
+
+    # an entry listing a module that no longer imports is rebuilt
+    path.write_text(json.dumps({**data, "modules": ["pyrig_missing_module"]}))
+    assert set(registered_subclasses(Tool, tools, registry_dir=tmp_path)) == expected
+    assert discovery_mock.call_count == 3  # noqa: PLR2004
+
+
+def test_scoped_subclasses() -> None:
+    """Test function."""
+
+    class OutOfScopeTool(Tool):
+        """Tool defined outside the discovery scope."""
+
+    result = set(scoped_subclasses(Tool, tools))
+    assert {PackageManager, ProjectTester} <= result
+    assert OutOfScopeTool not in result
+    assert not set(scoped_subclasses(Tool, configs))
+
+
+def test_scope_fingerprint(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    source = tmp_path / "module.py"
+    source.write_text("")
+    mocker.patch(
+        f"{registry.__name__}.{scope_files.__name__}",
+        return_value=[source],
+    )
+    scope_fingerprint.cache_clear()
+    fingerprint = scope_fingerprint(tools)
+    assert len(fingerprint) == len(registry_key(Tool, tools))
+    assert scope_fingerprint(tools) == fingerprint
+
+    source.write_text("changed")
+    assert scope_fingerprint(tools) == fingerprint, "Expected a cached result"
+    scope_fingerprint.cache_clear()
+    assert scope_fingerprint(tools) != fingerprint
+    scope_fingerprint.cache_clear()
+
+
+def test_scope_files() -> None:
+    """Test function."""
+    files = scope_files(tools)
+    assert module_file_path(tool) in files
+    assert files == sorted(files)
+    assert scope_files(tool) == [module_file_path(tool)]
+
+
+def test_distribution_version() -> None:
+    """Test function."""
+    assert distribution_version(pyrig_runtime) == version(pyrig_runtime.__name__)
+    assert distribution_version(ModuleType("pyrig_missing_module")) is None
+
+
+def test_registry_key() -> None:
+    """Test function."""
+    key = registry_key(Tool, tools)
+    assert key == registry_key(Tool, tools)
+    assert key != registry_key(PackageManager, tools)
+    assert key != registry_key(Tool, configs)
+
+
+def test_subclass_module_names() -> None:
+    """Test function."""
+    generated = type("Generated", (), {"__module__": "pyrig_missing_module"})
+    names = subclass_module_names([ProjectTester, PackageManager, generated, Tool])
+    assert set(names) == {
+        ProjectTester.__module__,
+        PackageManager.__module__,
+        Tool.__module__,
+    }
+    order = list(sys.modules)
+    assert names == sorted(names, key=order.index)
+
+
+def test_load_registry(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "entry.json"
+    assert load_registry(path, fingerprint="a") is None
+
+    for content in (
+        "not json",
+        "[]",
+        "{}",
+        '{"fingerprint": "a"}',
+        '{"fingerprint": "a", "modules": "x"}',
+        '{"fingerprint": "a", "modules": [1]}',
+    ):
+        path.write_text(content)
+        assert load_registry(path, fingerprint="a") is None
+
+    store_registry(path, fingerprint="a", module_names=["x", "y"])
+    assert load_registry(path, fingerprint="a") == ["x", "y"]
+    assert load_registry(path, fingerprint="b") is None
+
+
+def test_store_registry(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "registry" / "entry.json"
+    store_registry(path, fingerprint="a", module_names=["x"])
+    assert json.loads(path.read_text()) == {"fingerprint": "a", "modules": ["x"]}
@@ -8,10 +8,13 @@
     both_lists,
     deep_sorted_dict,
     dict_insert,
+    dict_insert_many,
+    is_hashable_leaf,
     iterator_has_items,
     match_list_items,
     merge_nested_structures,
     nested_structure_is_subset,
+    nested_structure_missing_paths,
 )
 
 
@@ -138,6 +141,30 @@ def test_match_list_items() -> None:
 
     assert match_list_items([], []) == []
 
+    # leaves never satisfy containers and vice versa, whatever the order.
+    assert match_list_items(
+        [[1], "a", {"b": 1}, "a", [1]],
+        ["a", {"b": 1, "c": 2}, [1, 2], "a"],
+    ) == [True, True, True, True, False]
+
+    # unhashable leaves are compared one by one.
+    assert match_list_items([{1}, {1}], [{1}, "x"]) == [True, False]
+
+    # equal values with equal hashes satisfy each other.
+    assert match_list_items([1, 1.0], [True, 1]) == [True, True]
+
+
+def test_is_hashable_leaf() -> None:
+    """Test function."""
+    assert is_hashable_leaf("a")
+    assert is_hashable_leaf(1)
+    assert is_hashable_leaf(None)
+    assert is_hashable_leaf((1, 2))
+    assert not is_hashable_leaf({"a": 1})
+    assert not is_hashable_leaf([1])
+    assert not is_hashable_leaf({1})
+    assert not is_hashable_leaf(([1],))
+
 
 def test_deep_sorted_dict() -> None:
     """Test function."""
@@ -173,3 +200,67 @@ def test_dict_insert() -> None:
     d = {"a": 1, "b": 2, "c": 3, "d": 4}
     dict_insert(d, index=10, key="e", value=5)
     assert d == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
+
+
+def test_dict_insert_many() -> None:
+    """Test function."""
+    d = {"a": 1, "b": 2}
+    dict_insert_many(d, [(0, "c", 3), (2, "d", 4), (9, "e", 5)])
+    assert list(d.items()) == [("c", 3), ("a", 1), ("d", 4), ("b", 2), ("e", 5)]
+
+    # appends only: applied in place, existing keys move to the end
+    d = {"a": 1, "b": 2}
+    dict_insert_many(d, [(2, "c", 3), (5, "a", 4)])
+    assert list(d.items()) == [("b", 2), ("c", 3), ("a", 4)]
+
+    # each index applies to the dict as left by the previous insertions
+    d = {"a": 1, "b": 2, "c": 3}
+    dict_insert_many(d, [(0, "d", 4), (1, "a", 5), (0, "d", 6), (9, "b", 7)])
+    assert list(d.items()) == [("d", 6), ("a", 5), ("c", 3), ("b", 7)]
+
+    d = {"a": 1}
+    dict_insert_many(d, [])
+    assert d == {"a": 1}
+
+
+def test_nested_structure_missing_paths() -> None:
+    """Test function."""
+    required: dict[str, Any] = {
+        "tool": {
+            "pytest": {"ini_options": {"addopts": ["-q", "-x", "--cov", "-n"]}},
+            "ruff": {"line-length": 88},
+        },
+        "project": {"name": "pyrig"},
+    }
+    actual: dict[str, Any] = {
+        "tool": {
+            "pytest": {"ini_options": {"addopts": ["-x", "-q", "--cov"]}},
+            "ruff": {"line-length": 100},
+        },
+    }
+    assert nested_structure_missing_paths(required, actual) == [
+        "tool.pytest.ini_options.addopts[3]",
+        "tool.ruff.line-length",
+        "project",
+    ]
+    assert nested_structure_missing_paths(required, required) == []
+
+    # a list item is reported as a whole, at its index in subset
+    assert nested_structure_missing_paths(
+        [{"a": 1}, {"b": 2}],
+        [{"b": 2, "c": 3}],
+    ) == ["[0]"]
+
+    # an explicit path prefixes every reported path
+    assert nested_structure_missing_paths({"a": 1}, {}, "root") == ["root.a"]
+
+    # agrees with nested_structure_is_subset
+    for subset, superset in (
+        (["", ""], [""]),
+        ({"a": None}, {}),
+        ([2, 3], [1, 2, 3]),
+        ("a", "a"),
+    ):
+        assert (
+            not nested_structure_missing_paths(subset, superset)
+        ) == nested_structure_is_subset(subset, superset)
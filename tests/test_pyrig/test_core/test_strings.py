@@ -1,7 +1,12 @@
 """Tests module."""
 
+import stat
 from pathlib import Path
 
+import pytest
+from pytest_mock import MockerFixture
+
+from pyrig.core import strings
 from pyrig.core.strings import (
     fstring_var_name,
     is_multiline,
@@ -9,6 +14,7 @@
     open_path_with_utf8,
     read_text_utf8,
     reformat_name,
+    replace_text_utf8,
     split_on_uppercase,
     write_text_utf8,
 )
@@ -165,3 +171,30 @@ def test_is_multiline() -> None:
         is True
     )
     assert is_multiline("""One line only""") is False
+
+
+def test_replace_text_utf8(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    path = tmp_path / "file.txt"
+    replace_text_utf8(path, "first 👋\r\n")
+    assert path.read_bytes() == "first 👋\r\n".encode()
+
+    # an existing file keeps its permission bits
+    path.chmod(0o755)
+    replace_text_utf8(path, "second\n")
+    assert path.read_text() == "second\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o755  # noqa: PLR2004
+
+    # a symlink is written through to its target
+    link = tmp_path / "link.txt"
+    link.symlink_to(path)
+    replace_text_utf8(link, "third\n")
+    assert link.is_symlink()
+    assert path.read_text() == "third\n"
+
+    # a failed write leaves the file and no temporary file behind
+    mocker.patch.object(strings.shutil, "copymode", side_effect=OSError)
+    with pytest.raises(OSError, match=r"^$"):
+        replace_text_utf8(path, "fourth\n")
+    assert path.read_text() == "third\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["file.txt", "link.txt"]
@@ -1,13 +1,32 @@
 """Tests for pyrig.os.os module."""
 
+import asyncio
 import copy
+import json
 import logging
+import os
 import subprocess  # nosec: B404
+from contextlib import chdir
+from pathlib import Path
 
 import pytest
 from pytest_mock import MockerFixture
 
-from pyrig.core.subprocesses import Args, run_subprocess, run_subprocess_cached
+from pyrig.core.subprocesses import (
+    Args,
+    load_persisted_run,
+    log_subprocess_error,
+    persisted_run_key,
+    run_subprocess,
+    run_subprocess_async,
+    run_subprocess_cached,
+    run_subprocess_persisted,
+    run_subprocess_streaming,
+    run_subprocesses,
+    run_subprocesses_async,
+    store_persisted_run,
+    stream_subprocess,
+)
 
 
 def test_run_subprocess(caplog: pytest.LogCaptureFixture) -> None:
@@ -44,6 +63,121 @@ def test_run_subprocess(caplog: pytest.LogCaptureFixture) -> None:
         ), "Expected formatted log message to include command, return code, and streams"
 
 
+def test_run_subprocesses(caplog: pytest.LogCaptureFixture) -> None:
+    """Test function."""
+    args_list = [("echo", str(index)) for index in range(5)]
+    results = run_subprocesses(args_list, max_workers=2)
+    assert [result.stdout for result in results] == [f"{i}\n" for i in range(5)]
+    assert run_subprocesses([]) == []
+
+    fail_cmd = ("python", "-c", "import sys; sys.exit(3)")
+    with (
+        caplog.at_level(logging.ERROR, logger="pyrig.core.subprocesses"),
+        pytest.raises(subprocess.CalledProcessError) as exc_info,
+    ):
+        run_subprocesses([("echo", "ok"), fail_cmd])
+    assert exc_info.value.returncode == 3  # noqa: PLR2004
+    assert len(caplog.records) == 1
+
+    results = run_subprocesses([fail_cmd], check=False)
+    assert results[0].returncode == 3  # noqa: PLR2004
+
+
+def test_run_subprocesses_async(caplog: pytest.LogCaptureFixture) -> None:
+    """Test function."""
+    args_list = [("echo", str(index)) for index in range(5)]
+    results = asyncio.run(run_subprocesses_async(args_list, max_workers=2))
+    assert [result.stdout for result in results] == [f"{i}\n" for i in range(5)]
+    assert asyncio.run(run_subprocesses_async([])) == []
+
+    fail_cmd = ("python", "-c", "import sys; sys.exit(3)")
+    with (
+        caplog.at_level(logging.ERROR, logger="pyrig.core.subprocesses"),
+        pytest.raises(subprocess.CalledProcessError) as exc_info,
+    ):
+        asyncio.run(run_subprocesses_async([("echo", "ok"), fail_cmd]))
+    assert exc_info.value.returncode == 3  # noqa: PLR2004
+    assert len(caplog.records) == 1
+
+
+def test_run_subprocess_async(caplog: pytest.LogCaptureFixture) -> None:
+    """Test function."""
+    result = asyncio.run(run_subprocess_async("echo", "hello"))
+    assert result.args == ("echo", "hello")
+    assert (result.returncode, result.stdout, result.stderr) == (0, "hello\n", "")
+
+    fail_cmd = ("python", "-c", "import sys; sys.stderr.write('bad'); sys.exit(2)")
+    result = asyncio.run(run_subprocess_async(*fail_cmd, check=False))
+    assert (result.returncode, result.stderr) == (2, "bad")
+
+    with (
+        caplog.at_level(logging.ERROR, logger="pyrig.core.subprocesses"),
+        pytest.raises(subprocess.CalledProcessError),
+    ):
+        asyncio.run(run_subprocess_async(*fail_cmd))
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage() == (
+        f"Subprocess command failed: {fail_cmd}\nReturn code: 2\nStdout: \nStderr: bad"
+    )
+
+
+def test_stream_subprocess(caplog: pytest.LogCaptureFixture) -> None:
+    """Test function."""
+    script = "import sys\nfor i in range(5): print(i, flush=True)\nsys.exit({})"
+    lines = stream_subprocess("python", "-c", script.format(0), tail_lines=2)
+    assert next(lines) == "0\n"
+    assert list(lines) == ["1\n", "2\n", "3\n", "4\n"]
+
+    generator = stream_subprocess(
+        "python",
+        "-c",
+        script.format(4),
+        check=False,
+        tail_lines=2,
+    )
+    assert [next(generator) for _ in range(5)] == [f"{i}\n" for i in range(5)]
+    with pytest.raises(StopIteration) as stop:
+        next(generator)
+    result = stop.value.value
+    assert (result.returncode, result.stdout, result.stderr) == (4, "3\n4\n", None)
+
+    with (
+        caplog.at_level(logging.ERROR, logger="pyrig.core.subprocesses"),
+        pytest.raises(subprocess.CalledProcessError) as exc_info,
+    ):
+        list(stream_subprocess("python", "-c", script.format(1), tail_lines=1))
+    assert exc_info.value.output == "4\n"
+    assert len(caplog.records) == 1
+
+
+def test_run_subprocess_streaming() -> None:
+    """Test function."""
+    lines: list[str] = []
+    script = "import sys; print('out'); print('err', file=sys.stderr, flush=True)"
+    result = run_subprocess_streaming("python", "-c", script, on_line=lines.append)
+    assert sorted(lines) == ["err\n", "out\n"]
+    assert result.returncode == 0
+    assert sorted(result.stdout.splitlines()) == ["err", "out"]
+
+    with pytest.raises(subprocess.CalledProcessError):
+        run_subprocess_streaming("false", on_line=lines.append)
+    result = run_subprocess_streaming("false", check=False, on_line=lines.append)
+    assert result.returncode == 1
+
+
+def test_log_subprocess_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test function."""
+    error = subprocess.CalledProcessError(1, ("git",), output="out", stderr="err")
+    with caplog.at_level(logging.ERROR, logger="pyrig.core.subprocesses"):
+        log_subprocess_error(error)
+    record = caplog.records[0]
+    assert record.exc_info is not None
+    assert record.exc_info[1] is error
+    assert record.getMessage() == (
+        "Subprocess command failed: ('git',)\nReturn code: 1\nStdout: out\nStderr: err"
+    )
+
+
 def test_run_subprocess_cached() -> None:
     """Test function."""
     result1 = run_subprocess_cached("echo", "hello")
@@ -56,6 +190,135 @@ def test_run_subprocess_cached() -> None:
     assert result1.stderr == "", f"Expected stderr '', got {result1.stderr}"
 
 
+def test_run_subprocess_persisted(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    cache_dir = tmp_path / "cache"
+    invalidator = tmp_path / "config"
+    run_mock = mocker.patch(
+        f"{run_subprocess.__module__}.{run_subprocess.__name__}",
+        side_effect=run_subprocess,
+    )
+
+    result1 = run_subprocess_persisted(
+        "echo",
+        "hello",
+        cache_dir=cache_dir,
+        invalidators=[invalidator],
+    )
+    result2 = run_subprocess_persisted(
+        "echo",
+        "hello",
+        cache_dir=cache_dir,
+        invalidators=[invalidator],
+    )
+    assert result1.stdout == result2.stdout == "hello\n"
+    assert result2.args == ("echo", "hello")
+    run_mock.assert_called_once()
+
+    # creating an invalidator file re-runs the command
+    invalidator.write_text("changed")
+    run_subprocess_persisted(
+        "echo",
+        "hello",
+        cache_dir=cache_dir,
+        invalidators=[invalidator],
+    )
+    assert run_mock.call_count == 2  # noqa: PLR2004
+
+    # an expired result re-runs the command
+    run_subprocess_persisted(
+        "echo",
+        "hello",
+        cache_dir=cache_dir,
+        invalidators=[invalidator],
+        ttl=-1,
+    )
+    assert run_mock.call_count == 3  # noqa: PLR2004
+
+    # a failing command is not persisted
+    fail_cmd = ("python", "-c", "import sys; sys.exit(1)")
+    for _ in range(2):
+        with pytest.raises(subprocess.CalledProcessError):
+            run_subprocess_persisted(*fail_cmd, cache_dir=cache_dir)
+    assert run_mock.call_count == 5  # noqa: PLR2004
+
+
+def test_persisted_run_key(tmp_path: Path) -> None:
+    """Test function."""
+    invalidator = tmp_path / "config"
+    key = persisted_run_key("git", "status", check=True, invalidators=[invalidator])
+    assert key == persisted_run_key(
+        "git",
+        "status",
+        check=True,
+        invalidators=[invalidator],
+    )
+    assert key != persisted_run_key("git", "status", check=False, invalidators=[])
+    assert key != persisted_run_key("git", "log", check=True, invalidators=[])
+
+    invalidator.write_text("a")
+    changed = persisted_run_key("git", "status", check=True, invalidators=[invalidator])
+    assert changed != key
+
+    with chdir(tmp_path):
+        assert key != persisted_run_key(
+            "git",
+            "status",
+            check=True,
+            invalidators=[invalidator],
+        )
+
+
+def test_load_persisted_run(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    path = tmp_path / "run.json"
+    assert load_persisted_run(path, ttl=60) is None
+
+    for content in ("not json", "{}", "[]", '{"created": "now"}'):
+        path.write_text(content)
+        assert load_persisted_run(path, ttl=60) is None
+
+    result = subprocess.CompletedProcess(("echo",), 0, stdout="out", stderr="err")
+    store_persisted_run(path, result, max_entries=1)
+    os.utime(path, (0, 0))
+    loaded = load_persisted_run(path, ttl=60)
+    assert loaded is not None
+    assert (loaded.args, loaded.returncode, loaded.stdout, loaded.stderr) == (
+        ("echo",),
+        0,
+        "out",
+        "err",
+    )
+    # a reuse marks the result as recently used
+    assert path.stat().st_mtime > 0
+
+    assert load_persisted_run(path, ttl=-1) is None
+
+    mocker.patch.object(os, os.utime.__name__, side_effect=PermissionError)
+    assert load_persisted_run(path, ttl=60) is None
+
+
+def test_store_persisted_run(tmp_path: Path) -> None:
+    """Test function."""
+    result = subprocess.CompletedProcess(("echo",), 1, stdout="out", stderr="")
+    for index in range(3):
+        path = tmp_path / f"{index}.json"
+        store_persisted_run(path, result, max_entries=2)
+        os.utime(path, (index, index))
+    # an entry that vanishes while the entries are listed is skipped
+    (tmp_path / "vanished.json").symlink_to(tmp_path / "missing.json")
+
+    store_persisted_run(tmp_path / "3.json", result, max_entries=2)
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == [
+        "2.json",
+        "3.json",
+        "vanished.json",
+    ]
+    data = json.loads((tmp_path / "3.json").read_text())
+    assert data["args"] == ["echo"]
+    assert data["returncode"] == 1
+
+
 class TestArgs:
     """Test class."""
 
@@ -93,6 +356,30 @@ def test_run_cached(self) -> None:
         )
         assert result1.stderr == "", f"Expected stderr '', got {result1.stderr}"
 
+    def test_run_persisted(self, tmp_path: Path) -> None:
+        """Test method."""
+        args = Args("echo")
+        result1 = args.run_persisted("hello", cache_dir=tmp_path)
+        result2 = args.run_persisted("hello", cache_dir=tmp_path)
+        assert result1.stdout == result2.stdout == "hello\n"
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_stream(self) -> None:
+        """Test method."""
+        assert list(Args("echo", "a").stream("b")) == ["a b\n"]
+
+    def test_run_streaming(self) -> None:
+        """Test method."""
+        lines: list[str] = []
+        result = Args("echo", "a").run_streaming("b", on_line=lines.append)
+        assert lines == ["a b\n"]
+        assert result.stdout == "a b\n"
+
+    def test_run_many(self) -> None:
+        """Test method."""
+        results = Args.run_many([Args("echo", "a"), Args("echo", "b")])
+        assert [result.stdout for result in results] == ["a\n", "b\n"]
+
     def test___str__(self) -> None:
         """Test method."""
         args = Args("uv", "run", "pytest")
@@ -12,6 +12,7 @@
     remove_pyrig_hooks,
     uninstall_pyrig,
 )
+from pyrig.rig.configs.base.config_file import clear_loaded_documents
 from pyrig.rig.configs.version_control.hooks.manager import (
     VersionControlHookManagerConfigFile,
 )
@@ -48,7 +49,7 @@ def test_remove_pyrig_hooks(tmp_path: Path, mocker: MockerFixture) -> None:
         )
 
     VersionControlHookManagerConfigFile.I.configs.cache_clear()
-    VersionControlHookManagerConfigFile.I.load.cache_clear()
+    clear_loaded_documents()
 
 
 def test_uninstall_pyrig(mocker: MockerFixture, tmp_path: Path) -> None:
@@ -0,0 +1,172 @@
+"""module."""
+
+import json
+from contextlib import chdir
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pyrig.rig.cli.commands.shard_tests import (
+    balanced_shards,
+    load_durations,
+    print_quick_files,
+    print_shard_files,
+    print_timeout_minutes,
+    quick_files,
+    record_durations,
+    report_durations,
+    shard_files,
+    suite_files,
+    timeout_minutes,
+)
+from pyrig.rig.tools.testing.project import ProjectTester
+
+
+@pytest.fixture
+def suite(tmp_path: Path) -> Path:
+    """Create a project with four test files and recorded durations."""
+    for name in ("test_a.py", "test_b.py", "sub/test_c.py", "sub/test_d.py"):
+        path = tmp_path / ProjectTester.I.package_root() / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / ProjectTester.I.package_root() / "conftest.py").write_text("")
+    durations = tmp_path / ProjectTester.I.durations_path()
+    durations.parent.mkdir(parents=True)
+    durations.write_text(json.dumps({"tests/test_a.py": 3.0, "tests/test_b.py": 1.0}))
+    return tmp_path
+
+
+@pytest.fixture
+def junit_report(tmp_path: Path) -> Path:
+    """Write a JUnit XML report in pytest's xunit1 format."""
+    path = tmp_path / "junit.xml"
+    path.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<testsuites><testsuite name="pytest">'
+        '<testcase file="tests/test_a.py" name="test_x" time="1.5" />'
+        '<testcase file="tests/test_a.py" name="test_y" time="0.5" />'
+        '<testcase file="tests/sub/test_c.py" name="test_z" time="0.25" />'
+        "</testsuite></testsuites>",
+    )
+    return path
+
+
+def test_print_shard_files(suite: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test function."""
+    with chdir(suite):
+        print_shard_files(1, 2)
+    assert capsys.readouterr().out == "tests/test_a.py tests/test_b.py"
+
+
+def test_shard_files(suite: Path) -> None:
+    """Test function."""
+    with chdir(suite):
+        first, second = shard_files(1, 2), shard_files(2, 2)
+    # unrecorded files are assumed to take the mean recorded duration
+    assert first == [Path("tests/test_a.py"), Path("tests/test_b.py")]
+    assert second == [Path("tests/sub/test_c.py"), Path("tests/sub/test_d.py")]
+
+
+def test_print_quick_files(
+    suite: Path,
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    """Test function."""
+    mocker.patch.object(
+        ProjectTester,
+        ProjectTester.quick_tests_seconds.__name__,
+        return_value=1.0,
+    )
+    with chdir(suite):
+        print_quick_files()
+    assert capsys.readouterr().out == "tests/test_b.py"
+
+
+def test_quick_files(suite: Path, tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test function."""
+    with chdir(suite):
+        assert len(quick_files()) == 4  # noqa: PLR2004
+        quick_tests_seconds = mocker.patch.object(
+            ProjectTester,
+            ProjectTester.quick_tests_seconds.__name__,
+            return_value=3.0,
+        )
+        # unrecorded files are assumed to take the mean recorded duration
+        assert quick_files() == [Path("tests/sub/test_c.py"), Path("tests/test_b.py")]
+        quick_tests_seconds.return_value = 0.0
+        # the quickest file is always included
+        assert quick_files() == [Path("tests/test_b.py")]
+        (tmp_path / ProjectTester.I.durations_path()).unlink()
+        assert quick_files() == []
+
+
+def test_print_timeout_minutes(
+    suite: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test function."""
+    with chdir(suite):
+        print_timeout_minutes(2)
+    assert capsys.readouterr().out == "11\n"
+
+
+def test_timeout_minutes(suite: Path) -> None:
+    """Test function."""
+    with chdir(suite):
+        assert timeout_minutes(2) == ProjectTester.I.timeout_minutes(2.0)
+        ProjectTester.I.durations_path().unlink()
+        assert timeout_minutes(2) == 360  # noqa: PLR2004
+
+
+def test_suite_files(suite: Path) -> None:
+    """Test function."""
+    with chdir(suite):
+        assert suite_files() == [
+            Path("tests/sub/test_c.py"),
+            Path("tests/sub/test_d.py"),
+            Path("tests/test_a.py"),
+            Path("tests/test_b.py"),
+        ]
+
+
+def test_balanced_shards() -> None:
+    """Test function."""
+    files = [Path(f"test_{name}.py") for name in "abcde"]
+    durations = {"test_a.py": 4.0, "test_b.py": 3.0, "test_c.py": 2.0}
+    a, b, c, d, e = files
+    assert balanced_shards(files, durations, count=2) == [[a, e], [b, c, d]]
+    assert balanced_shards(files, {}, count=2) == [[a, c, e], [b, d]]
+    assert balanced_shards([a], {}, count=3) == [[a], [], []]
+
+
+def test_load_durations(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "durations.json"
+    assert load_durations(path) == {}
+    path.write_text("not json")
+    assert load_durations(path) == {}
+    path.write_text('{"tests/test_a.py": 1.5}')
+    assert load_durations(path) == {"tests/test_a.py": 1.5}
+
+
+def test_record_durations(tmp_path: Path, junit_report: Path) -> None:
+    """Test function."""
+    other = tmp_path / "other.xml"
+    other.write_text(
+        '<testsuites><testsuite><testcase file="tests/test_a.py" time="4" />'
+        "</testsuite></testsuites>",
+    )
+    with chdir(tmp_path):
+        record_durations([junit_report, other])
+        recorded = load_durations(ProjectTester.I.durations_path())
+    assert recorded == {"tests/sub/test_c.py": 0.25, "tests/test_a.py": 3.0}
+
+
+def test_report_durations(junit_report: Path) -> None:
+    """Test function."""
+    assert report_durations(junit_report) == {
+        "tests/test_a.py": 2.0,
+        "tests/sub/test_c.py": 0.25,
+    }
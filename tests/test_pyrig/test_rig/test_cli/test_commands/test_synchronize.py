@@ -8,14 +8,24 @@
 
 from pyrig.rig.cli.commands import synchronize
 from pyrig.rig.cli.commands.synchronize import (
+    changed_files,
+    check_project,
+    config_file_subclasses,
+    full_synchronization_paths,
+    mirror_test_source_files,
+    mirror_test_subclass,
+    mirror_test_subclasses,
+    mirrored_source_file,
     synchronize_project,
     validate_config_files,
+    validate_test_file_shard,
     validate_test_files,
 )
 from pyrig.rig.configs.base.config_file import ConfigFile
 from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.tests import mirror_test
 from pyrig.rig.tests.mirror_test import MirrorTestConfigFile
+from pyrig.rig.tools.version_control.controller import VersionController
 
 
 def test_synchronize_project(mocker: MockerFixture) -> None:
@@ -34,13 +44,97 @@ def test_synchronize_project(mocker: MockerFixture) -> None:
     synchronize_project([])
 
     config_file_mock.assert_called_once_with([])
-    mirror_test_mock.assert_called_once_with([])
+    mirror_test_mock.assert_called_once_with([], jobs=1)
+
+    synchronize_project([], jobs=4)
+    mirror_test_mock.assert_called_with([], jobs=4)
 
     config_file_mock.return_value = (PyprojectConfigFile,)
 
     with pytest.raises(typer.Exit):
         synchronize_project([])
 
+    config_file_mock.return_value = ()
+    changed_files_mock = mocker.patch.object(
+        synchronize,
+        changed_files.__name__,
+        return_value=[Path("README.md")],
+    )
+    synchronize_project([Path("LICENSE")], changed=True)
+    config_file_mock.assert_called_with([Path("LICENSE"), Path("README.md")])
+    synchronize_project(None, changed=True)
+    config_file_mock.assert_called_with([Path("README.md")])
+
+    changed_files_mock.return_value = None
+    synchronize_project([Path("LICENSE")], changed=True)
+    config_file_mock.assert_called_with(None)
+
+    check_project_mock = mocker.patch.object(synchronize, check_project.__name__)
+    config_file_mock.reset_mock()
+    synchronize_project([Path("LICENSE")], check=True, diff=True)
+    check_project_mock.assert_called_once_with([Path("LICENSE")], diff=True)
+    config_file_mock.assert_not_called()
+
+
+def test_check_project(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test function."""
+    mirror_check_mock = mocker.patch.object(
+        MirrorTestConfigFile.L,
+        ConfigFile.check_subclasses.__name__,
+        return_value={},
+    )
+    config_check_mock = mocker.patch.object(
+        ConfigFile,
+        ConfigFile.check_subclasses.__name__,
+        return_value={},
+    )
+    check_project([], diff=True)
+    assert capsys.readouterr().out == ""
+    config_check_mock.assert_called_once()
+    mirror_check_mock.assert_called_once()
+
+    config_check_mock.return_value = {PyprojectConfigFile.L: ["", "tool.ruff"]}
+    with pytest.raises(typer.Exit):
+        check_project([], diff=False)
+    out = capsys.readouterr().out
+    assert "Would update" in out
+    assert "missing" not in out
+
+    with pytest.raises(typer.Exit):
+        check_project([], diff=True)
+    out = capsys.readouterr().out
+    assert "  missing <entire file>" in out
+    assert "  missing tool.ruff" in out
+
+
+def test_changed_files(mocker: MockerFixture) -> None:
+    """Test function."""
+    changed = [Path("README.md"), Path("src/pyrig/core/iterate.py")]
+    changed_files_mock = mocker.patch.object(
+        VersionController,
+        VersionController.changed_files.__name__,
+        return_value=changed,
+    )
+    assert changed_files() == changed
+
+    changed_files_mock.return_value = [*changed, Path("pyproject.toml")]
+    assert changed_files() is None
+
+    changed_files_mock.return_value = [Path("src/pyrig/rig/tools/pyrigger.py")]
+    assert changed_files() is None
+
+
+def test_full_synchronization_paths() -> None:
+    """Test function."""
+    assert full_synchronization_paths() == (
+        Path("pyproject.toml"),
+        Path("uv.lock"),
+        Path("src/pyrig/rig"),
+    )
+
 
 def test_validate_config_files(mocker: MockerFixture) -> None:
     """Test function."""
@@ -85,3 +179,95 @@ def test_validate_test_files(mocker: MockerFixture) -> None:
 
     non_python_path = Path("src/pyrig/py.typed")
     assert validate_test_files([non_python_path]) == ()
+
+    # the worker processes validate the real, already complete mirror tests
+    synchronize_path = Path(synchronize.__file__).relative_to(Path.cwd())
+    assert validate_test_files([mirror_test_path, synchronize_path], jobs=2) == ()
+    assert validate_test_files([outside_path], jobs=2) == ()
+
+
+def test_validate_test_file_shard(mocker: MockerFixture) -> None:
+    """Test function."""
+    mirror_test_path = Path("src/pyrig/rig/tests/mirror_test.py")
+    validate_mock = mocker.patch.object(
+        MirrorTestConfigFile,
+        MirrorTestConfigFile.validate_subclasses.__name__,
+        side_effect=tuple,
+    )
+    assert validate_test_file_shard([mirror_test_path]) == [mirror_test_path]
+
+    validate_mock.side_effect = lambda _subclasses: ()
+    assert validate_test_file_shard([mirror_test_path]) == []
+
+
+def test_config_file_subclasses() -> None:
+    """Test function."""
+    assert set(config_file_subclasses(None)) == set(ConfigFile.concrete_leaves())
+
+    target = PyprojectConfigFile.L
+    assert set(config_file_subclasses([target().path()])) == {target}
+
+    assert list(config_file_subclasses([])) == []
+
+
+def test_mirror_test_subclasses() -> None:
+    """Test function."""
+    all_modules = {
+        subclass().mirror_module() for subclass in mirror_test_subclasses(None)
+    }
+    assert mirror_test in all_modules
+
+    mirror_test_path = Path("src/pyrig/rig/tests/mirror_test.py")
+    one_modules = {
+        subclass().mirror_module()
+        for subclass in mirror_test_subclasses([mirror_test_path])
+    }
+    assert one_modules == {mirror_test}
+
+    init_path = Path("src/pyrig/rig/tests/__init__.py")
+    assert list(mirror_test_subclasses([init_path])) == []
+
+
+def test_mirror_test_source_files() -> None:
+    """Test function."""
+    all_files = mirror_test_source_files(None)
+    mirror_test_path = Path("src/pyrig/rig/tests/mirror_test.py")
+    assert mirror_test_path in all_files
+    assert all(file.name != "__init__.py" for file in all_files)
+
+    init_path = Path("src/pyrig/rig/tests/__init__.py")
+    outside_path = Path("pyproject.toml")
+    files = [init_path, outside_path, mirror_test_path]
+    assert mirror_test_source_files(files) == [mirror_test_path]
+
+    # deleted files and the original paths of renamed files are skipped
+    deleted_path = Path("src/pyrig/core/gone.py")
+    assert mirror_test_source_files([deleted_path, mirror_test_path]) == [
+        mirror_test_path,
+    ]
+
+    # a changed test file stands for its source file, which is listed once
+    test_path = Path("tests/test_pyrig/test_rig/test_tests/test_mirror_test.py")
+    assert mirror_test_source_files([test_path]) == [mirror_test_path]
+    assert mirror_test_source_files([test_path, mirror_test_path]) == [
+        mirror_test_path,
+    ]
+    conftest_path = Path("tests/conftest.py")
+    assert mirror_test_source_files([conftest_path]) == []
+
+
+def test_mirrored_source_file() -> None:
+    """Test function."""
+    test_path = Path("tests/test_pyrig/test_rig/test_tests/test_mirror_test.py")
+    assert mirrored_source_file(test_path) == Path(
+        "src/pyrig/rig/tests/mirror_test.py",
+    )
+    source_path = Path("src/pyrig/rig/tests/mirror_test.py")
+    assert mirrored_source_file(source_path) == source_path
+
+
+def test_mirror_test_subclass() -> None:
+    """Test function."""
+    subclass = mirror_test_subclass(Path("src/pyrig/rig/tests/mirror_test.py"))
+    assert issubclass(subclass, MirrorTestConfigFile)
+    assert subclass().mirror_module() is mirror_test
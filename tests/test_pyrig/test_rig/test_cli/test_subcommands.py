@@ -5,10 +5,20 @@
 
 from pyrig.rig.cli.commands.init_project import init_project
 from pyrig.rig.cli.commands.scratch import run_scratch_file
+from pyrig.rig.cli.commands.shard_tests import (
+    print_quick_files,
+    print_shard_files,
+    print_timeout_minutes,
+    record_durations,
+)
 from pyrig.rig.cli.commands.synchronize import synchronize_project
 from pyrig.rig.cli.subcommands import (
     init,
+    quick_tests,
+    record_test_durations,
     scratch,
+    shard_tests,
+    shard_timeout,
     sync,
 )
 
@@ -20,6 +30,8 @@ def test_sync(
     """Test function."""
     assert command_works(sync)
     assert command_calls_function(sync, synchronize_project, [])
+    assert command_calls_function(sync, synchronize_project, ["--changed"])
+    assert command_calls_function(sync, synchronize_project, ["--check", "--diff"])
 
 
 def test_init(
@@ -38,3 +50,44 @@ def test_scratch(
     """Test function."""
     assert command_works(scratch)
     assert command_calls_function(scratch, run_scratch_file, [])
+
+
+def test_shard_tests(
+    command_works: Callable[[FunctionType], bool],
+    command_calls_function: Callable[[FunctionType, FunctionType, Iterable[str]], bool],
+) -> None:
+    """Test function."""
+    assert command_works(shard_tests)
+    assert command_calls_function(shard_tests, print_shard_files, ["2", "2"])
+    assert not command_calls_function(shard_tests, print_shard_files, ["3", "2"])
+
+
+def test_record_test_durations(
+    command_works: Callable[[FunctionType], bool],
+    command_calls_function: Callable[[FunctionType, FunctionType, Iterable[str]], bool],
+) -> None:
+    """Test function."""
+    assert command_works(record_test_durations)
+    assert command_calls_function(
+        record_test_durations,
+        record_durations,
+        ["report.xml"],
+    )
+
+
+def test_quick_tests(
+    command_works: Callable[[FunctionType], bool],
+    command_calls_function: Callable[[FunctionType, FunctionType, Iterable[str]], bool],
+) -> None:
+    """Test function."""
+    assert command_works(quick_tests)
+    assert command_calls_function(quick_tests, print_quick_files, [])
+
+
+def test_shard_timeout(
+    command_works: Callable[[FunctionType], bool],
+    command_calls_function: Callable[[FunctionType, FunctionType, Iterable[str]], bool],
+) -> None:
+    """Test function."""
+    assert command_works(shard_timeout)
+    assert command_calls_function(shard_timeout, print_timeout_minutes, ["2"])
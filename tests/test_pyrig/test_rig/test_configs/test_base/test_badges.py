@@ -7,6 +7,7 @@
 
 from pyrig.core.subprocesses import Args
 from pyrig.rig.configs.base.badges import BadgesConfigFile
+from pyrig.rig.configs.base.config_file import clear_loaded_documents
 from pyrig.rig.configs.community.license import LicenseConfigFile
 from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.configs.readme import ReadmeConfigFile
@@ -17,7 +18,7 @@
 class TestBadgesConfigFile:
     """Test class."""
 
-    def test_merge_configs(  # noqa: PLR0915
+    def test_merge_configs(
         self,
         tmp_project_root_path: Path,
         mocker: MockerFixture,
@@ -31,11 +32,9 @@ def test_merge_configs(  # noqa: PLR0915
         assert VersionController.I.has_commits()
 
         ReadmeConfigFile.configs.cache_clear()
-        ReadmeConfigFile.load.cache_clear()
         PyprojectConfigFile.configs.cache_clear()
-        PyprojectConfigFile.load.cache_clear()
         LicenseConfigFile.configs.cache_clear()
-        LicenseConfigFile.load.cache_clear()
+        clear_loaded_documents()
         with chdir(tmp_project_root_path):
             # avoid real `uv add` calls: this tmp project has no installable
             # source layout, only pyproject.toml/README/LICENSE are needed here
@@ -92,11 +91,9 @@ def test_merge_configs(  # noqa: PLR0915
 
         # clear the cache so other tests have the correct readme configs again
         ReadmeConfigFile.configs.cache_clear()
-        ReadmeConfigFile.load.cache_clear()
         PyprojectConfigFile.configs.cache_clear()
-        PyprojectConfigFile.load.cache_clear()
         LicenseConfigFile.configs.cache_clear()
-        LicenseConfigFile.load.cache_clear()
+        clear_loaded_documents()
 
     def test_replace_badges(self, mocker: MockerFixture) -> None:
         """Test method."""
@@ -122,7 +119,7 @@ def test_replace_badges(self, mocker: MockerFixture) -> None:
 
     def test_replace_description(self) -> None:
         """Test that replace_description replaces a stale description."""
-        PyprojectConfigFile().load.cache_clear()
+        clear_loaded_documents()
         correct_description = PyprojectConfigFile().project_description()
         false_description = "Old stale project description"
         content = f"# Project\n\n---\n\n> {false_description}\n\n---\n"
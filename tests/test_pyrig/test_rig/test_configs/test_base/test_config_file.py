@@ -1,7 +1,9 @@
 """module."""
 
 import copy
+import hashlib
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -10,10 +12,18 @@
 from pytest_mock import MockerFixture
 
 from pyrig.rig import configs
-from pyrig.rig.configs.base.config_file import ConfigFile, Priority
+from pyrig.rig.configs.base.config_file import (
+    LOADED_DOCUMENTS,
+    ConfigFile,
+    Priority,
+    clear_loaded_documents,
+    file_stamp,
+)
+from pyrig.rig.configs.base.yaml import YAMLConfigFile
 from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.configs.readme import ReadmeConfigFile
 from pyrig.rig.configs.scratch import ScratchConfigFile
+from pyrig.rig.tools.pyrigger import Pyrigger
 
 
 @pytest.fixture
@@ -67,6 +77,50 @@ def _configs(self) -> dict[str, Any]:
     return MyTestConfigFile
 
 
+def test_file_stamp(tmp_path: Path) -> None:
+    """Test function."""
+    path = tmp_path / "file.txt"
+    assert file_stamp(path) is None
+    path.write_text("content")
+    stamp = file_stamp(path)
+    assert stamp is not None
+    assert stamp[1] == len("content")
+    assert file_stamp(path) == stamp
+    path.write_text("changed content")
+    assert file_stamp(path) != stamp
+
+
+def test_clear_loaded_documents(
+    my_test_config_file: type[ConfigFile[dict[str, Any]]],
+) -> None:
+    """Test function."""
+    loaded = my_test_config_file.load()
+    clear_loaded_documents(Path("other.txt"))
+    assert my_test_config_file.load() is loaded
+    clear_loaded_documents(my_test_config_file().path())
+    assert my_test_config_file.load() is not loaded
+
+    loaded = my_test_config_file.load()
+    clear_loaded_documents()
+    assert not LOADED_DOCUMENTS
+    assert my_test_config_file.load() is not loaded
+
+    # clearing is safe while other threads add documents
+    config_files = [
+        type(
+            f"StagedConfigFile{i}",
+            (my_test_config_file,),
+            {"stem": lambda _self, i=i: f"staged_{i}"},
+        )
+        for i in range(200)
+    ]
+    with ThreadPoolExecutor() as executor:
+        staged = executor.map(lambda cf: cf().stage({}), config_files)
+        for _ in config_files:
+            clear_loaded_documents(my_test_config_file().path())
+        list(staged)
+
+
 class TestConfigFile:
     """Test class."""
 
@@ -122,6 +176,15 @@ def test_discovery_module(self) -> None:
         """Test method."""
         assert ConfigFile.discovery_module() is configs
 
+    def test_subclasses(self) -> None:
+        """Test method."""
+        result = set(ConfigFile.subclasses())
+        assert PyprojectConfigFile in result
+
+    def test_registry_dir(self) -> None:
+        """Test method."""
+        assert ConfigFile.registry_dir() == Pyrigger.I.cache_dir() / "registry"
+
     def test_create_file(
         self,
         my_test_config_file: type[ConfigFile[dict[str, Any]]],
@@ -146,7 +209,7 @@ def test__load(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> N
         assert loaded["key0"] == "value0"  # cache still has old value
 
         # clear cache and assert new value
-        my_test_config_file.load.cache_clear()
+        clear_loaded_documents(my_test_config_file().path())
         loaded = my_test_config_file().load()
         assert loaded["key0"] == "new_value0"
 
@@ -170,6 +233,7 @@ def test_validate_subclasses(
         self,
         mocker: MockerFixture,
         my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        tmp_path: Path,
     ) -> None:
         """Test method."""
         mock = mocker.patch.object(
@@ -180,6 +244,108 @@ def test_validate_subclasses(
         my_test_config_file.validate_subclasses([my_test_config_file])
         mock.assert_called_once()
 
+        # a tier of several YAML files is written concurrently and correctly;
+        # absolute paths, as the working directory is shared by all threads
+        configs = {"jobs": {f"job-{i}": {"steps": ["a", "b\nc"]} for i in range(20)}}
+        yaml_files = [
+            type(
+                f"YAMLConfigFile{i}",
+                (YAMLConfigFile,),
+                {
+                    "parent_path": lambda _self: tmp_path,
+                    "stem": lambda _self, i=i: f"tier_{i}",
+                    "_configs": lambda _self: configs,
+                    "fingerprinted": lambda _self: False,
+                },
+            )
+            for i in range(8)
+        ]
+        assert len(ConfigFile.priority_tiers(yaml_files)) == 1
+        assert all(yaml_file().validates_concurrently() for yaml_file in yaml_files)
+        assert ConfigFile.validate_subclasses(yaml_files) == tuple(yaml_files)
+        for yaml_file in yaml_files:
+            assert yaml_file.load() == configs
+            assert yaml_file().is_correct()
+
+        # results are reported per tier, in priority order
+        mocker.patch.object(
+            ConfigFile,
+            ConfigFile.validate_subclass.__name__,
+            side_effect=lambda cf: cf is ScratchConfigFile,
+        )
+        assert ConfigFile.validate_subclasses(
+            [ScratchConfigFile, PyprojectConfigFile, ReadmeConfigFile],
+        ) == (ReadmeConfigFile, PyprojectConfigFile)
+
+    def test_priority_tiers(self) -> None:
+        """Test method."""
+        tiers = ConfigFile.priority_tiers(
+            [ScratchConfigFile, ReadmeConfigFile, PyprojectConfigFile, EnvConfigFile],
+        )
+        # higher priority first; equal priorities keep their input order
+        assert tiers == [
+            [ReadmeConfigFile],
+            [PyprojectConfigFile],
+            [ScratchConfigFile, EnvConfigFile],
+        ]
+        assert ConfigFile.priority_tiers([]) == []
+
+    def test_validate_tier(self, mocker: MockerFixture) -> None:
+        """Test method."""
+        mock = mocker.patch.object(
+            ConfigFile,
+            ConfigFile.validate_subclass.__name__,
+            side_effect=lambda cf: cf is ScratchConfigFile,
+        )
+        # several files are validated on a thread pool, keeping input order
+        tier = [ScratchConfigFile, PyprojectConfigFile, ReadmeConfigFile]
+        assert ConfigFile.validate_tier(tier) == [True, False, False]
+        assert mock.call_count == len(tier)
+
+        # a single file is validated inline
+        assert ConfigFile.validate_tier([ScratchConfigFile]) == [True]
+
+        # Python files are validated one at a time, after the others
+        calls = mock.call_args_list[-len(tier) - 1 : -1]
+        assert calls[-1].args == (ScratchConfigFile,)
+
+        # a limit of one worker validates sequentially
+        mocker.patch.object(
+            ConfigFile,
+            ConfigFile.max_validation_workers.__name__,
+            return_value=1,
+        )
+        assert ConfigFile.validate_tier(tier) == [True, False, False]
+
+    def test_validate_subclass(
+        self,
+        mocker: MockerFixture,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        mock = mocker.patch.object(
+            my_test_config_file,
+            my_test_config_file.validate.__name__,
+            return_value=True,
+        )
+        assert ConfigFile.validate_subclass(my_test_config_file) is True
+        mock.assert_called_once()
+
+    def test_validates_concurrently(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        assert PyprojectConfigFile().validates_concurrently() is True
+        assert ScratchConfigFile().validates_concurrently() is False
+        # file I/O overridden outside pyrig, here by changing the working
+        # directory, is not known to be thread-safe
+        assert my_test_config_file().validates_concurrently() is False
+
+    def test_max_validation_workers(self) -> None:
+        """Test method."""
+        assert ConfigFile.max_validation_workers() is None
+
     def test_extension_separator(
         self,
         my_test_config_file: type[ConfigFile[dict[str, Any]]],
@@ -199,9 +365,53 @@ def test_parent_path(
     def test_load(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> None:
         """Test method."""
         # assert is dict
-        assert isinstance(my_test_config_file().load(), dict), "Expected dict"
+        loaded = my_test_config_file().load()
+        assert isinstance(loaded, dict), "Expected dict"
+
+        # classes parsing the same file the same way share one parse
+        sibling = type("SiblingConfigFile", (my_test_config_file,), {})
+        assert sibling.load() is loaded
+        assert my_test_config_file.load() is loaded
+
+        # a dump by any of them discards the shared parse
+        sibling().dump(loaded)
+        assert my_test_config_file.load() is not loaded
+
+        # a file that changed on disk is parsed again
+        loaded = my_test_config_file.load()
+        path = my_test_config_file().path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("changed")
+        assert my_test_config_file.load() is not loaded
+
+    def test_document_key(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        path, load = my_test_config_file().document_key()
+        assert path == my_test_config_file().path().absolute()
+        assert load is my_test_config_file._load  # noqa: SLF001
+        sibling = type("SiblingConfigFile", (my_test_config_file,), {})
+        assert sibling().document_key() == my_test_config_file().document_key()
+
+    def test_stage(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> None:
+        """Test method."""
+        staged = {"staged": "value"}
+        my_test_config_file().stage(staged)
+        assert my_test_config_file.load() is staged
+
+        # a file that changed on disk is parsed again
+        path = my_test_config_file().path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("changed")
+        assert "staged" not in my_test_config_file.load()
 
-    def test_dump(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> None:
+    def test_dump(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
         """Test method."""
         # assert dumps correctly
         storage_dict = my_test_config_file().load()
@@ -211,6 +421,39 @@ def test_dump(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> No
         my_test_config_file().dump(dump_dict)
         assert my_test_config_file().load() == dump_dict, "Expected dump to work"
 
+        # content that is already on disk is not written again
+        config_file = my_test_config_file()
+        dump_mock = mocker.patch.object(config_file, "_dump")
+        mocker.patch.object(config_file, "dumps", return_value="content")
+        config_file.path().parent.mkdir(parents=True, exist_ok=True)
+        config_file.path().write_text("content")
+        config_file.dump(dump_dict)
+        dump_mock.assert_not_called()
+        config_file.path().write_text("other content")
+        config_file.dump(dump_dict)
+        dump_mock.assert_called_once_with(dump_dict)
+
+    def test_dumps(self, my_test_config_file: type[ConfigFile[dict[str, Any]]]) -> None:
+        """Test method."""
+        assert my_test_config_file().dumps({"key": "value"}) is None
+
+    def test_is_dumped(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        config_file = my_test_config_file()
+        assert not config_file.is_dumped({})
+
+        mocker.patch.object(config_file, "dumps", return_value="content 👋")
+        assert not config_file.is_dumped({})
+        config_file.path().parent.mkdir(parents=True, exist_ok=True)
+        config_file.path().write_text("content 👋", encoding="utf-8")
+        assert config_file.is_dumped({})
+        config_file.path().write_text("content", encoding="utf-8")
+        assert not config_file.is_dumped({})
+
     def test_extension(
         self,
         my_test_config_file: type[ConfigFile[dict[str, Any]]],
@@ -261,12 +504,22 @@ def test_validate(
             "Expected config to be correct"
         )
 
+        # a correct file stores its fingerprint
+        assert my_test_config_file().validate()
+        assert my_test_config_file().fingerprint_is_current()
+
         # mock is_correct to return False
-        mocker.patch.object(
+        is_correct_mock = mocker.patch.object(
             my_test_config_file,
             my_test_config_file().is_correct.__name__,
             return_value=False,
         )
+        # a current fingerprint skips is_correct
+        assert my_test_config_file().validate()
+        is_correct_mock.assert_not_called()
+
+        # changed bytes invalidate the fingerprint
+        my_test_config_file().path().write_text("changed")
         with pytest.raises(
             RuntimeError,
             match=r"failed to validate .*",
@@ -317,6 +570,162 @@ def test_is_correct(
         my_test_config_file().validate()
         assert my_test_config_file().is_correct()
 
+    def test_missing_paths(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        assert my_test_config_file().missing_paths() == [
+            "key4[0]",
+            "key4[1]",
+            "key7",
+        ]
+        my_test_config_file().validate()
+        assert my_test_config_file().missing_paths() == []
+
+    def test_check(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        dump_mock = mocker.patch.object(
+            my_test_config_file,
+            my_test_config_file.dump.__name__,
+        )
+        config_file = my_test_config_file()
+        assert config_file.check() == [""]
+
+        config_file.path().parent.mkdir(parents=True)
+        config_file.path().write_text("test")
+        assert config_file.check() == ["key4[0]", "key4[1]", "key7"]
+        dump_mock.assert_not_called()
+
+        mocker.stopall()
+        config_file.validate()
+        assert config_file.check() == []
+
+        # a current fingerprint skips missing_paths
+        assert config_file.validate()
+        missing_paths_mock = mocker.patch.object(
+            my_test_config_file,
+            my_test_config_file.missing_paths.__name__,
+        )
+        assert config_file.check() == []
+        missing_paths_mock.assert_not_called()
+
+    def test_check_subclasses(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        assert my_test_config_file.check_subclasses([my_test_config_file]) == {
+            my_test_config_file: [""],
+        }
+
+        # the merged content of an incorrect file is staged, then discarded
+        config_file = my_test_config_file()
+        config_file.path().parent.mkdir(parents=True)
+        config_file.path().write_text("test")
+        dump_spy = mocker.spy(my_test_config_file, my_test_config_file.dump.__name__)
+        stage_spy = mocker.spy(my_test_config_file, my_test_config_file.stage.__name__)
+        assert my_test_config_file.check_subclasses([my_test_config_file]) == {
+            my_test_config_file: ["key4[0]", "key4[1]", "key7"],
+        }
+        (staged,) = stage_spy.call_args.args[1:]
+        assert staged["key7"] == "value7"
+        dump_spy.assert_not_called()
+        assert config_file.document_key() not in LOADED_DOCUMENTS
+        assert not config_file.is_correct()
+
+        mocker.patch.object(
+            ConfigFile,
+            ConfigFile.check.__name__,
+            autospec=True,
+            side_effect=lambda cf: [] if isinstance(cf, ScratchConfigFile) else [""],
+        )
+        missing = ConfigFile.check_subclasses(
+            [ScratchConfigFile, PyprojectConfigFile, ReadmeConfigFile],
+        )
+        assert list(missing) == [ReadmeConfigFile, PyprojectConfigFile]
+
+    def test_fingerprinted(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        assert my_test_config_file().fingerprinted()
+
+    def test_fingerprint(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        config_file = my_test_config_file()
+        config_file.path().parent.mkdir(parents=True)
+        config_file.path().write_text("test")
+        fingerprint = config_file.fingerprint()
+        expected = b"test" + repr(config_file.configs()).encode()
+        assert fingerprint == hashlib.sha256(expected).hexdigest()
+        assert config_file.fingerprint() == fingerprint
+
+        config_file.path().write_text("changed")
+        assert config_file.fingerprint() != fingerprint
+
+    def test_fingerprint_path(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+    ) -> None:
+        """Test method."""
+        path = my_test_config_file().fingerprint_path()
+        assert path.parent == Pyrigger.I.cache_dir() / "fingerprints"
+        assert path != ReadmeConfigFile().fingerprint_path()
+
+    def test_fingerprint_is_current(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        config_file = my_test_config_file()
+        config_file.path().parent.mkdir(parents=True)
+        config_file.path().write_text("test")
+        assert not config_file.fingerprint_is_current()
+
+        config_file.store_fingerprint()
+        assert config_file.fingerprint_is_current()
+
+        mocker.patch.object(
+            my_test_config_file,
+            my_test_config_file.fingerprinted.__name__,
+            return_value=False,
+        )
+        assert not config_file.fingerprint_is_current()
+
+    def test_store_fingerprint(
+        self,
+        my_test_config_file: type[ConfigFile[dict[str, Any]]],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        config_file = my_test_config_file()
+        config_file.path().parent.mkdir(parents=True)
+        config_file.path().write_text("test")
+        config_file.fingerprint_path().unlink(missing_ok=True)
+
+        mocker.patch.object(
+            my_test_config_file,
+            my_test_config_file.fingerprinted.__name__,
+            return_value=False,
+        )
+        config_file.store_fingerprint()
+        assert not config_file.fingerprint_path().exists()
+
+        mocker.stopall()
+        config_file.store_fingerprint()
+        assert config_file.fingerprint_path().read_text() == config_file.fingerprint()
+
     def test_removable_subclasses(self) -> None:
         """Test method."""
         expected = set(ConfigFile.concrete_leaves()) - {
@@ -207,7 +207,7 @@ def test_content(
         module.__doc__ = None
         assert config.content() == "None\n"
 
-    def test_is_correct(
+    def test_missing_paths(
         self,
         my_test_copy_module_only_docstring_config_file: type[
             CopyModuleDocstringConfigFile
@@ -219,5 +219,11 @@ def test_is_correct(
         assert VersionController.I.has_commits()
         with chdir(tmp_path):
             LicenseConfigFile.I.validate()
-            my_test_copy_module_only_docstring_config_file().validate()
-            assert my_test_copy_module_only_docstring_config_file().is_correct()
+            config_file = my_test_copy_module_only_docstring_config_file()
+            config_file.validate()
+            assert config_file.missing_paths() == []
+            assert config_file.is_correct()
+
+            config_file.write_content("x = 1\n")
+            assert config_file.missing_paths() == ["__doc__"]
+            assert not config_file.is_correct()
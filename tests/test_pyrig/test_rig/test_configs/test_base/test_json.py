@@ -48,6 +48,13 @@ def test__dump(self, my_test_json_config_file: type[JSONDictConfigFile]) -> None
         loaded = my_test_json_config_file().load()
         assert loaded == {"key": "value"}
 
+    def test_dumps(self, my_test_json_config_file: type[JSONDictConfigFile]) -> None:
+        """Test method."""
+        content = my_test_json_config_file().dumps({"key": "välue"})
+        assert content == '{\n  "key": "välue"\n}\n'
+        with pytest.raises(ValueError, match="Out of range float values"):
+            my_test_json_config_file().dumps({"key": float("nan")})
+
     def test_extension(
         self,
         my_test_json_config_file: type[JSONDictConfigFile],
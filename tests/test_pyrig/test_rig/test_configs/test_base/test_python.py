@@ -42,6 +42,11 @@ def test_module(self) -> None:
 
         assert PackageInitConfigFile.I.module().__name__ == "pyrig"
 
+    def test_module_name(self) -> None:
+        """Test method."""
+        assert ConftestConfigFile.I.module_name() == "tests.conftest"
+        assert PackageInitConfigFile.I.module_name() == "pyrig"
+
     def test_extension(self) -> None:
         """Test method."""
         expected = "py"
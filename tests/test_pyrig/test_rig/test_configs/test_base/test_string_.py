@@ -114,21 +114,31 @@ def test__dump(self, my_test_string_config_file: type[StringConfigFile]) -> None
         # load doesnt preserve the last "\n" as an "" in list bc of splitlines()
         assert loaded == ["New content.", ""]
 
+    def test_dumps(self, my_test_string_config_file: type[StringConfigFile]) -> None:
+        """Test method."""
+        content = my_test_string_config_file().dumps(["first", "second", ""])
+        assert content == "first\nsecond\n"
+
     def test__configs(self, my_test_string_config_file: type[StringConfigFile]) -> None:
         """Test method."""
         configs = my_test_string_config_file().configs()
         # empty line is added to the end of the file
         assert configs == ["Test content."]
 
-    def test_is_correct(
+    def test_missing_paths(
         self,
         my_test_string_config_file: type[StringConfigFile],
     ) -> None:
         """Test method."""
         my_test_string_config_file().validate()
+        assert my_test_string_config_file().missing_paths() == []
         is_correct = my_test_string_config_file().is_correct()
         assert is_correct, "Expected config to be correct after validation"
 
+        my_test_string_config_file().write_content("Other content.")
+        assert my_test_string_config_file().missing_paths() == ["[0]"]
+        assert not my_test_string_config_file().is_correct()
+
     def test_read_content(
         self,
         my_test_string_config_file: type[StringConfigFile],
@@ -54,6 +54,11 @@ def test_pretty_dump(self, my_test_toml_config_file: type[TOMLConfigFile]) -> No
         text = my_test_toml_config_file().path().read_text()
         assert "key = [\n" in text, "Expected array to be forced multiline"
 
+    def test_dumps(self, my_test_toml_config_file: type[TOMLConfigFile]) -> None:
+        """Test method."""
+        content = my_test_toml_config_file().dumps({"key": ["value"]})
+        assert content == 'key = [\n  "value",\n]\n'
+
     def test__load(self, my_test_toml_config_file: type[TOMLConfigFile]) -> None:
         """Test method."""
         my_test_toml_config_file().validate()
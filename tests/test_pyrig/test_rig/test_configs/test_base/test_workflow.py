@@ -6,8 +6,10 @@
 from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 
 from pyrig.rig.configs.base.workflow import WorkflowConfigFile
+from pyrig.rig.configs.pyproject import PyprojectConfigFile
 from pyrig.rig.configs.version_control.remote.workflows.health_check import (
     HealthCheckWorkflowConfigFile,
 )
@@ -108,7 +110,22 @@ def test_steps_core_installed_setup(
     ) -> None:
         """Test method."""
         result = my_test_workflow().steps_core_installed_setup()
-        assert len(result) > 0
+        assert [step["id"] for step in result] == [
+            "checkout-repository",
+            "setup-package-manager",
+            "restore-tool-caches",
+            "install-dependencies",
+        ]
+        result = my_test_workflow().steps_core_installed_setup(
+            python_version="3.12",
+            update_dependencies=True,
+        )
+        assert result[2]["with"]["restore-keys"] == (
+            "${{ runner.os }}-python-3.12-tools-"
+            "${{ hashFiles('uv.lock', 'prek.toml') }}-\n"
+            "${{ runner.os }}-python-3.12-tools-"
+        )
+        assert result[3]["id"] == "update-dependencies"
 
     def test_id_from_method(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         """Test method."""
@@ -124,6 +141,32 @@ def test__configs(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         assert "name" in result, "Expected 'name' in configs"
         assert "on" in result, "Expected 'on' in configs"
         assert "jobs" in result, "Expected 'jobs' in configs"
+        assert result["concurrency"] == my_test_workflow().concurrency()
+
+    def test_concurrency(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        result = my_test_workflow().concurrency()
+        assert result["group"] == my_test_workflow().concurrency_group()
+        assert result["cancel-in-progress"] == my_test_workflow().cancel_in_progress()
+
+    def test_concurrency_group(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_workflow().concurrency_group()
+        assert result == (
+            "${{ github.workflow }}"
+            "-${{ github.event.pull_request.number || github.run_id }}"
+        )
+
+    def test_cancel_in_progress(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_workflow().cancel_in_progress()
+        assert result == "${{ github.event_name == 'pull_request' }}"
 
     def test_parent_path(
         self,
@@ -196,6 +239,17 @@ def test_job(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         assert len(result) == 1, "Expected job to have one key"
         job_config = next(iter(result.values()))
         assert "steps" not in job_config
+        assert "outputs" not in job_config
+
+        assert "timeout-minutes" not in job_config
+
+        result = my_test_workflow().job(
+            self.test_job,
+            outputs={"a": "b"},
+            timeout_minutes=5,
+        )
+        assert next(iter(result.values()))["outputs"] == {"a": "b"}
+        assert next(iter(result.values()))["timeout-minutes"] == 5  # noqa: PLR2004
 
     def test_name_from_id(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         """Test method."""
@@ -261,6 +315,9 @@ def test_strategy_matrix_os_and_python_version(
         """Test method."""
         result = my_test_workflow().strategy_matrix_os_and_python_version()
         assert "matrix" in result, "Expected 'matrix' in strategy"
+        assert "shard" not in result["matrix"]
+        result = my_test_workflow().strategy_matrix_os_and_python_version(shards=2)
+        assert result["matrix"]["shard"] == [1, 2]
 
     def test_strategy_matrix_os(
         self,
@@ -289,6 +346,10 @@ def test_matrix_os(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         assert "os" in result
         assert result["os"] == ["ubuntu-latest"]
 
+    def test_matrix_shard(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        assert my_test_workflow().matrix_shard(shards=3) == {"shard": [1, 2, 3]}
+
     def test_matrix_python_version(
         self,
         my_test_workflow: type[WorkflowConfigFile],
@@ -326,6 +387,80 @@ def test_step_setup_package_manager(
         """Test method."""
         result = my_test_workflow().step_setup_package_manager(python_version="3.14")
         assert "uses" in result, "Expected 'uses' in step"
+        assert result["with"] == {
+            "python-version": "3.14",
+            "enable-cache": "true",
+            "cache-dependency-glob": "uv.lock",
+        }
+
+    def test_default_python_version(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        expected = PyprojectConfigFile.I.latest_possible_python_version(level="minor")
+        assert my_test_workflow().default_python_version() == str(expected)
+
+    def test_step_restore_tool_caches(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_workflow().step_restore_tool_caches(python_version="3.14")
+        assert result["uses"] == "actions/cache@main"
+        assert result["with"] == {
+            "path": "~/.cache/prek\n.ruff_cache\n.pytest_cache",
+            "key": "${{ runner.os }}-python-3.14-tools-"
+            "${{ hashFiles('uv.lock', 'prek.toml') }}-${{ github.run_id }}",
+            "restore-keys": "${{ runner.os }}-python-3.14-tools-"
+            "${{ hashFiles('uv.lock', 'prek.toml') }}-\n"
+            "${{ runner.os }}-python-3.14-tools-",
+        }
+
+    def test_tool_cache_paths(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        assert ".ruff_cache" in my_test_workflow().tool_cache_paths()
+
+    def test_change_filters(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        assert my_test_workflow().change_filters() == {}
+
+    def test_job_detect_changes(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        mocker.patch.object(
+            my_test_workflow,
+            WorkflowConfigFile.change_filters.__name__,
+            return_value={"code": ["src/**"], "docs": ["docs/**"]},
+        )
+        result = my_test_workflow().job_detect_changes()["detect-changes"]
+        assert result["outputs"] == {
+            "code": "${{ steps.detect-changes.outputs.code }}",
+            "docs": "${{ steps.detect-changes.outputs.docs }}",
+        }
+        assert result["permissions"]["pull-requests"] == "read"
+        assert [step["id"] for step in result["steps"]] == ["detect-changes"]
+
+    def test_step_detect_changes(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        mocker.patch.object(
+            my_test_workflow,
+            WorkflowConfigFile.change_filters.__name__,
+            return_value={"code": ["src/**", "uv.lock"], "docs": ["docs/**"]},
+        )
+        result = my_test_workflow().step_detect_changes()
+        assert result["if"] == "github.event_name == 'pull_request'"
+        assert result["uses"] == "dorny/paths-filter@main"
+        assert result["with"]["filters"] == (
+            "code:\n  - 'src/**'\n  - 'uv.lock'\ndocs:\n  - 'docs/**'"
+        )
 
     def test_step_install_dependencies(
         self,
@@ -362,11 +497,30 @@ def test_insert_github_token(
             f"Expected '${{{{ secrets.GITHUB_TOKEN }}}}', got {result}"
         )
 
+    def test_insert_runner_os(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        assert my_test_workflow().insert_runner_os() == "${{ runner.os }}"
+
+    def test_insert_hash_files(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_workflow().insert_hash_files(Path("uv.lock"), Path("a/b.toml"))
+        assert result == "${{ hashFiles('uv.lock', 'a/b.toml') }}"
+
     def test_insert_matrix_os(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
         """Test method."""
         result = my_test_workflow().insert_matrix_os()
         assert "matrix.os" in result, "Expected 'matrix.os' in result"
 
+    def test_insert_matrix_shard(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        assert my_test_workflow().insert_matrix_shard() == "${{ matrix.shard }}"
+
     def test_insert_matrix_python_version(
         self,
         my_test_workflow: type[WorkflowConfigFile],
@@ -377,6 +531,33 @@ def test_insert_matrix_python_version(
             "Expected 'matrix.python-version' in result"
         )
 
+    def test_if_changed(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        assert my_test_workflow().if_changed("code") == (
+            "github.event_name != 'pull_request' ||\n"
+            "needs.detect-changes.outputs.code == 'true'"
+        )
+
+    def test_if_pull_request(self, my_test_workflow: type[WorkflowConfigFile]) -> None:
+        """Test method."""
+        result = my_test_workflow().if_pull_request()
+        assert result == "github.event_name == 'pull_request'"
+
+    def test_if_not_pull_request(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_workflow().if_not_pull_request()
+        assert result == "github.event_name != 'pull_request'"
+
+    def test_if_no_needs_failed(
+        self,
+        my_test_workflow: type[WorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        assert my_test_workflow().if_no_needs_failed() == "!failure() && !cancelled()"
+
     def test_if_workflow_run_is_success(
         self,
         my_test_workflow: type[WorkflowConfigFile],
@@ -1,16 +1,22 @@
 """module."""
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
 from typing import Any
 
 import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.main import CParser
 
+from pyrig.rig.configs.base.config_file import ConfigFile
 from pyrig.rig.configs.base.yaml import (
-    YAML_DUMP,
     YAMLConfigFile,
     YMLConfigFile,
     represent_str,
+    yaml_dump,
+    yaml_load,
 )
 from pyrig.rig.configs.version_control.remote.workflows.health_check import (
     HealthCheckWorkflowConfigFile,
@@ -44,6 +50,28 @@ def _configs(self) -> dict[str, Any]:
     return MyTestYAMLConfigFile
 
 
+@pytest.fixture
+def yaml_config_file_subclasses() -> list[type[ConfigFile[Any]]]:
+    """Return every concrete YAML config file of the project."""
+    return [
+        subclass
+        for subclass in ConfigFile.concrete_leaves()
+        if issubclass(subclass, YAMLConfigFile)
+    ]
+
+
+@pytest.fixture
+def dumped() -> Callable[[object], str]:
+    """Return a function serializing a configuration as `_dump` writes it."""
+
+    def dumped(configs: object) -> str:
+        stream = StringIO()
+        yaml_dump().dump(configs, stream)
+        return stream.getvalue()
+
+    return dumped
+
+
 class TestYAMLConfigFile:
     """Test class."""
 
@@ -57,6 +85,19 @@ def test__load(
         actual = my_test_yaml_config_file().load()
         assert actual == expected, f"Expected {expected}, got {actual}"
 
+    def test__load_c_and_pure_parsers_agree(
+        self,
+        yaml_config_file_subclasses: list[type[ConfigFile[Any]]],
+        dumped: Callable[[object], str],
+    ) -> None:
+        """Test method."""
+        assert CParser is not None, "Expected ruamel.yaml.clib to be installed"
+        assert yaml_load().Parser is CParser, "Expected the C parser to be used"
+        pure_load = YAML(typ="safe", pure=True)
+        for subclass in yaml_config_file_subclasses:
+            content = dumped(subclass().configs())
+            assert yaml_load().load(content) == pure_load.load(content), subclass
+
     def test__dump(
         self,
         my_test_yaml_config_file: type[YAMLConfigFile[dict[str, Any]]],
@@ -79,6 +120,31 @@ def test__dump_multiline_string_as_literal_block(
         assert '"key": |-' in content, "Expected a literal block scalar"
         assert config_file.load() == {"key": value}, "Expected round-trip to work"
 
+    def test__dump_round_trip_is_byte_identical(
+        self,
+        yaml_config_file_subclasses: list[type[ConfigFile[Any]]],
+        dumped: Callable[[object], str],
+    ) -> None:
+        """Test method."""
+        for subclass in yaml_config_file_subclasses:
+            content = dumped(subclass().configs())
+            assert dumped(yaml_load().load(content)) == content, subclass
+
+        for path in Path(".github").rglob("*.yml"):
+            content = path.read_text()
+            assert dumped(yaml_load().load(content)) == content, path
+
+    def test_dumps(
+        self,
+        my_test_yaml_config_file: type[YAMLConfigFile[dict[str, Any]]],
+        dumped: Callable[[object], str],
+    ) -> None:
+        """Test method."""
+        configs = {"key": ["value", "line1\nline2"]}
+        content = my_test_yaml_config_file().dumps(configs)
+        assert content == dumped(configs)
+        assert content.startswith('---\n"key":\n  - "value"\n')
+
     def test_extension(
         self,
         my_test_yaml_config_file: type[YAMLConfigFile[dict[str, Any]]],
@@ -87,13 +153,22 @@ def test_extension(
         assert my_test_yaml_config_file().extension() == "yaml", "Expected yaml"
 
 
+def test_yaml_load() -> None:
+    """Test function."""
+    assert yaml_load() is yaml_load(), "Expected one instance per thread"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(yaml_load).result()
+    assert other is not yaml_load(), "Expected a new instance per thread"
+    assert yaml_load().load('"key": "value"') == {"key": "value"}
+
+
 def test_represent_str() -> None:
     """Test function."""
-    single_line = represent_str(YAML_DUMP.representer, "value")
+    single_line = represent_str(yaml_dump().representer, "value")
     assert single_line.style == '"', "Expected a double-quoted scalar"
     assert single_line.value == "value", "Expected the value to be unchanged"
 
-    multi_line = represent_str(YAML_DUMP.representer, "line1\nline2")
+    multi_line = represent_str(yaml_dump().representer, "line1\nline2")
     assert multi_line.style == "|", "Expected a literal block scalar"
     assert multi_line.value == "line1\nline2", "Expected the value to be unchanged"
 
@@ -110,3 +185,15 @@ def test_extension(self) -> None:
 
 class TestYMLDictConfigFile:
     """Test class."""
+
+
+def test_yaml_dump() -> None:
+    """Test function."""
+    assert yaml_dump() is yaml_dump(), "Expected one instance per thread"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(yaml_dump).result()
+    assert other is not yaml_dump(), "Expected a new instance per thread"
+    for _ in range(2):
+        stream = StringIO()
+        yaml_dump().dump({"key": ["value"]}, stream)
+        assert stream.getvalue() == '---\n"key":\n  - "value"\n...\n'
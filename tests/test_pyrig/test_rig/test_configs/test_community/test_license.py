@@ -8,6 +8,7 @@
 import requests
 from pytest_mock import MockerFixture
 
+from pyrig.rig.configs.base.config_file import clear_loaded_documents
 from pyrig.rig.configs.community.license import LicenseConfigFile
 from pyrig.rig.configs.pyproject import PyprojectConfigFile
 
@@ -91,9 +92,9 @@ def test_license(self, tmp_path: Path) -> None:
 
         # branch: no LICENSE file on disk -> falls back to the current year
         with chdir(tmp_path):
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
             mit_license = LicenseConfigFile.I.license()
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
         current_year = str(datetime.now(tz=UTC).astimezone().year)
         assert f"Copyright (c) {current_year} Winipedia" in mit_license
         assert "[year]" not in mit_license
@@ -104,9 +105,9 @@ def test_license(self, tmp_path: Path) -> None:
         # current year rather than failing to find a year to read
         with chdir(tmp_path):
             LicenseConfigFile.I.path().touch()
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
             mit_license = LicenseConfigFile.I.license()
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
         assert f"Copyright (c) {current_year} Winipedia" in mit_license
         assert "[year]" not in mit_license
         assert "[fullname]" not in mit_license
@@ -117,9 +118,9 @@ def test_license(self, tmp_path: Path) -> None:
         # back to the current year instead of raising
         with chdir(tmp_path):
             LicenseConfigFile.I.path().write_text("Apache License 2.0\n")
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
             mit_license = LicenseConfigFile.I.license()
-            LicenseConfigFile.load.cache_clear()
+            clear_loaded_documents()
         assert f"Copyright (c) {current_year} Winipedia" in mit_license
         assert "[year]" not in mit_license
         assert "[fullname]" not in mit_license
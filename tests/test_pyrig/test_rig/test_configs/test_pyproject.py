@@ -14,6 +14,7 @@
 )
 from pytest_mock import MockerFixture
 
+from pyrig.rig.configs.base.config_file import ConfigFile
 from pyrig.rig.configs.community.license import LicenseConfigFile
 from pyrig.rig.configs.docs.builder import DocsBuilderConfigFile
 from pyrig.rig.configs.pyproject import (
@@ -23,6 +24,7 @@
 from pyrig.rig.tools.base.tool import Tool
 from pyrig.rig.tools.packages.manager import PackageManager
 from pyrig.rig.tools.pyrigger import Pyrigger
+from pyrig.rig.tools.testing.project import ProjectTester
 from pyrig.rig.tools.version_control.controller import VersionController
 
 
@@ -302,6 +304,20 @@ def test_tool_configs(self) -> None:
         )
         assert len(PyprojectConfigFile.I.tool_configs()) > 0
 
+    def test_coverage_configs(self, mocker: MockerFixture) -> None:
+        """Test method."""
+        shards = mocker.patch.object(
+            ProjectTester,
+            ProjectTester.shards.__name__,
+            return_value=1,
+        )
+        assert PyprojectConfigFile.I.coverage_configs() == {}
+        assert "coverage" not in PyprojectConfigFile.I.tool_configs()
+        shards.return_value = 2
+        expected = {"coverage": {"run": {"relative_files": True}}}
+        assert PyprojectConfigFile.I.coverage_configs() == expected
+        assert "coverage" in PyprojectConfigFile.I.tool_configs()
+
     def test_url_configs(self) -> None:
         """Test method."""
         assert isinstance(PyprojectConfigFile.I.url_configs(), dict)
@@ -332,6 +348,72 @@ def test_validate(
         mock_add.assert_called_once()
         email_mock.assert_called()
 
+    def test_check(
+        self,
+        my_test_pyproject_config_file: type[PyprojectConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        config_file = my_test_pyproject_config_file()
+        assert config_file.check() == [""]
+
+        mocker.patch.object(ConfigFile, ConfigFile.check.__name__, return_value=[])
+        mocker.patch.object(
+            PyprojectConfigFile,
+            PyprojectConfigFile.missing_dependencies.__name__,
+            return_value=("new-runtime-dep",),
+        )
+        mocker.patch.object(
+            PyprojectConfigFile,
+            PyprojectConfigFile.missing_dev_dependencies.__name__,
+            return_value=("new-dev-dep",),
+        )
+        add_args_mock = mocker.patch.object(
+            PackageManager,
+            PackageManager.add_args.__name__,
+        )
+        assert config_file.check() == [
+            "project.dependencies[new-runtime-dep]",
+            "dependency-groups.dev[new-dev-dep]",
+        ]
+        add_args_mock.assert_not_called()
+
+    def test_missing_dependencies(
+        self,
+        my_test_pyproject_config_file: type[PyprojectConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        my_test_pyproject_config_file().dump(
+            {"project": {"dependencies": ["existing_runtime_dep>=1"]}},
+        )
+        mocker.patch.object(
+            Pyrigger,
+            Pyrigger.runtime_dependencies.__name__,
+            return_value=["existing-runtime-dep", "new-runtime-dep"],
+        )
+        assert my_test_pyproject_config_file().missing_dependencies() == (
+            "new-runtime-dep",
+        )
+
+    def test_missing_dev_dependencies(
+        self,
+        my_test_pyproject_config_file: type[PyprojectConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        my_test_pyproject_config_file().dump(
+            {"dependency-groups": {"dev": ["existing-dev-dep"]}},
+        )
+        mocker.patch.object(
+            Tool,
+            Tool.subclasses_dev_dependencies.__name__,
+            return_value=["existing-dev-dep", "new-dev-dep"],
+        )
+        assert my_test_pyproject_config_file().missing_dev_dependencies() == (
+            "new-dev-dep",
+        )
+
     def test_add_additional_dependencies(
         self,
         my_test_pyproject_config_file: type[PyprojectConfigFile],
@@ -354,34 +436,32 @@ def test_add_additional_dependencies(
             Tool.subclasses_dev_dependencies.__name__,
             return_value=["existing-dev-dep", "new-dev-dep"],
         )
-        add_args_mock = mocker.patch.object(
-            PackageManager,
-            PackageManager.add_args.__name__,
-            return_value=mocker.Mock(),
-        )
-        add_group_dev_args_mock = mocker.patch.object(
-            PackageManager,
-            PackageManager.add_group_dev_args.__name__,
-            return_value=mocker.Mock(),
-        )
-        install_deps_mock = mocker.patch.object(
-            PackageManager,
+        # one shared parent records the order of the package manager calls
+        calls = mocker.Mock()
+        for name in (
+            PackageManager.add_group_dev_without_syncing_args.__name__,
+            PackageManager.add_without_syncing_args.__name__,
             PackageManager.install_dependencies.__name__,
-            return_value=mocker.Mock(),
-        )
+        ):
+            calls.attach_mock(mocker.patch.object(PackageManager, name), name)
+        dump_spy = mocker.spy(my_test_pyproject_config_file, "dump")
 
         added = my_test_pyproject_config_file().add_additional_dependencies()
 
         assert added == ("new-runtime-dep", "new-dev-dep")
-        add_args_mock.assert_called_once_with("new-runtime-dep")
-        add_args_mock.return_value.run.assert_called_once()
-        add_group_dev_args_mock.assert_called_once_with("new-dev-dep")
-        add_group_dev_args_mock.return_value.run.assert_called_once()
-        install_deps_mock.return_value.run.assert_called_once()
-
-        # cache was cleared and the config re-dumped; since add_args/
-        # add_group_dev_args are mocked (no real `uv add`), the file content
-        # itself is unchanged and still reflects what was there before
+        assert calls.mock_calls == [
+            mocker.call.add_group_dev_without_syncing_args("new-dev-dep"),
+            mocker.call.add_group_dev_without_syncing_args().run(),
+            mocker.call.add_without_syncing_args("new-runtime-dep"),
+            mocker.call.add_without_syncing_args().run(),
+            mocker.call.install_dependencies(),
+            mocker.call.install_dependencies().run(),
+        ]
+        dump_spy.assert_called_once()
+
+        # cache was cleared and the config re-dumped; since the package
+        # manager is mocked (no real `uv add`), the file content itself is
+        # unchanged and still reflects what was there before
         assert my_test_pyproject_config_file().dependencies() == [
             "existing-runtime-dep",
         ]
@@ -389,19 +469,39 @@ def test_add_additional_dependencies(
             "existing-dev-dep",
         ]
 
-        # nothing missing this time -> no add calls, no cache clear/re-dump
-        add_args_mock.reset_mock()
-        add_group_dev_args_mock.reset_mock()
-        install_deps_mock.reset_mock()
+        # only dev dependencies missing -> they are added and synced
+        calls.reset_mock()
         runtime_deps_mock.return_value = ["existing-runtime-dep"]
+        assert my_test_pyproject_config_file().add_additional_dependencies() == (
+            "new-dev-dep",
+        )
+        assert [call[0] for call in calls.mock_calls] == [
+            "add_group_dev_without_syncing_args",
+            "add_group_dev_without_syncing_args().run",
+            "install_dependencies",
+            "install_dependencies().run",
+        ]
+
+        # only runtime dependencies missing -> the dev group is left alone
+        calls.reset_mock()
+        runtime_deps_mock.return_value = ["new-runtime-dep"]
         dev_deps_mock.return_value = ["existing-dev-dep"]
+        assert my_test_pyproject_config_file().add_additional_dependencies() == (
+            "new-runtime-dep",
+        )
+        calls.add_group_dev_without_syncing_args.assert_not_called()
+        calls.add_without_syncing_args.assert_called_once_with("new-runtime-dep")
+
+        # nothing missing this time -> no add calls, no cache clear/re-dump
+        calls.reset_mock()
+        dump_spy.reset_mock()
+        runtime_deps_mock.return_value = ["existing-runtime-dep"]
 
         added_again = my_test_pyproject_config_file().add_additional_dependencies()
 
         assert added_again == ()
-        add_args_mock.assert_not_called()
-        add_group_dev_args_mock.assert_not_called()
-        install_deps_mock.assert_not_called()
+        assert not calls.mock_calls
+        dump_spy.assert_not_called()
 
     def test_removable(self) -> None:
         """Test method."""
@@ -16,6 +16,11 @@ def test_job(self) -> None:
         expected = "github.event.workflow_run.conclusion == 'success'"
         assert job_config["if"] == expected
 
+    def test_concurrency_group(self) -> None:
+        """Test method."""
+        result = DeployWorkflowConfigFile.I.concurrency_group()
+        assert result == "${{ github.workflow }}-${{ github.ref }}"
+
     def test_stem(self) -> None:
         """Test method."""
         assert DeployWorkflowConfigFile.I.stem() == "deploy"
@@ -3,10 +3,12 @@
 from collections.abc import Callable
 
 import pytest
+from pytest_mock import MockerFixture
 
 from pyrig.rig.configs.version_control.remote.workflows.health_check import (
     HealthCheckWorkflowConfigFile,
 )
+from pyrig.rig.tools.testing.project import ProjectTester
 
 
 @pytest.fixture
@@ -20,6 +22,18 @@ def my_test_health_check_workflow(
     return config_file_factory(HealthCheckWorkflowConfigFile)
 
 
+@pytest.fixture
+def sharded(mocker: MockerFixture) -> int:
+    """Split the test suite into three shards."""
+    shards = 3
+    mocker.patch.object(
+        ProjectTester,
+        ProjectTester.shards.__name__,
+        return_value=shards,
+    )
+    return shards
+
+
 class TestHealthCheckWorkflowConfigFile:
     """Test class."""
 
@@ -55,10 +69,144 @@ def test_workflow_triggers(
     def test_jobs(
         self,
         my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
     ) -> None:
         """Test method."""
         result = my_test_health_check_workflow().jobs()
         assert len(result) > 0, "Expected jobs to be non-empty"
+        assert "combined-coverage" not in result
+        assert "record-test-durations" not in result
+        assert next(iter(result)) == "detect-changes"
+        assert result["matrix-health-checks"]["needs"] == ["detect-changes"]
+        assert result["health-check"]["if"] == "!failure() && !cancelled()"
+
+        sharded = 3
+        mocker.patch.object(
+            ProjectTester,
+            ProjectTester.shards.__name__,
+            return_value=sharded,
+        )
+        result = my_test_health_check_workflow().jobs()
+        assert "combined-coverage" in result
+        assert result["health-check"]["needs"][-2:] == [
+            "combined-coverage",
+            "record-test-durations",
+        ]
+        matrix = result["matrix-health-checks"]["strategy"]["matrix"]
+        assert matrix["shard"] == list(range(1, sharded + 1))
+
+    def test_canary(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        workflow = my_test_health_check_workflow()
+        assert workflow.canary() is False
+        jobs = workflow.jobs()
+        assert "outputs" not in jobs["health-checks"]
+        assert "timeout-minutes" not in jobs["matrix-health-checks"]
+        assert "health-checks" not in jobs["matrix-health-checks"]["needs"]
+
+        mocker.patch.object(
+            my_test_health_check_workflow,
+            HealthCheckWorkflowConfigFile.canary.__name__,
+            return_value=True,
+        )
+        jobs = my_test_health_check_workflow().jobs()
+        assert jobs["health-checks"]["outputs"] == {
+            "timeout-minutes": "${{ steps.shard-timeout.outputs.minutes }}",
+        }
+        steps = [step["id"] for step in jobs["health-checks"]["steps"]]
+        assert steps[-2:] == ["shard-timeout", "run-version-control-hooks"]
+        matrix = jobs["matrix-health-checks"]
+        assert matrix["needs"] == ["detect-changes", "health-checks"]
+        assert matrix["timeout-minutes"] == (
+            "${{ fromJSON(needs.health-checks.outputs.timeout-minutes) }}"
+        )
+        steps = [step["id"] for step in matrix["steps"]]
+        assert steps[-2:] == ["run-tests", "upload-test-results"]
+        assert "combined-coverage" not in jobs
+        assert jobs["health-check"]["needs"][-1] == "record-test-durations"
+
+    def test_records_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        assert my_test_health_check_workflow().records_test_durations() is False
+
+        mocker.patch.object(
+            my_test_health_check_workflow,
+            HealthCheckWorkflowConfigFile.canary.__name__,
+            return_value=True,
+        )
+        assert my_test_health_check_workflow().records_test_durations() is True
+
+    def test_steps_canary(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().steps_canary()
+        assert [step["id"] for step in result] == [
+            "restore-test-durations",
+            "run-quick-tests",
+            "shard-timeout",
+        ]
+
+    def test_step_run_quick_tests(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_run_quick_tests()
+        assert result["if"] == (
+            "${{ steps.restore-test-durations.outputs.cache-matched-key != '' }}"
+        )
+        assert result["run"] == (
+            "uv run pytest --exitfirst --failed-first --cov-fail-under=0"
+            " $(uv run pyrig quick-tests)"
+        )
+
+    def test_step_shard_timeout(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        sharded: int,
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_shard_timeout()
+        assert result["run"] == (
+            f'echo "minutes=$(uv run pyrig shard-timeout {sharded})" >> $GITHUB_OUTPUT'
+        )
+
+    def test_change_filters(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().change_filters()
+        assert list(result) == ["tests"]
+        assert {"src/**", "tests/**", "pyproject.toml", "uv.lock"} <= set(
+            result["tests"],
+        )
+        assert not any(pattern.startswith("docs") for pattern in result["tests"])
+
+    def test_shards(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        shards = mocker.patch.object(
+            ProjectTester,
+            ProjectTester.shards.__name__,
+            return_value=1,
+        )
+        assert my_test_health_check_workflow().shards() is None
+        shards.return_value = 2
+        assert my_test_health_check_workflow().shards() == 2  # noqa: PLR2004
 
     def test_job_matrix_health_checks(
         self,
@@ -90,6 +238,204 @@ def test_steps_matrix_health_checks(
         """Test method."""
         result = my_test_health_check_workflow().steps_matrix_health_checks()
         assert len(result) > 0, "Expected steps to be non-empty"
+        assert "run-tests" in [step["id"] for step in result]
+
+    def test_steps_run_test_shard(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        sharded: int,  # noqa: ARG002
+    ) -> None:
+        """Test method."""
+        workflow = my_test_health_check_workflow()
+        ids = [step["id"] for step in workflow.steps_matrix_health_checks()]
+        assert "run-tests" not in ids
+        result = workflow.steps_run_test_shard()
+        assert [step["id"] for step in result] == [
+            "restore-test-durations",
+            "shard-files",
+            "run-test-shard",
+            "upload-test-results",
+        ]
+        assert set(ids) >= {step["id"] for step in result}
+
+    def test_step_restore_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_restore_test_durations()
+        assert result["uses"] == "actions/cache/restore@main"
+        assert result["with"] == {
+            "path": ".pytest_cache/durations.json",
+            "key": "test-durations-${{ github.run_id }}",
+            "restore-keys": "test-durations-",
+        }
+
+    def test_step_shard_files(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        sharded: int,  # noqa: ARG002
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_shard_files()
+        assert result["run"] == (
+            'echo "files=$(uv run pyrig shard-tests ${{ matrix.shard }} 3)"'
+            " >> $GITHUB_OUTPUT"
+        )
+
+    def test_step_run_test_shard(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        sharded: int,  # noqa: ARG002
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_run_test_shard()
+        assert result["if"] == "${{ steps.shard-files.outputs.files != '' }}"
+        assert result["run"].startswith("uv run pytest --junit-xml=")
+        assert result["run"].endswith(" ${{ steps.shard-files.outputs.files }}")
+
+    def test_step_upload_test_results(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_upload_test_results()
+        assert result["uses"] == "actions/upload-artifact@main"
+        assert result["with"] == {
+            "name": "test-results-${{ matrix.os }}-${{ matrix.python-version }}",
+            "path": ".coverage\n.pytest_cache/junit.xml",
+            "include-hidden-files": "true",
+        }
+
+        mocker.patch.object(
+            ProjectTester,
+            ProjectTester.shards.__name__,
+            return_value=3,
+        )
+        result = my_test_health_check_workflow().step_upload_test_results()
+        assert result["with"]["name"] == (
+            "test-results-${{ matrix.os }}-${{ matrix.python-version }}"
+            "-${{ matrix.shard }}"
+        )
+
+    def test_job_combined_coverage(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().job_combined_coverage()
+        assert result["combined-coverage"]["needs"] == ["matrix-health-checks"]
+
+    def test_steps_combined_coverage(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().steps_combined_coverage()
+        assert [step["id"] for step in result][-3:] == [
+            "download-test-results",
+            "combine-coverage",
+            "report-coverage",
+        ]
+
+    def test_job_record_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().job_record_test_durations()
+        assert result["record-test-durations"]["needs"] == ["matrix-health-checks"]
+
+    def test_steps_record_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().steps_record_test_durations()
+        assert [step["id"] for step in result][-3:] == [
+            "download-test-results",
+            "record-test-durations",
+            "save-test-durations",
+        ]
+
+    def test_step_download_test_results(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_download_test_results()
+        assert result["with"] == {"pattern": "test-results-*", "path": "test-results"}
+
+    def test_step_combine_coverage(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_combine_coverage()
+        assert result["run"] == "uv run coverage combine test-results/*/.coverage"
+
+    def test_step_report_coverage(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_report_coverage()
+        threshold = ProjectTester.I.threshold()
+        assert f"coverage report --fail-under={threshold}" in result["run"]
+
+    def test_step_record_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_record_test_durations()
+        assert result["run"] == (
+            "uv run pyrig record-test-durations test-results/*/.pytest_cache/junit.xml"
+        )
+
+    def test_step_save_test_durations(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().step_save_test_durations()
+        assert result["uses"] == "actions/cache/save@main"
+        assert result["with"] == {
+            "path": ".pytest_cache/durations.json",
+            "key": "test-durations-${{ github.run_id }}",
+        }
+
+    def test_test_results_artifact_prefix(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().test_results_artifact_prefix()
+        assert result == "test-results-"
+
+    def test_test_results_dir(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        assert my_test_health_check_workflow().test_results_dir() == "test-results"
+
+    def test_durations_cache_prefix(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().durations_cache_prefix()
+        assert result == "test-durations-"
+
+    def test_durations_cache_key(
+        self,
+        my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+    ) -> None:
+        """Test method."""
+        result = my_test_health_check_workflow().durations_cache_key()
+        assert result == "test-durations-${{ github.run_id }}"
 
     def test_steps_aggregate_jobs(
         self,
@@ -102,11 +448,21 @@ def test_steps_aggregate_jobs(
     def test_step_run_tests(
         self,
         my_test_health_check_workflow: type[HealthCheckWorkflowConfigFile],
+        mocker: MockerFixture,
     ) -> None:
         """Test method."""
         step = my_test_health_check_workflow().step_run_tests()
         assert "run" in step
         assert "env" not in step
+        assert "--junit-xml" not in step["run"]
+
+        mocker.patch.object(
+            my_test_health_check_workflow,
+            HealthCheckWorkflowConfigFile.canary.__name__,
+            return_value=True,
+        )
+        step = my_test_health_check_workflow().step_run_tests()
+        assert "--junit-xml=.pytest_cache/junit.xml" in step["run"]
 
     def test_step_run_version_control_hooks(
         self,
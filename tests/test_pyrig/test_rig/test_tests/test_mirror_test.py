@@ -7,9 +7,14 @@
 from types import ModuleType
 
 import pytest
-from pyrig_runtime.core.introspection.inspection import obj_members
 
+from pyrig.core.introspection.definitions import (
+    class_defs,
+    function_defs,
+    parse_source,
+)
 from pyrig.core.introspection.modules import reimport_module
+from pyrig.core.introspection.paths import module_file_path
 from pyrig.rig import tests
 from pyrig.rig.tests import mirror_test
 from pyrig.rig.tests.mirror_test import MirrorTestConfigFile
@@ -77,22 +82,14 @@ def mirror_module(self) -> ModuleType:
 class TestMirrorTestConfigFile:
     """Test class for MirrorTestConfigFile."""
 
-    def test_modules_and_members(
+    def test_source_tree(
         self,
         my_test_mirror_test_config_file: type[MirrorTestConfigFile],
-        create_module: Callable[[Path], ModuleType],
-        tmp_path: Path,
     ) -> None:
         """Test method."""
-        with chdir(tmp_path):
-            create_module(my_test_mirror_test_config_file().test_path())
-            module, test_module, module_members, test_module_members = (
-                my_test_mirror_test_config_file().modules_and_members()
-            )
-            assert module.__name__ == MIRROR_MODULE_NAME
-            assert test_module.__name__ == TESTS_MIRROR_MODULE_NAME
-            assert len(module_members) > 0
-            assert len(test_module_members) > 0
+        tree = my_test_mirror_test_config_file().source_tree()
+        assert [c.name for c in class_defs(tree)] == ["MirrorClass"]
+        assert [f.name for f in function_defs(tree)] == ["mirror_function"]
 
     def test_package_root(
         self,
@@ -154,7 +151,7 @@ def test_test_func_name(
         """Test method."""
         assert (
             my_test_mirror_test_config_file().test_func_name(
-                MirrorTestConfigFile.L.test_func_name,
+                MirrorTestConfigFile.L.test_func_name.__name__,
             )
             == self.test_test_func_name.__name__
         )
@@ -165,7 +162,9 @@ def test_test_cls_name(
     ) -> None:
         """Test method."""
         assert (
-            my_test_mirror_test_config_file().test_cls_name(MirrorTestConfigFile)
+            my_test_mirror_test_config_file().test_cls_name(
+                MirrorTestConfigFile.__name__,
+            )
             == "TestMirrorTestConfigFile"
         )
 
@@ -177,15 +176,42 @@ def test_test_module_docstring(
         docstring = my_test_mirror_test_config_file().test_module_docstring()
         assert isinstance(docstring, str)
 
+    def test_fingerprint(
+        self,
+        my_test_mirror_test_config_file: type[MirrorTestConfigFile],
+        tmp_path: Path,
+    ) -> None:
+        """Test method."""
+        with chdir(tmp_path):
+            config = my_test_mirror_test_config_file()
+            config.create_file()
+            fingerprint = config.fingerprint()
+            assert fingerprint == config.fingerprint()
+
+            # a changed source module invalidates the fingerprint
+            source_path = module_file_path(config.mirror_module())
+            source_content = source_path.read_text()
+            source_path.write_text(source_content + "\n")
+            assert config.fingerprint() != fingerprint
+            source_path.write_text(source_content)
+            assert config.fingerprint() == fingerprint
+
+            # a valid test file is skipped until either file changes
+            assert not config.validate()
+            assert config.validate()
+            assert config.fingerprint_is_current()
+            config.write_content(config.read_content() + "\n")
+            assert not config.fingerprint_is_current()
+
     def test_create_file(
         self,
         my_test_mirror_test_config_file: type[MirrorTestConfigFile],
     ) -> None:
         """Test method."""
-        # create the file and check it exists
-        my_test_mirror_test_config_file().create_file()
-        test_module_name = my_test_mirror_test_config_file().test_module_name()
-        assert test_module_name in sys.modules
+        config = my_test_mirror_test_config_file()
+        config.create_file()
+        assert config.read_content() == config.test_module_docstring()
+        assert config.test_module_name() not in sys.modules
 
     def test_test_func_prefix(
         self,
@@ -266,11 +292,25 @@ def test_content(
             assert "def test_mirror_function" in content
             assert "class TestMirrorClass" in content
 
-    def test_is_correct(self) -> None:
+    def test_missing_paths(
+        self,
+        my_test_mirror_test_config_file: type[MirrorTestConfigFile],
+        tmp_path: Path,
+        create_module: Callable[[Path], ModuleType],
+    ) -> None:
         """Test method."""
         subclass = MirrorTestConfigFile.generate_subclass(mirror_test)
+        assert subclass().missing_paths() == []
         assert subclass().is_correct()
 
+        with chdir(tmp_path):
+            create_module(my_test_mirror_test_config_file().test_path())
+            missing_paths = my_test_mirror_test_config_file().missing_paths()
+        assert missing_paths == [
+            "test_mirror_function",
+            "TestMirrorClass.test_mirror_method",
+        ]
+
     def test_test_path(
         self,
         my_test_mirror_test_config_file: type[MirrorTestConfigFile],
@@ -318,9 +358,10 @@ def test_test_module_content_with_func_skeletons(
         # create the file first
         with chdir(tmp_path):
             create_module(my_test_mirror_test_config_file().test_path())
-            content = my_test_mirror_test_config_file().test_module_content_with_func_skeletons(  # noqa: E501
-                my_test_mirror_test_config_file().test_module_content_with_skeletons(),
-                *my_test_mirror_test_config_file().modules_and_members(),
+            config = my_test_mirror_test_config_file()
+            content = config.test_module_content_with_func_skeletons(
+                config.test_module_content_with_skeletons(),
+                config.source_tree(),
             )
             assert "def test_mirror_method" in content
             assert "def test_mirror_function" in content
@@ -336,12 +377,14 @@ def test_untested_func_names(
         # create the file first
         with chdir(tmp_path):
             create_module(my_test_mirror_test_config_file().test_path())
+            config = my_test_mirror_test_config_file()
             untested_func_names = tuple(
-                my_test_mirror_test_config_file().untested_func_names(
-                    *my_test_mirror_test_config_file().modules_and_members(),
+                config.untested_func_names(
+                    config.source_tree(),
+                    parse_source(config.read_content()),
                 ),
             )
-        assert len(untested_func_names) > 0
+        assert untested_func_names == ("test_mirror_function",)
 
     def test_test_func_skeleton(
         self,
@@ -363,9 +406,10 @@ def test_test_module_content_with_class_skeletons(
 
         with chdir(tmp_path):
             create_module(my_test_mirror_test_config_file().test_path())
-            content = my_test_mirror_test_config_file().test_module_content_with_class_skeletons(  # noqa: E501
-                my_test_mirror_test_config_file().test_module_content_with_skeletons(),
-                *my_test_mirror_test_config_file().modules_and_members(),
+            config = my_test_mirror_test_config_file()
+            content = config.test_module_content_with_class_skeletons(
+                config.test_module_content_with_skeletons(),
+                config.source_tree(),
             )
         assert "def test_mirror_method" in content
         assert "def test_mirror_function" in content
@@ -424,10 +468,7 @@ def test_bar(self) -> None:
             config = MirrorTestConfigFile.generate_subclass(source_module)()
             result = config.test_module_content_with_class_skeletons(
                 test_path.read_text(),
-                module=source_module,
-                test_module=test_module,
-                module_members=tuple(obj_members(source_module)),
-                test_module_members=tuple(obj_members(test_module)),
+                config.source_tree(),
             )
 
         assert result.count("class TestFoo:") == 1
@@ -497,10 +538,7 @@ def test_existing_b(self) -> None:
             config = MirrorTestConfigFile.generate_subclass(source_module)()
             result = config.test_module_content_with_class_skeletons(
                 test_path.read_text(),
-                module=source_module,
-                test_module=test_module,
-                module_members=tuple(obj_members(source_module)),
-                test_module_members=tuple(obj_members(test_module)),
+                config.source_tree(),
             )
 
         assert result.count("class TestAlpha:") == 1
@@ -525,8 +563,8 @@ def test_test_module_content_with_class_skeletons_no_trailing_newline(
         """Test method.
 
         Regression test: when the existing test class is the last thing in a
-        file that itself has no trailing newline, `inspect.getsource()` still
-        returns text ending in a newline, which must not prevent the new
+        file that itself has no trailing newline, the class ends on a line
+        without a line break, which must not prevent the new
         method from being inserted.
         """
         source_path = Path("no_trailing_newline_case/source_module.py")
@@ -564,10 +602,7 @@ def test_existing(self) -> None:
             config = MirrorTestConfigFile.generate_subclass(source_module)()
             result = config.test_module_content_with_class_skeletons(
                 no_trailing_newline_content,
-                module=source_module,
-                test_module=test_module,
-                module_members=tuple(obj_members(source_module)),
-                test_module_members=tuple(obj_members(test_module)),
+                config.source_tree(),
             )
 
         assert result.count("class TestGamma:") == 1
@@ -590,14 +625,30 @@ def test_untested_class_and_method_names(
         # create the file first
         with chdir(tmp_path):
             create_module(my_test_mirror_test_config_file().test_path())
+            config = my_test_mirror_test_config_file()
             untested_class_and_method_names = tuple(
-                my_test_mirror_test_config_file().untested_class_and_method_names(
-                    *my_test_mirror_test_config_file().modules_and_members(),
+                config.untested_class_and_method_names(
+                    config.source_tree(),
+                    parse_source(config.read_content()),
                 ),
             )
         assert len(untested_class_and_method_names) > 0
         # the test module was just created empty, so no test class exists yet
-        assert all(source is None for _, _, source in untested_class_and_method_names)
+        assert all(
+            end_line is None for _, _, end_line in untested_class_and_method_names
+        )
+
+        test_tree = parse_source('''
+class TestMirrorClass:
+    """Test class."""
+''')
+        ((name, methods, end_line),) = config.untested_class_and_method_names(
+            config.source_tree(),
+            test_tree,
+        )
+        assert name == "TestMirrorClass"
+        assert list(methods) == ["test_mirror_method"]
+        assert end_line == 3  # noqa: PLR2004
 
     def test_test_class_skeleton(
         self,
@@ -1,5 +1,7 @@
 """Tests module."""
 
+from pathlib import Path
+
 from pytest_mock import MockerFixture
 
 from pyrig.rig import tools
@@ -62,6 +64,15 @@ def test_discovery_module(self) -> None:
         result = Tool.discovery_module()
         assert result == tools
 
+    def test_subclasses(self) -> None:
+        """Test method."""
+        result = set(Tool.subclasses())
+        assert {PackageManager, ProjectTester} <= result
+
+    def test_registry_dir(self) -> None:
+        """Test method."""
+        assert Tool.registry_dir() == Path(".pyrig_cache/registry")
+
     def test_group(self) -> None:
         """Test method."""
         result = PackageManager.I.group()
@@ -104,6 +104,16 @@ def test_run_args(self) -> None:
         result = PackageManager.I.run_args("pytest")
         assert result == ("uv", "run", "pytest")
 
+    def test_add_group_dev_without_syncing_args(self) -> None:
+        """Test method."""
+        result = PackageManager.I.add_group_dev_without_syncing_args("pytest")
+        assert result == ("uv", "add", "--group=dev", "--no-sync", "pytest")
+
+    def test_add_without_syncing_args(self) -> None:
+        """Test method."""
+        result = PackageManager.I.add_without_syncing_args("requests")
+        assert result == ("uv", "add", "--no-sync", "requests")
+
     def test_add_group_dev_args(self) -> None:
         """Test method."""
         result = PackageManager.I.add_group_dev_args("pytest", "ruff")
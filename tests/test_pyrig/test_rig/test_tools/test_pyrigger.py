@@ -23,6 +23,14 @@ def test_runtime_dependency(self) -> None:
         """Test method."""
         assert Pyrigger.I.runtime_dependency() == "pyrig-runtime"
 
+    def test_version_control_ignore_patterns(self) -> None:
+        """Test method."""
+        assert Pyrigger().version_control_ignore_patterns() == (".pyrig_cache/",)
+
+    def test_cache_dir(self) -> None:
+        """Test method."""
+        assert Pyrigger().cache_dir() == Path(".pyrig_cache")
+
     def test_group_cmd_args(self) -> None:
         """Test method."""
         result = Pyrigger.I.group_cmd_args(group="mk", cmd=inits)
@@ -58,7 +66,12 @@ def test_init_project(self, mocker: MockerFixture, tmp_path: Path) -> None:
             Pyrigger.I.init_project()
 
         with chdir(tmp_path):
-            run_mock = mocker.patch.object(Args, Args.run.__name__, return_value=None)
+            run_mock = mocker.patch.object(
+                Args,
+                Args.run_streaming.__name__,
+                autospec=True,
+                side_effect=lambda _self, *_args, on_line, **_kwargs: on_line("out\n"),
+            )
             has_commits_mock = mocker.patch.object(
                 VersionController,
                 VersionController.has_commits.__name__,
@@ -69,6 +82,15 @@ def test_init_project(self, mocker: MockerFixture, tmp_path: Path) -> None:
             # assert was called as many times as there are steps in setup_steps
             assert run_mock.call_count == len(Pyrigger.I.setup_steps())
 
+    def test_setup_output_label(self) -> None:
+        """Test method."""
+        assert Pyrigger.I.setup_output_label("Resolved 3 packages\n") == (
+            "Initializing project: Resolved 3 packages"
+        )
+        label = Pyrigger.I.setup_output_label("x " * 100)
+        assert label.endswith("[...]")
+        assert len(label) <= len("Initializing project: ") + 60
+
     def test_group(self) -> None:
         """Test method."""
         result = Pyrigger.I.group()
@@ -78,6 +78,74 @@ def test_group(self) -> None:
         assert isinstance(result, str)
         assert result == "project-status"
 
+    def test_shards(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.shards() == 1
+
+    def test_durations_path(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.durations_path() == Path(".pytest_cache/durations.json")
+
+    def test_junit_report_path(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.junit_report_path() == Path(".pytest_cache/junit.xml")
+
+    def test_junit_test_args(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.junit_test_args("tests/test_a.py") == (
+            "pytest",
+            "--junit-xml=.pytest_cache/junit.xml",
+            "--override-ini=junit_family=xunit1",
+            "tests/test_a.py",
+        )
+
+    def test_shard_test_args(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.shard_test_args("tests/test_a.py") == (
+            "pytest",
+            "--junit-xml=.pytest_cache/junit.xml",
+            "--override-ini=junit_family=xunit1",
+            "--cov-fail-under=0",
+            "tests/test_a.py",
+        )
+
+    def test_quick_tests_seconds(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.quick_tests_seconds() == 60  # noqa: PLR2004
+
+    def test_quick_test_args(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.quick_test_args("tests/test_a.py") == (
+            "pytest",
+            "--exitfirst",
+            "--failed-first",
+            "--cov-fail-under=0",
+            "tests/test_a.py",
+        )
+
+    def test_timeout_minutes(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.timeout_minutes(0) == 10  # noqa: PLR2004
+        assert ProjectTester.I.timeout_minutes(61) == 13  # noqa: PLR2004
+
+    def test_coverage_data_path(self) -> None:
+        """Test method."""
+        assert ProjectTester.I.coverage_data_path() == Path(".coverage")
+
+    def test_combine_coverage_args(self) -> None:
+        """Test method."""
+        result = ProjectTester.I.combine_coverage_args("a/.coverage")
+        assert result == ("coverage", "combine", "a/.coverage")
+
+    def test_report_coverage_args(self) -> None:
+        """Test method."""
+        result = ProjectTester.I.report_coverage_args()
+        assert result[:3] == (
+            "coverage",
+            "report",
+            f"--fail-under={ProjectTester.I.threshold()}",
+        )
+
     def test_test_args(self) -> None:
         """Test method."""
         result = ProjectTester.I.test_args()
@@ -1,11 +1,13 @@
 """module."""
 
+import os
 from contextlib import chdir
 from pathlib import Path
 
 from pytest_mock import MockerFixture
 
 from pyrig.core.subprocesses import Args, run_subprocess_cached
+from pyrig.rig.tools.pyrigger import Pyrigger
 from pyrig.rig.tools.version_control.controller import VersionController
 from pyrig.rig.tools.version_control.remote.controller import RemoteVersionController
 
@@ -101,7 +103,7 @@ def test_email(self, mocker: MockerFixture) -> None:
 
         run_mock = mocker.patch.object(
             Args,
-            Args.run_cached.__name__,
+            Args.run_persisted.__name__,
             return_value=mocker.Mock(stdout="some.email@here.com\n"),
         )
         result = VersionController.I.email()
@@ -207,7 +209,7 @@ def test_username(self, mocker: MockerFixture) -> None:
         """Test method."""
         run_mock = mocker.patch.object(
             Args,
-            Args.run_cached.__name__,
+            Args.run_persisted.__name__,
             return_value=mocker.Mock(stdout="Some User\n"),
         )
         result = VersionController.I.username()
@@ -218,7 +220,7 @@ def test_normalized_username(self, mocker: MockerFixture) -> None:
         """Test method."""
         mock_run = mocker.patch.object(
             Args,
-            Args.run_cached.__name__,
+            Args.run_persisted.__name__,
             return_value=mocker.Mock(stdout="Winipedia\n"),
         )
 
@@ -251,3 +253,66 @@ def test_rev_parse_args(self) -> None:
         """Test method."""
         result = VersionController.I.rev_parse_args("some-commit-hash")
         assert result == ("git", "rev-parse", "some-commit-hash")
+
+    def test_changed_files(self, tmp_path: Path) -> None:
+        """Test method."""
+        with chdir(tmp_path):
+            VersionController.I.init_args().run()
+            assert VersionController.I.changed_files() == []
+
+            Path("tracked.txt").write_text("tracked")
+            Path("old name.txt").write_text("renamed")
+            VersionController.I.add_all_args().run()
+            VersionController.I.args(
+                "-c",
+                "user.name=test",
+                "-c",
+                "user.email=test@example.com",
+                *VersionController.I.commit_with_msg_args(msg="init")[1:],
+            ).run()
+            Path("tracked.txt").write_text("modified")
+            Path("untracked.txt").write_text("untracked")
+            VersionController.I.args("mv", "old name.txt", "new name.txt").run()
+
+            assert set(VersionController.I.changed_files()) == {
+                Path("tracked.txt"),
+                Path("new name.txt"),
+                Path("old name.txt"),
+                Path("untracked.txt"),
+            }
+
+    def test_status_porcelain_args(self) -> None:
+        """Test method."""
+        result = VersionController.I.status_porcelain_args("-z")
+        assert result == ("git", "status", "--porcelain", "-z")
+
+    def test_status_args(self) -> None:
+        """Test method."""
+        result = VersionController.I.status_args("--short")
+        assert result == ("git", "status", "--short")
+
+    def test_run_config_query(self, tmp_path: Path) -> None:
+        """Test method."""
+        with chdir(tmp_path):
+            VersionController.I.init_args().run()
+            args = VersionController.I.config_get_args("pyrig.test")
+            assert VersionController.I.run_config_query(args, check=False).stdout == ""
+
+            # a changed config invalidates the persisted result
+            VersionController.I.config_args("pyrig.test", "value").run()
+            result = VersionController.I.run_config_query(args)
+            assert result.stdout == "value\n"
+            assert list((Pyrigger.I.cache_dir() / "runs").glob("*.json"))
+
+    def test_config_files(self, mocker: MockerFixture) -> None:
+        """Test method."""
+        mocker.patch.dict(
+            os.environ,
+            {"XDG_CONFIG_HOME": "/xdg", "GIT_CONFIG_GLOBAL": "/global"},
+        )
+        assert VersionController.I.config_files() == (
+            Path(".git/config"),
+            Path("/global"),
+            Path("/xdg/git/config"),
+            Path("/etc/gitconfig"),
+        )